@@ -1,8 +1,157 @@
+import argparse
+import os
+from typing import List
+
 from . import RepositoryDirectory
 
+def jobs_argument(value:str)->str:
+    """
+    Validate the value of `--jobs`: either a positive integer, or `auto`.
+    """
+    if (value.lower() == "auto"):
+        return "auto"
+
+    try:
+        _jobs = int(value)
+    except ValueError as e:
+        _jobs = 0
+
+    if (_jobs < 1):
+        raise argparse.ArgumentTypeError(f"expected a positive integer or 'auto'; {repr(value)} found.")
+
+    return _jobs
+
+def parser()->argparse.ArgumentParser:
+    """
+    Build the command line interface of `python -m readme_compiler`.
+    """
+    _parser = argparse.ArgumentParser(
+        prog        = "python -m readme_compiler",
+        description = "Compile all the README files in the git repository of the current directory.",
+    )
+
+    _parser.add_argument(
+        "paths",
+        nargs   = "*",
+        metavar = "PATH",
+        help    = "only compile the sources depending on these changed files.",
+    )
+
+    _parser.add_argument(
+        "--jobs", "-j",
+        type    = jobs_argument,
+        default = 1,
+        metavar = "N|auto",
+        help    = "number of worker processes to render with; 'auto' uses one per CPU. (default: 1)",
+    )
+
+    _parser.add_argument(
+        "--force", "-f",
+        action  = "store_true",
+        help    = "render all files, even if their inputs had not changed since the last compile.",
+    )
+
+    _parser.add_argument(
+        "--git-index",
+        action  = "store_true",
+        default = None,
+        help    = "discover Markdown files from the git index instead of scanning the file system.",
+    )
+
+    _parser.add_argument(
+        "--no-bootstrap",
+        action  = "store_true",
+        help    = "do not copy rendered files into missing source locations before compiling.",
+    )
+
+    _parser.add_argument(
+        "--clear-format-cache",
+        action  = "store_true",
+        help    = "forget all source code formatted by previous runs before compiling.",
+    )
+
+    _parser.add_argument(
+        "--describe-backend",
+        choices = ("import", "static"),
+        default = None,
+        help    = "how {% describe %} finds the objects it describes, unless the tag says otherwise: 'import' imports them; 'static' reads them from their source code without importing anything. (default: settings.DESCRIBE_BACKEND)",
+    )
+
+    _parser.add_argument(
+        "--graph",
+        default = None,
+        metavar = "PATH",
+        help    = "export the dependency graph of the rendered files to PATH after compiling; as DOT if PATH ends with .dot or .gv, or JSON otherwise.",
+    )
+
+    _parser.add_argument(
+        "--watch", "-w",
+        action  = "store_true",
+        help    = "keep running, and recompile the files affected whenever their sources, fragments, templates or described modules change.",
+    )
+
+    _parser.add_argument(
+        "--poll",
+        action  = "store_true",
+        help    = "with --watch, poll for changes instead of using inotify.",
+    )
+
+    _parser.add_argument(
+        "--daemon",
+        action  = "store_true",
+        help    = "instead of compiling, serve compile requests from python -m readme_compiler_client over a unix socket.",
+    )
+
+    _parser.add_argument(
+        "--socket",
+        default = None,
+        metavar = "PATH",
+        help    = "with --daemon, the socket to listen on. (default: $README_COMPILER_SOCKET, or a per-user socket in $XDG_RUNTIME_DIR or the temporary directory)",
+    )
+
+    _parser.add_argument(
+        "--root",
+        action  = "append",
+        default = None,
+        metavar = "PATH",
+        dest    = "roots",
+        help    = "with --daemon, only compile the repositories inside PATH; can be repeated. (default: the current directory)",
+    )
+
+    return _parser
+
 # If this is run with -m, compile the current directory
-def __main__():
-    RepositoryDirectory("./").compile()
+def __main__(argv:List[str]=None):
+    _args = parser().parse_args(argv)
+
+    if (_args.daemon):
+        from .daemon import serve
+
+        return serve(_args.socket, roots=_args.roots)
+
+    if (_args.clear_format_cache):
+        from .format import clear_cache
+
+        clear_cache()
+
+    _repository = RepositoryDirectory("./", describe_backend=_args.describe_backend)
+
+    if (_args.watch):
+        _repository.watch(
+            jobs        = _args.jobs,
+            polling     = _args.poll,
+        )
+    else:
+        _repository.compile(
+            jobs            = _args.jobs,
+            incremental     = not _args.force,
+            use_git_index   = _args.git_index,
+            bootstrap       = not _args.no_bootstrap,
+            changed         = [ os.path.abspath(_path) for _path in _args.paths ] if (_args.paths) else None,
+        )
+
+    if (_args.graph):
+        _repository.dependencies.export(_args.graph)
 
 if (__name__ == "__main__"):
-    __main__()
\ No newline at end of file
+    __main__()
@@ -29,11 +29,51 @@ def is_markdown(filename:str)->bool:
     
     return False
 
-def split_abspath(path:str)->SimpleNamespace:
+def resolve_path(
+    path:str,
+    *,
+    cwd:str = None,
+)->str:
+    """
+    Resolve a relative `path` against `cwd` instead of the working directory of the process.
+
+    If `cwd` is not provided, `path` is returned unchanged.
+    """
+    if (cwd):
+        path = os.path.normpath(os.path.join(cwd, path))
+
+    return path
+
+def ancestors(
+    path:str,
+    root:str,
+)->List[str]:
+    """
+    Return all the directories containing `path`, up to but excluding `root`, innermost first.
+    """
+    _ancestors = []
+    _directory = os.path.dirname(path)
+
+    while (len(_directory) > len(root) and _directory.startswith(root)):
+        _ancestors.append(_directory)
+        _directory = os.path.dirname(_directory)
+
+    return _ancestors
+
+def split_abspath(
+    path:str,
+    *,
+    cwd:str = None,
+    is_dir:bool = None,
+)->SimpleNamespace:
     """
     Fully split a path down into elements.
+
+    If `is_dir` is not provided, the file system is checked to see if `path` is a directory.
     """
-    if (os.path.isdir(path)):
+    path = resolve_path(path, cwd=cwd)
+
+    if (os.path.isdir(path) if (is_dir is None) else is_dir):
         _dir, _file = path, None
     else:
         _dir, _file = os.path.split(path)
@@ -53,18 +93,49 @@ def parse_markdown_path(
     rendered_folder:str = settings.README_RENDERED_DIRECTORY,
     source_index:str    = settings.README_SOURCE_INDEX,
     source_folder:str   = settings.README_SOURCE_DIRECTORY,
+    cwd:str             = None,
 )->SimpleNamespace:
     """
     Figure out what the path is, and how we should deal with it.
+
+    Relative paths are resolved against `cwd` if provided, or the working directory of the process otherwise.
+    """
+    path = resolve_path(path, cwd=cwd)
+
+    return classify_markdown_path(
+        path,
+        is_dir          = os.path.isdir(path),
+        rendered_index  = rendered_index,
+        rendered_folder = rendered_folder,
+        source_index    = source_index,
+        source_folder   = source_folder,
+    )
+
+def classify_markdown_path(
+    path:str,
+    *,
+    is_dir:bool         = False,
+    rendered_index:str  = settings.README_RENDERED_INDEX,
+    rendered_folder:str = settings.README_RENDERED_DIRECTORY,
+    source_index:str    = settings.README_SOURCE_INDEX,
+    source_folder:str   = settings.README_SOURCE_DIRECTORY,
+    cwd:str             = None,
+)->SimpleNamespace:
+    """
+    Pure version of `parse_markdown_path()`: classify `path` by its name alone, without touching the file system.
+
+    `is_dir` states whether `path` is a directory.
     """
     _mode = None
 
+    path = resolve_path(path, cwd=cwd)
+
     print (f"Analysing {repr(path)}.")
     
-    if (os.path.isdir(path)):
+    if (is_dir):
         print (f"{repr(path)} is a directory.")
 
-        if (split_abspath(path).dir[-1] == source_folder):
+        if (split_abspath(path, is_dir=is_dir).dir[-1] == source_folder):
             # This is a ./GITDIR/.readme.source folder
             print (f"{repr(path)} appears to be a source readme folder.")
 
@@ -75,7 +146,7 @@ def parse_markdown_path(
             )
             _mode               = MarkdownTemplateMode.BRANCH
             
-        elif (split_abspath(path).dir[-1] == rendered_folder):
+        elif (split_abspath(path, is_dir=is_dir).dir[-1] == rendered_folder):
             # This is a ./GITDIR/.readme folder
             print (f"{repr(path)} appears to be a rendered readme folder.")
 
@@ -97,7 +168,7 @@ def parse_markdown_path(
     else:
         print (f"{repr(path)} is NOT a directory.")
 
-        if (source_folder == split_abspath(path).dir[-1]):
+        if (source_folder == split_abspath(path, is_dir=is_dir).dir[-1]):
             # This is a ./GITDIR/.readme.source/somefile.md
             print (f"{repr(path)} appears to be a template in source readme folder.")
 
@@ -105,7 +176,7 @@ def parse_markdown_path(
             _rendered_path      = path.replace(source_folder, rendered_folder)
             _mode               = MarkdownTemplateMode.LEAF
             
-        elif (rendered_folder == split_abspath(path).dir[-1]):
+        elif (rendered_folder == split_abspath(path, is_dir=is_dir).dir[-1]):
             # This is a ./GITDIR/.readme/somefile.md
             print (f"{repr(path)} appears to be a template in rendered readme folder.")
 
@@ -113,7 +184,7 @@ def parse_markdown_path(
             _rendered_path      = path
             _mode               = MarkdownTemplateMode.LEAF
 
-        elif (rendered_index == split_abspath(path).file):
+        elif (rendered_index == split_abspath(path, is_dir=is_dir).file):
             # This is a ./GITDIR/README.md
             print (f"{repr(path)} is an absolute path to a {rendered_index}.")
 
@@ -121,7 +192,7 @@ def parse_markdown_path(
             _rendered_path      = path
             _mode               = MarkdownTemplateMode.INDEX
 
-        elif (source_index == split_abspath(path).file):
+        elif (source_index == split_abspath(path, is_dir=is_dir).file):
             # This is a ./GITDIR/.README.source.md
             print (f"{repr(path)} is an absolute path to a {source_index}.")
 
@@ -151,10 +222,14 @@ def prepare_markdown_path(
     rendered_folder:str = settings.README_RENDERED_DIRECTORY,
     source_index:str    = settings.README_SOURCE_INDEX,
     source_folder:str   = settings.README_SOURCE_DIRECTORY,
+    cwd:str             = None,
 )->SimpleNamespace:
     """
     If source doesn't exist but rendered does, copy rendered to source.
+
+    Relative paths are resolved against `cwd` if provided, or the working directory of the process otherwise.
     """
+    path = resolve_path(path, cwd=cwd)
 
     _parsed = parse_markdown_path(
         path=path,
@@ -166,6 +241,25 @@ def prepare_markdown_path(
 
     print (f"{repr(path)} parsed to {repr(_parsed)}.")
 
+    return bootstrap_markdown_path(
+        _parsed,
+        rendered_folder=rendered_folder,
+        source_folder=source_folder,
+    )
+
+def bootstrap_markdown_path(
+    parsed:SimpleNamespace,
+    *,
+    rendered_folder:str = settings.README_RENDERED_DIRECTORY,
+    source_folder:str   = settings.README_SOURCE_DIRECTORY,
+)->SimpleNamespace:
+    """
+    Side effects of `prepare_markdown_path()` on an already parsed path:
+    make sure the parent directories exist, and if the source doesn't exist but the rendered does, copy rendered to source.
+    """
+    _parsed = parsed
+    path = _parsed.source
+
     _mode = _parsed.mode
     _source_path = _parsed.source
     _rendered_path = _parsed.rendered
@@ -1,12 +1,18 @@
 import os, sys
 
+import concurrent.futures
 import contextvars
+import dataclasses
+import copy
 from datetime import datetime
 import enum
 import functools
-import random
+import hashlib
+import importlib
+import locale
+import threading
 from types import SimpleNamespace
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
 
 from django.template import Context as  DjangoContext, \
                             Engine as DjangoEngine, \
@@ -16,15 +22,26 @@ from django.template import Context as  DjangoContext, \
 from ..django_setup import register
 
 from .. import bin
+from .. import dependencies
+from .. import describe
 from .. import settings
 from .. import stdout
 from ..settings.enums import MarkdownTemplateMode, \
                              RenderPurpose
 
 from ..log import logger
-from .cwd import WorkingDirectory
+from .cwd import WorkingDirectory  # Not used internally anymore, but kept as part of the API
+from .manifest import BuildManifest, \
+                      library_fingerprint
 from .properties import GitProperties
 from .repopath import RepositoryPath
+from .results import RenderResult
+from .sourceindex import SourceIndex
+from .templatecache import TemplateCache, \
+                           TemplateStore, \
+                           library_digest
+from . import gitreader
+from . import walker
 from .transformers import   transformers, \
                             Transformer, \
                             TransformerMeta, \
@@ -46,9 +63,13 @@ class RepositoryDirectory():
         source_index:str                = settings.README_SOURCE_INDEX,
         source_folder:str               = settings.README_SOURCE_DIRECTORY,
         template_folder:str             = settings.TEMPLATE_LOCATION,
+        describe_backend:str            = None,
     ) -> None:
         """
         Initialise a `RepositoryDirectory` at the given location.
+
+        `describe_backend` is the default backend of the `{% describe %}` tags in this repository,
+        `"import"` or `"static"`; it defaults to `settings.DESCRIBE_BACKEND`.
         """
         if (os.path.isdir(path)):
             path = os.path.abspath(path)
@@ -69,12 +90,44 @@ class RepositoryDirectory():
                     rendered    = rendered_folder,
                 ),
                 template = template_folder,
-            )
+            ),
+            describe_backend = describe_backend or settings.DESCRIBE_BACKEND,
         )
 
         self.repopath   =   RepositoryPath(repository=self)
         self.git        =   GitProperties.from_path(path=self.path, parent=self)
 
+        # If this is a list, `render()` will collect `RenderResult`s into it instead of staging and reporting them.
+        # `compile()` uses this to stage all files in one go at the end;
+        # compile workers use it to hand the results back to the parent process.
+        self.results:Optional[List[RenderResult]] = None
+
+        # `render()` can be called from multiple threads:
+        # concluding is serialised, so that `git add`s do not collide on the index lock,
+        # and concurrent renders of the same path wait for the first one instead of rendering it again.
+        self._conclude_lock = threading.RLock()
+        self._render_locks:Dict[Tuple[str, RenderPurpose, bool], threading.RLock] = {}
+        self._render_locks_lock = threading.Lock()
+
+        # Files read by the most recent render of each path.
+        # `render()` is cached; these are replayed to the `DependencyRecorder` of the caller whenever the cache is hit.
+        # Sources skipped by an incremental `compile()` are filled in from the build manifest.
+        self.dependencies = dependencies.DependencyGraph(root=self.git.path)
+
+        # Loaded by `compile()` if incremental compilation is requested.
+        self.manifest:Optional[BuildManifest] = None
+
+        # Loaded by `compile()`; if set, directories that had not changed since the last run are not scanned again.
+        self.source_index:Optional[SourceIndex] = None
+
+        # One template engine for all templates of this repository, and the templates it had compiled.
+        self.engine     =   create_engine()
+        self.templates  =   TemplateCache(
+            store = TemplateStore(self.state_path(settings.TEMPLATE_STORE_LOCATION)) \
+                        if (settings.TEMPLATE_STORE_LOCATION) \
+                            else None,
+        )
+
         # If the transformers had not initialised, __init__() it with self as respository.
         self.transformers = list(map(
             lambda transformer: transformer(self) \
@@ -94,9 +147,54 @@ class RepositoryDirectory():
                     ('source_index', self.settings.paths.index.source),\
                     ('source_folder', self.settings.paths.folder.source),\
                     ('template_folder', self.settings.paths.template),\
+                    ('describe_backend', self.settings.describe_backend),\
                 )]) + \
             ")"
 
+    def __reduce__(self)->Tuple[Callable, Tuple[Any]]:
+        """
+        Pickle the `RepositoryDirectory` by its constructor arguments, so that it can be sent to worker processes.
+
+        Transformers bound to this instance are sent as their classes, and will be re-bound on the other side.
+        """
+        return (
+            functools.partial(
+                type(self),
+                self.path,
+                transformers    = [
+                    type(_transformer) if (getattr(_transformer, "repository", None) is self) else _transformer \
+                        for _transformer in self.transformers
+                ],
+                rendered_index  = self.settings.paths.index.rendered,
+                rendered_folder = self.settings.paths.folder.rendered,
+                source_index    = self.settings.paths.index.source,
+                source_folder   = self.settings.paths.folder.source,
+                template_folder = self.settings.paths.template,
+                describe_backend= self.settings.describe_backend,
+            ),
+            (),
+        )
+
+    def state_path(
+        self,
+        path:str,
+    )->str:
+        """
+        Resolve `path` inside the directory where the state of this library about the repository is kept,
+        i.e. `settings.STATE_LOCATION`, or `readme-compiler` in the git directory of the repository by default;
+        so that nothing is left in the work tree for users to ignore.
+        """
+        if (settings.STATE_LOCATION):
+            _directory = self.repopath.abspath(settings.STATE_LOCATION)
+        else:
+            try:
+                # Linked worktrees have git directories of their own, so each branch checked out keeps its own state.
+                _directory = os.path.join(gitreader.resolve_git_dir(self.git.path), "readme-compiler")
+            except (OSError, gitreader.UnsupportedLayout) as e:
+                _directory = os.path.join(self.git.path, ".git", "readme-compiler")
+
+        return os.path.join(_directory, path)
+
     @property
     def path(self)->str:
         """
@@ -121,8 +219,6 @@ class RepositoryDirectory():
             "globals": bin.map_unders(globals()),
         })
 
-    # Cache the output - in case we repeat stuff because of embed etc.
-    @functools.lru_cache()
     def render(
         self,
         path:str                = "./",
@@ -132,56 +228,216 @@ class RepositoryDirectory():
     )->str:
         """
         Render the template using Django Template API.
+
+        Thread safe; a path being rendered by another thread is waited for, and taken from the cache.
         """
-        _template = MarkdownTemplate.from_file(
-            path,
-            rendered_index      = self.settings.paths.index.rendered,
-            rendered_folder     = self.settings.paths.folder.rendered,
-            source_index        = self.settings.paths.index.source,
-            source_folder       = self.settings.paths.folder.source,
+        _key = (os.path.abspath(path), purpose, dry_run)
 
-            transformers        = self.transformers,
-        )
+        with self._render_locks_lock:
+            _lock = self._render_locks.setdefault(_key, threading.RLock())
+
+        with _lock:
+            _rendered = self._render(path, purpose=purpose, dry_run=dry_run)
 
-        # Render the text
-        _rendered = _template.render(self.context(), purpose=purpose)
+        # If this came from the cache, the files it read need to be recorded for our caller again.
+        dependencies.record(*self.dependencies.get(os.path.abspath(path), ()))
+
+        return _rendered
+
+    # Cache the output - in case we repeat stuff because of embed etc.
+    @functools.lru_cache()
+    def _render(
+        self,
+        path:str                = "./",
+        *,
+        purpose:RenderPurpose   = RenderPurpose.STANDARD,
+        dry_run:bool            = False,
+    )->str:
+        """
+        Uncached implementation of `render()`.
+        """
+        with dependencies.DependencyRecorder() as _recorder:
+            _template = MarkdownTemplate.from_file(
+                path,
+                rendered_index      = self.settings.paths.index.rendered,
+                rendered_folder     = self.settings.paths.folder.rendered,
+                source_index        = self.settings.paths.index.source,
+                source_folder       = self.settings.paths.folder.source,
+
+                transformers        = self.transformers,
+                engine              = self.engine,
+                cache               = self.templates,
+            )
+
+            # Render the text
+            _rendered = _template.render(self.context(), purpose=purpose)
+
+        with self._conclude_lock:
+            self.dependencies.add(path, _recorder.files)
+
+        _result = self.save(path, _rendered, dry_run=dry_run)
+        _result.dependencies = sorted(_recorder.files)
+
+        if (self.results is not None):
+            # Deferred - the collector of the results will stage and report it.
+            self.results.append(_result)
+        else:
+            self.conclude(_result)
+
+        return _rendered
+
+    def save(
+        self,
+        path:str,
+        rendered:str,
+        *,
+        dry_run:bool            = False,
+    )->RenderResult:
+        """
+        Save the rendered text of `path` to its rendered location, without adding it to the repository.
+
+        If the file on disk is already identical, it is left untouched, so that its `mtime` stays stable.
+        """
+        _parsed = self.repopath.parse(path)
 
         # Get the destination path
-        _rendered_path = self.repopath.parse(path).rendered
+        _result = RenderResult(
+            path            = path,
+            rendered_path   = _parsed.rendered,
+            size            = len(rendered),
+            dry_run         = dry_run,
+        )
 
         if (not dry_run):
             # If this is not a dry run, save the compiled file to the rendered location.
             try:
-                with open(_rendered_path, "w") as _f:
-                    _f.write(_rendered)
+                # e.g. `.readme` for a leaf in `.readme.source`.
+                os.makedirs(os.path.dirname(_result.rendered_path), exist_ok=True)
 
-                # Add file to repository
-                if (self.git.add(path) and \
-                    self.git.add(_rendered_path)):
-            
-                    logger.info(
-                        " - "+stdout.green("SUCCESS: ")+f"Saved {self.colour_path(path.ljust(120))} at {self.colour_path(_rendered_path)} containing {len(_rendered):,} bytes of data."
-                    )
-                else:
-                    logger.info(
-                        " - "+stdout.yellow("WARNING: ")+f"Saved {self.colour_path(path.ljust(120))} at {self.colour_path(_rendered_path)} containing {len(_rendered):,} bytes of data, but {stdout.red('git add command had failed')}."
-                    )
+                # Same encoding as `open(..., "w")` would have used.
+                _data = rendered.encode(locale.getpreferredencoding(False))
+
+                _result.changed = not self.identical(_result.rendered_path, _data, source=_parsed.source)
+
+                if (_result.changed):
+                    with open(_result.rendered_path, "wb") as _f:
+                        _f.write(_data)
             except (
                 OSError,
                 RuntimeError,
                 PermissionError,
-            ) as e: 
-                logger.error(
-                     " - "+stdout.red("ERROR  : ")+f"Failed to save {self.colour_path(path.ljust(120))} at {self.colour_path(_rendered_path)}: {type(e).__name__} occured: {str(e)}"
-                )
+            ) as e:
+                _result.error = f"{type(e).__name__} occured: {str(e)}"
+
+        return _result
+
+    def identical(
+        self,
+        path:str,
+        data:bytes,
+        *,
+        source:str = None,
+    )->bool:
+        """
+        Check if the file at `path` contains exactly `data`.
+
+        Sizes are compared first; if they match, the digest recorded in the build manifest for `source` is used
+        as long as the file had not been modified since, or the file is read and compared otherwise.
+        """
+        try:
+            _stat = os.stat(path)
+        except (OSError, ) as e:
+            return False
+
+        if (_stat.st_size != len(data)):
+            return False
+
+        _recorded = self.manifest.output(source) if (self.manifest is not None and source) else None
+
+        if (_recorded and _recorded[:2] == [_stat.st_mtime_ns, _stat.st_size]):
+            return hashlib.sha1(data).hexdigest() == _recorded[2]
+
+        with open(path, "rb") as _f:
+            return _f.read() == data
+
+    def stage(
+        self,
+        *results:RenderResult,
+    )->bool:
+        """
+        Add both the source and the rendered file of each `RenderResult` to the repository, with a single `git add`.
+
+        Returns `True` if all of them had been staged.
+        """
+        with self._conclude_lock:
+            _added = self.git.add_all(
+                _path for _result in results for _path in (_result.path, _result.rendered_path)
+            )
+
+        for _result in results:
+            _result.staged = _added[_result.path] and _added[_result.rendered_path]
+
+        return all(_result.staged for _result in results)
+
+    def conclude(
+        self,
+        *results:RenderResult,
+    )->bool:
+        """
+        Stage and report `RenderResult`s, and record them in the dependency graph and the build manifest if one is loaded.
+
+        Results for the same file are only concluded once - shared fragments like `.footer` can be rendered many times.
+
+        Returns `True` if all files were saved without errors.
+        """
+        _results = unique_results(results)
+
+        with self._conclude_lock:
+            for _result in _results:
+                # Results rendered by compile workers have not been recorded here yet.
+                self.dependencies.add(_result.path, _result.dependencies)
+
+            self.stage(*filter(lambda result: result.stageable, _results))
+
+            for _result in _results:
+                self.report(_result)
+
+                if (self.manifest is not None and _result.saved):
+                    self.manifest.update(self.repopath.parse(_result.path).source, _result)
+
+        return all(_result.error is None for _result in _results)
 
+    def report(
+        self,
+        result:RenderResult,
+    )->None:
+        """
+        Log the outcome of a `RenderResult`.
+        """
+        _path           = self.colour_path(result.path.ljust(120))
+        _rendered_path  = self.colour_path(result.rendered_path)
+
+        if (result.error is not None):
+            logger.error(
+                 " - "+stdout.red("ERROR  : ")+f"Failed to save {_path} at {_rendered_path}: {result.error}"
+            )
+        elif (result.changed is False):
+            logger.info(
+                 " - "+stdout.cyan("SKIPPED: ")+f"Rendered {_path} identical to {_rendered_path}; not saved."
+            )
+        elif (result.dry_run):
+            logger.info(
+                " - "+stdout.yellow("DRY RUN: ")+f"Did not save {_path} at {_rendered_path} with {result.size:,} bytes of data."
+            )
+        elif (result.staged is False):
+            logger.info(
+                " - "+stdout.yellow("WARNING: ")+f"Saved {_path} at {_rendered_path} containing {result.size:,} bytes of data, but {stdout.red('git add command had failed')}."
+            )
         else:
             logger.info(
-                " - "+stdout.yellow("DRY RUN: ")+f"Did not save {self.colour_path(path.ljust(120))} at {self.colour_path(_rendered_path)} with {len(_rendered):,} bytes of data."
+                " - "+stdout.green("SUCCESS: ")+f"Saved {_path} at {_rendered_path} containing {result.size:,} bytes of data."
             )
 
-        return _rendered
-
     def template(
         self,
         template:str,
@@ -203,6 +459,8 @@ class RepositoryDirectory():
                 template            = template,
                 transformers        = self.transformers,
                 repopath            = self.repopath,
+                engine              = self.engine,
+                cache               = self.templates,
                 template_path       = settings.TEMPLATE_LOCATION,
                 template_filename   = template_filename,
             )
@@ -211,78 +469,152 @@ class RepositoryDirectory():
                 template            = template,
                 transformers        = self.transformers,
                 repopath            = None,
+                engine              = self.engine,
+                cache               = self.templates,
                 template_path       = template_path,
                 template_filename   = template_filename,
             )
 
-    def list_markdowns(
+    def iter_markdowns(
         self,
         *,
-        subdirectories:List[str]=[],
-        recursive:bool=True,
-    )->List[str]:
+        subdirectories:List[str]    = [],
+        recursive:bool              = True,
+        use_git_index:bool          = None,
+    )->Iterator[str]:
         """
-        Return a list of all markdown files found, recursively searched in the folder.
-        """
-        _return_list = []
+        Yield all markdown files found, recursively searched in the folder, as soon as they are found.
 
+        The env path, template folders, `.git` and anything ignored by `.gitignore` are skipped.
+        If `use_git_index`, defaulting to `settings.DISCOVERY_USE_GIT_INDEX`, the candidates are read from the git index
+        - including untracked files that are not ignored - instead of scanning the file system;
+        if that fails, the file system is scanned anyway.
+        """
         path = os.path.join(
             self.git.path,
             *subdirectories,
         )
-        
-        _blacklist = [
+
+        _blacklist = {
             self.repopath.abspath(settings.ENV_PATH),
             self.repopath.abspath(self.settings.paths.template),
             self.repopath.abspath(settings.TEMPLATE_LOCATION),
-        ]
+        }
 
-        with WorkingDirectory(path=path) as cwd:
-            for _file in os.listdir(path):
+        def _prune(directory:str)->bool:
+            return directory in _blacklist or settings.TEMPLATE_LOCATION in directory
 
-                if (recursive and \
-                    os.path.isdir(_file) and \
-                    os.path.abspath(_file) not in _blacklist and \
-                    not settings.TEMPLATE_LOCATION in os.path.abspath(_file)
+        if (use_git_index is None):
+            use_git_index = settings.DISCOVERY_USE_GIT_INDEX
+
+        if (use_git_index and (_files := self.git.ls_files(path))):
+            for _file in _files:
+                _abspath = os.path.join(path, _file)
+
+                if (
+                    bin.is_markdown(_file) and \
+                    (recursive or os.sep not in _file) and \
+                    not any(_prune(_directory) for _directory in bin.ancestors(_abspath, path)) and \
+                    os.path.isfile(_abspath)    # Deleted, but not staged yet
                 ):
-                    # If its a directory, and we are doing it recursively, then recursively call this method
-                    _return_list += self.list_markdowns(
-                        subdirectories = subdirectories + [_file],
-                        recursive=recursive,
-                    )
-                elif (bin.is_markdown(_file)):
-                    # If its a .md, add it to the list
-                    _abspath = os.path.abspath(_file)
+                    yield _abspath
 
-                    _return_list.append(
-                        _abspath
-                    )
+            return
 
-        return _return_list
+        yield from walker.walk(
+            path,
+            top         = self.git.path,
+            match       = bin.is_markdown,
+            prune       = _prune,
+            recursive   = recursive,
+            cache       = self.source_index,
+        )
 
-    def list_sources(
+    def list_markdowns(
         self,
         *,
-        recursive:bool=True,
+        subdirectories:List[str]    = [],
+        recursive:bool              = True,
+        use_git_index:bool          = None,
     )->List[str]:
         """
-        Return a list of all markdowns that are classifed as "sources".
+        Return a list of all markdown files found, recursively searched in the folder.
+
+        See `iter_markdowns()`.
         """
+        return list(self.iter_markdowns(
+            subdirectories  = subdirectories,
+            recursive       = recursive,
+            use_git_index   = use_git_index,
+        ))
 
-        _return_list = []
+    def iter_sources(
+        self,
+        *,
+        recursive:bool      = True,
+        use_git_index:bool  = None,
+    )->Iterator[str]:
+        """
+        Yield all markdowns that are classifed as "sources", each once, as soon as they are found.
+
+        Files are classified by their paths alone; nothing is created or copied, see `bootstrap()` for that.
+        A source is yielded even if only its rendered file exists.
+        """
+        _found = set()
 
-        for _file in self.list_markdowns(
-            subdirectories=[],
-            recursive=recursive,
+        for _file in self.iter_markdowns(
+            subdirectories  = [],
+            recursive       = recursive,
+            use_git_index   = use_git_index,
         ):
-            _parsed = self.repopath.prepare(_file)
+            _parsed = self.repopath.classify(_file)
 
             # If its not a branch (it won't, because these are files)
             if (_parsed.mode is not MarkdownTemplateMode.BRANCH):
-                # If the source is not already on the list, append it
-                if (_parsed.source not in _return_list): _return_list.append(_parsed.source)
+                # If the source had not been found already, yield it
+                if (_parsed.source not in _found):
+                    _found.add(_parsed.source)
 
-        return _return_list
+                    if (self.source_index is not None):
+                        self.source_index.classify(_parsed)
+
+                    yield _parsed.source
+
+    def list_sources(
+        self,
+        *,
+        recursive:bool      = True,
+        use_git_index:bool  = None,
+    )->List[str]:
+        """
+        Return a list of all markdowns that are classifed as "sources".
+        """
+        return list(self.iter_sources(
+            recursive       = recursive,
+            use_git_index   = use_git_index,
+        ))
+
+    def bootstrap(
+        self,
+        *,
+        use_git_index:bool  = None,
+    )->List[SimpleNamespace]:
+        """
+        Create the missing sources of all rendered markdowns by copying the rendered files into their source locations.
+
+        This is the only step of discovery that writes to the repository; returns the parsed paths that had been bootstrapped.
+        """
+        _bootstrapped = []
+
+        for _file in self.iter_markdowns(use_git_index=use_git_index):
+            _parsed = self.repopath.classify(_file)
+
+            if (_parsed.mode is not MarkdownTemplateMode.BRANCH and not os.path.exists(_parsed.source)):
+                logger.info(f"Bootstrapping {self.colour_path(_parsed.source)} from {self.colour_path(_parsed.rendered)}...")
+
+                _bootstrapped.append(self.repopath.bootstrap(_parsed))
+
+        return _bootstrapped
 
     def colour_path(
         self,
@@ -304,10 +636,32 @@ class RepositoryDirectory():
     def compile(
         self,
         *,
-        dry_run:bool        = False,
+        dry_run:bool            = False,
+        jobs:Union[int, str]    = None,
+        incremental:bool        = True,
+        changed:Iterable[str]   = None,
+        use_git_index:bool      = None,
+        bootstrap:bool          = True,
     )->bool:
         """
         Render all readme files in this `RepositoryDirectory`.
+
+        If `jobs` is more than `1`, the source files are spread across a pool of that many worker processes;
+        `"auto"` uses one worker per CPU.
+        Each worker keeps its own `RepositoryDirectory`, while this instance stages and reports the results.
+
+        If `incremental`, files whose inputs had not changed since the last compile are skipped,
+        as recorded by the `BuildManifest` at `settings.BUILD_MANIFEST_LOCATION`.
+        The manifest is updated either way, unless this is a `dry_run`.
+
+        If `changed` paths are provided, only the sources that depend on any of them are rendered,
+        according to `self.dependencies`; sources with no recorded dependencies are always rendered.
+
+        Sources are rendered as they are discovered; see `iter_sources()` for `use_git_index`.
+        Unless this is a `dry_run`, missing sources are first `bootstrap()`ed from their rendered files if `bootstrap`;
+        sources that are still missing are logged and skipped.
+
+        Returns `True` if all files were rendered and saved without errors.
         """
         logger.info("")
         logger.info(stdout.blue("readme-compiler"))
@@ -320,24 +674,354 @@ class RepositoryDirectory():
             logger.info(f"- {_attr:24s}: {stdout.cyan(getattr(self.git, _attr))}")
         logger.info("")
 
-        _sources = self.list_sources()
+        # Renders cached by a previous compile of a long-lived instance, e.g. in the daemon, would not save anything:
+        # the rendered files may have been deleted or edited since, even if none of their inputs had changed.
+        type(self)._render.cache_clear()
 
-        logger.info(f'Found {stdout.cyan(len(_sources))} Markdown source files, including:')
-        for _file in random.sample(_sources, min(8, len(_sources))):
-            logger.info(f"- {self.colour_path(_file)}")
+        # Each compile describes every object once, shared by all of its renders.
+        describe.registry.clear()
 
-        logger.info("")
+        self.source_index = self.build_source_index()
+
+        if (bootstrap and not dry_run):
+            self.bootstrap(use_git_index=use_git_index)
+
+        if (incremental):
+            self.manifest = self.build_manifest()
+        else:
+            self.manifest = self.build_manifest(load=False)
+
+        # Fill in the dependencies of sources that had not been rendered by this instance yet.
+        for _source, _inputs in self.manifest.graph().edges.items():
+            if (_source not in self.dependencies):
+                self.dependencies.add(_source, _inputs)
+
+        if (changed is not None):
+            _affected = self.dependencies.affected(changed)
+            _known = set(self.dependencies.edges)
+
+        _counts = SimpleNamespace(found=0, affected=0, current=0, missing=0)
+
+        def _pending()->Iterator[str]:
+            """
+            Filter the sources as they are discovered.
+            """
+            for _file in self.iter_sources(use_git_index=use_git_index):
+                _counts.found += 1
+
+                if (not os.path.exists(_file)):
+                    # Only its rendered file exists, and it had not been bootstrapped - e.g. a dry run, or `bootstrap=False`.
+                    logger.warning(" - "+stdout.yellow("MISSING: ")+f"Source {self.colour_path(_file)} does not exist; not rendered.")
+                    _counts.missing += 1
+                    continue
+
+                if (changed is not None and not (_file in _affected or _file not in _known)):
+                    continue
+
+                _counts.affected += 1
+
+                if (incremental and self.manifest.is_current(_file)):
+                    _counts.current += 1
+                    continue
+
+                yield _file
+
+        _sources = _pending()
+
+        _jobs = resolve_jobs(jobs)
+
+        logger.info(stdout.blue("readme-compiler") + " is now renderingd Markdown files" + (f" with {stdout.cyan(_jobs)} workers" if (_jobs > 1) else "") + "...")
+        _results = []
 
-        logger.info(stdout.blue("readme-compiler") + " is now renderingd Markdown files...")
         # Actually starts rendering
-        for _file in _sources:
-            self.render(_file, dry_run=dry_run)
+        try:
+            if (_jobs > 1):
+                _results = self.compile_parallel(_sources, dry_run=dry_run, jobs=_jobs)
+            else:
+                # Collect the results, so that they can be staged in one go.
+                _previous, self.results = self.results, []
+
+                try:
+                    for _file in _sources:
+                        self.render(_file, dry_run=dry_run)
+                finally:
+                    _results, self.results = self.results, _previous
+        except BaseException as e:
+            # The files saved before the failure are on disk already; stage and record them, so that they are not left behind.
+            logger.error(stdout.blue("readme-compiler") + f" aborted by {type(e).__name__}; concluding the files rendered so far.")
+            self.conclude(*_results)
+
+            if (not dry_run):
+                self.manifest.save()
+                self.source_index.save()
+
+            raise
+
+        logger.info("")
+        logger.info(f'Found {stdout.cyan(_counts.found)} Markdown source files.')
+
+        if (_counts.missing):
+            logger.info(f"{stdout.cyan(_counts.missing)} of them only had their rendered files, and had been skipped as they had not been bootstrapped.")
+
+        if (changed is not None):
+            logger.info(f"{stdout.cyan(_counts.affected)} of them depend on the {stdout.cyan(len(set(changed)))} changed files.")
+
+        if (incremental):
+            logger.info(f"{stdout.cyan(_counts.affected - _counts.current)} of them had changed since the last compile; {stdout.cyan(_counts.current)} were up to date and had been skipped.")
+
+        _success = self.conclude(*_results)
+
+        _saved = [ _result for _result in unique_results(_results) if (_result.saved) ]
+        _changed = sum(bool(_result.changed) for _result in _saved)
+
+        logger.info(f"{stdout.cyan(_changed)} rendered files changed; {stdout.cyan(len(_saved) - _changed)} were unchanged, and had not been saved or staged.")
+
+        if (_jobs <= 1):
+            _stats = self.templates.stats
+            logger.debug(f"Template cache: {_stats.hits:,} hits, {_stats.misses:,} misses, {_stats.evictions:,} evictions; {_stats.size:,} templates cached.")
+
+            if (self.templates.store is not None):
+                logger.debug(f"Template store: {self.templates.store.hits:,} compiled templates loaded, {self.templates.store.stores:,} stored.")
+
+        if (not dry_run):
+            self.manifest.save()
+            self.source_index.save()
 
         logger.info("")
 
         logger.info(stdout.blue("readme-compiler") + " completed.")
         logger.info("")
 
+        return _success
+
+    def watch(
+        self,
+        *,
+        jobs:Union[int, str]    = None,
+        debounce:float          = None,
+        polling:bool            = False,
+    )->None:
+        """
+        Compile this `RepositoryDirectory`, then keep recompiling the sources affected by any changes until interrupted.
+
+        See `readme_compiler.watch`.
+        """
+        from ..watch import watch
+
+        return watch(self, jobs=jobs, debounce=debounce, polling=polling)
+
+    def invalidate(
+        self,
+        paths:Iterable[str] = None,
+    )->None:
+        """
+        Forget everything cached about `paths`, so that the next `compile()` picks up their changes.
+
+        All cached renders are discarded, as they may have embedded any of `paths`;
+        Python modules loaded from any of `paths` are reloaded.
+        """
+        type(self)._render.cache_clear()
+
+        # Descriptions of the old modules, or with the old sidecar metadata.
+        describe.registry.clear()
+        describe.metadatastore.clear()
+
+        _paths = set(map(os.path.abspath, paths or ()))
+        _reloaded = False
+
+        for _name, _module in list(sys.modules.items()):
+            _file = getattr(_module, "__file__", None)
+
+            if (isinstance(_file, str) and os.path.abspath(_file) in _paths):
+                try:
+                    importlib.reload(_module)
+                    _reloaded = True
+                except (Exception, ) as e:
+                    logger.warning(f"Cannot reload module {repr(_name)}: {type(e).__name__}: {str(e)}")
+
+        if (_reloaded):
+            # Compiled templates hold on to the template tags of the modules they were compiled with.
+            self.engine = create_engine()
+            self.templates.clear()
+            library_digest.cache_clear()
+
+    def build_manifest(
+        self,
+        *,
+        load:bool = True,
+    )->BuildManifest:
+        """
+        Return the `BuildManifest` of this repository, loaded from disk unless `load` is `False`.
+
+        A manifest recorded by a different version of the library, on a different branch, or with a different describe backend, is discarded.
+        """
+        _path = self.state_path(settings.BUILD_MANIFEST_LOCATION)
+        _environment = {
+            "library":  library_fingerprint(),
+            "branch":   str(self.git.branch),
+            "hook":     str(self.git.hook),
+            "describe": self.settings.describe_backend,
+        }
+
+        if (load):
+            return BuildManifest.load(_path, root=self.git.path, environment=_environment)
+        else:
+            return BuildManifest(_path, root=self.git.path, environment=_environment)
+
+    def build_source_index(self)->SourceIndex:
+        """
+        Return the `SourceIndex` of this repository, loaded from `settings.SOURCE_INDEX_LOCATION`.
+
+        An index recorded with different path settings is discarded.
+        """
+        return SourceIndex.load(
+            self.state_path(settings.SOURCE_INDEX_LOCATION),
+            root = self.git.path,
+            environment = {
+                "paths":        [
+                    self.settings.paths.index.source,
+                    self.settings.paths.index.rendered,
+                    self.settings.paths.folder.source,
+                    self.settings.paths.folder.rendered,
+                    self.settings.paths.template,
+                ],
+                "discovery":    [
+                    settings.ENV_PATH,
+                    settings.TEMPLATE_LOCATION,
+                    list(settings.FILE_EXTENSION_MARKDOWN),
+                ],
+            },
+        )
+
+    def compile_parallel(
+        self,
+        sources:Iterable[str],
+        *,
+        dry_run:bool            = False,
+        jobs:int                = None,
+    )->List[RenderResult]:
+        """
+        Render `sources` across a pool of worker processes, and return their results to be concluded here.
+        """
+        _collected = []
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers = jobs,
+            initializer = _compile_worker_initialiser,
+            initargs    = (self, ),
+        ) as _executor:
+            for _results in _executor.map(
+                functools.partial(_compile_worker, dry_run=dry_run),
+                sources,
+            ):
+                _collected += _results
+
+        return _collected
+
+
+def unique_results(
+    results:Iterable[RenderResult],
+)->List[RenderResult]:
+    """
+    Return one `RenderResult` for each file in `results`, in order of their first appearance.
+
+    Shared fragments like `.footer` are saved by every worker that embeds them, and only the first of them finds the file changed;
+    so the results for the same file are merged: it had `changed` if any of them had changed it,
+    and had been saved if any of them had saved it, with their dependencies combined.
+    """
+    _unique:Dict[Tuple[str, str, bool], RenderResult] = {}
+
+    for _result in results:
+        if ((_merged := _unique.get(_result.key, None)) is None):
+            _unique[_result.key] = dataclasses.replace(_result, dependencies=list(_result.dependencies))
+            continue
+
+        if (_result.changed is not None):
+            _merged.changed = bool(_merged.changed) or _result.changed
+
+        if (_result.saved and not _merged.saved):
+            _merged.error   = None
+            _merged.size    = _result.size
+
+        _merged.dependencies = sorted(set(_merged.dependencies).union(_result.dependencies))
+
+    return list(_unique.values())
+
+def resolve_jobs(
+    jobs:Union[int, str, None],
+)->int:
+    """
+    Resolve the number of workers to use: `None` means `1`, and `"auto"` means one per CPU.
+    """
+    if (jobs is None):
+        return 1
+    elif (isinstance(jobs, str) and jobs.lower() == "auto"):
+        return os.cpu_count() or 1
+    else:
+        _jobs = int(jobs)
+
+        if (_jobs < 1):
+            raise ValueError(f"Number of jobs must be at least 1; {repr(jobs)} found.")
+
+        return _jobs
+
+# Each compile worker process keeps its own `RepositoryDirectory`,
+# so that its template engines and describe caches stay warm between files.
+_compile_worker_repository:"RepositoryDirectory" = None
+
+def _compile_worker_initialiser(
+    repository:"RepositoryDirectory",
+)->None:
+    """
+    Initialise a compile worker process with its own copy of `repository`.
+    """
+    global _compile_worker_repository
+
+    _compile_worker_repository = repository
+
+def _compile_worker(
+    path:str,
+    *,
+    dry_run:bool = False,
+)->List[RenderResult]:
+    """
+    Render a single source in a compile worker process.
+
+    Returns all the `RenderResult`s produced, including any embedded fragments that were saved along the way.
+    """
+    _repository = _compile_worker_repository
+    _repository.results = []
+
+    try:
+        _repository.render(path, dry_run=dry_run)
+    except Exception as e:
+        _repository.results.append(
+            RenderResult(
+                path            = path,
+                rendered_path   = _repository.repopath.parse(path).rendered,
+                dry_run         = dry_run,
+                error           = f"{type(e).__name__} occured: {str(e)}",
+            )
+        )
+
+    _results, _repository.results = _repository.results, None
+
+    return _results
+
+def create_engine()->DjangoEngine:
+    """
+    Create a `DjangoEngine` with our template tags, to be shared by any number of `MarkdownTemplate`s.
+    """
+    # Since we are not using any of the rest of Django, we need to create arbitrary engines for the Template.
+    _engine = DjangoEngine(
+        builtins=["readme_compiler.templatetags"],
+    )
+
+    # Add our library with template tags to the engine
+    _engine.builtins.append(register)
+
+    return _engine
+
 class MarkdownTemplate(DjangoTemplate):
     """
     A template file for Markdown language.
@@ -351,16 +1035,18 @@ class MarkdownTemplate(DjangoTemplate):
         *,
         path: str                                       = None,
         transformers: Iterable[Callable[[str], str]]    = None,
+        store: TemplateStore                            = None,
     ) -> None:
         """
+        If a `TemplateStore` is provided, the template is loaded from it instead of being parsed, if it had been stored before.
         """
-        # Since we are not using any of the rest of Django, we need to create arbitrary engines for the Template.
-        engine = engine or DjangoEngine(
-            builtins=["readme_compiler.templatetags"],
-        )
+        if (engine is None):
+            engine = create_engine()
+        elif (register not in engine.builtins):
+            engine.builtins.append(register)
 
-        # Add our library with template tags to the engine
-        engine.builtins.append(register)
+        # `compile_nodelist()` is called by `super().__init__()`.
+        self.store = store
 
         super().__init__(template_string, origin, name, engine)
 
@@ -373,22 +1059,30 @@ class MarkdownTemplate(DjangoTemplate):
         path:str,
         *,
         transformers: Iterable[Callable[[str], str]]    = None,
+        engine:DjangoEngine                             = None,
+        cache:TemplateCache                             = None,
 
         rendered_index:str  = settings.README_RENDERED_INDEX,
         rendered_folder:str = settings.README_RENDERED_DIRECTORY,
         source_index:str    = settings.README_SOURCE_INDEX,
         source_folder:str   = settings.README_SOURCE_DIRECTORY,
+        cwd:str             = None,
     )->"MarkdownTemplate":
         """
         Initialise a `MarkdownTemplate` instance from an existing template file.
+
+        Relative paths are resolved against `cwd` if provided, or the working directory of the process otherwise.
+
+        If a `TemplateCache` is provided, the compiled template is taken from it unless the file had been modified since.
         """
         # Breaddown `path` to see what exactly we are supposed to do
-        _parsed = bin.prepare_markdown_path(
+        _parsed = bin.parse_markdown_path(
             path,
             rendered_index  = rendered_index,
             rendered_folder = rendered_folder,
             source_index    = source_index,
             source_folder   = source_folder,
+            cwd             = cwd,
         )
 
         if (_parsed.mode is MarkdownTemplateMode.BRANCH):
@@ -397,19 +1091,20 @@ class MarkdownTemplate(DjangoTemplate):
             )
         else:
             # Get the source path.
-            # If this does not exists, but destination exists, then `prepare_markdown_path` would have copied it.
+            # If this does not exists, but destination exists, then `RepositoryDirectory.bootstrap()` would copy it.
             path = _parsed.source
 
+            # Record this even if it doesn't exist - its creation should trigger a re-render.
+            dependencies.record(path)
+
             if (os.path.isfile(path)):
                 # File exists
-                path = os.path.abspath(path)
-
-                with open(path, "r") as _f:
-                    return cls(
-                        _f.read(),
-                        transformers    = transformers,
-                        path            = path,
-                    )
+                return cls.load(
+                    os.path.abspath(path),
+                    transformers    = transformers,
+                    engine          = engine,
+                    cache           = cache,
+                )
 
             else:
                 # File does not exists
@@ -423,6 +1118,8 @@ class MarkdownTemplate(DjangoTemplate):
         template:str,
         *,
         transformers: Iterable[Callable[[str], str]]    = None,
+        engine:DjangoEngine                             = None,
+        cache:TemplateCache                             = None,
         repopath:Union[
             RepositoryPath,
             RepositoryDirectory,
@@ -458,16 +1155,16 @@ class MarkdownTemplate(DjangoTemplate):
             )
         )
 
+        dependencies.record(_abspath)
+
         if (os.path.isfile(_abspath)):
             # File exists
-            _abspath = os.path.abspath(_abspath)
-
-            with open(_abspath, "r") as _f:
-                return cls(
-                    _f.read(),
-                    transformers    = transformers,
-                    path            = _abspath,
-                )
+            return cls.load(
+                os.path.abspath(_abspath),
+                transformers    = transformers,
+                engine          = engine,
+                cache           = cache,
+            )
 
         else:
             # File does not exists
@@ -475,7 +1172,57 @@ class MarkdownTemplate(DjangoTemplate):
                 f"{repr(_abspath)} not found."
             )
 
-        
+    def compile_nodelist(self):
+        """
+        Parse the template source into a nodelist, or load it from `self.store` if it had been parsed before.
+        """
+        if (self.store is not None and (_compiled := self.store.load(self.source)) is not None):
+            _nodelist, self.extra_data = _compiled
+            return _nodelist
+
+        _nodelist = super().compile_nodelist()
+
+        if (self.store is not None):
+            self.store.save(self.source, (_nodelist, getattr(self, "extra_data", {})))
+
+        return _nodelist
+
+    @classmethod
+    def load(
+        cls:"MarkdownTemplate",
+        path:str,
+        *,
+        transformers: Iterable[Callable[[str], str]]    = None,
+        engine:DjangoEngine                             = None,
+        cache:TemplateCache                             = None,
+    )->"MarkdownTemplate":
+        """
+        Read and compile the template file at the absolute `path`, or take it from `cache` if provided.
+        The compiled template is also looked up in, and saved to, the `TemplateStore` of the `cache`, if it has one.
+
+        A cached template compiled with other `transformers` is shallow-copied, sharing its compiled nodes.
+        """
+        def _loader(path:str)->"MarkdownTemplate":
+            with open(path, "r") as _f:
+                return cls(
+                    _f.read(),
+                    engine          = engine,
+                    transformers    = transformers,
+                    path            = path,
+                    store           = cache.store if (cache is not None) else None,
+                )
+
+        if (cache is None):
+            return _loader(path)
+
+        _template = cache.get(path, _loader)
+
+        _transformers = transformers if (isinstance(transformers, Iterable)) else []
+        if (_template.transformers != _transformers):
+            _template = copy.copy(_template)
+            _template.transformers = _transformers
+
+        return _template
 
     def render(
         self:"MarkdownTemplate",
@@ -490,18 +1237,22 @@ class MarkdownTemplate(DjangoTemplate):
     ) -> str:
         """
         After Rendering with the Template, pass the result through any transformers specified.
-        """
-
-        # Switch cwd to the path of the file before we render.
-        with WorkingDirectory(path=self.path) as cwd:
 
+        The working directory of the process is never changed;
+        instead, the directory of this template is put in the context as `template_directory`,
+        against which template tags resolve relative paths.
+        This allows templates to be rendered concurrently on multiple threads.
+        """
+        with context.push(
+            template_directory = os.path.dirname(self.path) if (self.path) else None,
+        ):
             _rendered = super().render(context)
 
-            for _transformer in filter(callable, self.transformers):
-                if (_transformer.should_transform(
-                    self.path,
-                    purpose=purpose,
-                )):
-                    _rendered = _transformer(_rendered)
+        for _transformer in filter(callable, self.transformers):
+            if (_transformer.should_transform(
+                self.path,
+                purpose=purpose,
+            )):
+                _rendered = _transformer(_rendered)
 
-            return _rendered
\ No newline at end of file
+        return _rendered
@@ -0,0 +1,219 @@
+"""
+# Format Cache
+
+Content-addressed on-disk cache of formatted source code, so that code that had not changed since the last run
+does not have to go through `black` again.
+
+Each entry is a file named by the SHA-1 of the source text, the `black.Mode` and the version of `black`,
+containing the formatted text. Entries are touched whenever they are read, and the least recently used
+are evicted once the cache grows beyond its maximum size.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ..log import logger
+
+print = logger.debug
+
+class FormatCache():
+    """
+    On-disk cache of formatted text in `directory`, holding at most `maxsize` bytes.
+    """
+    # Evict after this many entries had been written since the last eviction, rather than on every write.
+    EVICT_EVERY = 256
+
+    def __init__(
+        self,
+        directory:str,
+        *,
+        maxsize:int,
+    )->None:
+        self.directory  = os.path.abspath(directory)
+        self.maxsize    = maxsize
+
+        self._lock = threading.Lock()
+        self._written = 0
+
+        self.hits   = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory={repr(self.directory)}, maxsize={self.maxsize:,}, hits={self.hits:,}, misses={self.misses:,})"
+
+    @staticmethod
+    def key(
+        *parts:str,
+    )->str:
+        """
+        Return the key of an entry identified by all of `parts`, e.g. the source text, mode and version of the formatter.
+        """
+        _hash = hashlib.sha1()
+
+        for _part in parts:
+            _encoded = str(_part).encode("utf-8")
+            _hash.update(f"{len(_encoded)}:".encode("utf-8") + _encoded)
+
+        return _hash.hexdigest()
+
+    def path(
+        self,
+        key:str,
+    )->str:
+        """
+        Return the path of the entry of `key`.
+        """
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(
+        self,
+        key:str,
+        default:Any = None,
+    )->Optional[str]:
+        """
+        Return the formatted text of `key`, `None` if it was recorded to have no output, or `default` if it is not cached.
+        """
+        _path = self.path(key)
+
+        try:
+            with open(_path, "r", encoding="utf-8", newline="") as _f:
+                _text = _f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            self.misses += 1
+            return default
+
+        try:
+            # Mark it as recently used.
+            os.utime(_path)
+        except (OSError, ) as e:
+            pass
+
+        self.hits += 1
+        return _text or None
+
+    def set(
+        self,
+        key:str,
+        text:Optional[str],
+    )->None:
+        """
+        Record the formatted `text` of `key`.
+
+        Failures are logged and otherwise ignored; the text will simply be formatted again next time.
+        """
+        _path = self.path(key)
+
+        try:
+            os.makedirs(os.path.dirname(_path), exist_ok=True)
+
+            # Write to a temporary file first, so that other processes never read a partial entry.
+            _fd, _temp = tempfile.mkstemp(dir=os.path.dirname(_path), suffix=".tmp")
+            try:
+                with os.fdopen(_fd, "w", encoding="utf-8", newline="") as _f:
+                    _f.write(text or "")
+
+                os.replace(_temp, _path)
+            except BaseException as e:
+                os.unlink(_temp)
+                raise
+
+        except (OSError, ) as e:
+            print (f"Cannot cache formatted text at {repr(_path)}: {type(e).__name__}: {str(e)}")
+            return
+
+        with self._lock:
+            self._written += 1
+
+            if (self._written < self.EVICT_EVERY):
+                return
+
+            self._written = 0
+
+        self.evict()
+
+    def get_or_set(
+        self,
+        key:str,
+        formatter:Callable[[], Optional[str]],
+    )->Optional[str]:
+        """
+        Return the formatted text of `key`, calling `formatter()` and caching its output if it is not cached.
+        """
+        _missing = object()
+
+        if ((_text := self.get(key, _missing)) is _missing):
+            _text = formatter()
+            self.set(key, _text)
+
+        return _text
+
+    def size(self)->int:
+        """
+        Return the total size of all entries in bytes.
+        """
+        return sum(_entry[2] for _entry in self.entries())
+
+    def entries(self)->List[Tuple[float, str, int]]:
+        """
+        Return `(mtime, path, size)` of all entries.
+        """
+        _entries = []
+
+        try:
+            _buckets = os.scandir(self.directory)
+        except (OSError, ) as e:
+            return _entries
+
+        with _buckets:
+            for _bucket in _buckets:
+                if (not _bucket.is_dir()):
+                    continue
+
+                try:
+                    with os.scandir(_bucket.path) as _files:
+                        for _file in _files:
+                            try:
+                                _stat = _file.stat()
+                            except (OSError, ) as e:
+                                continue
+
+                            _entries.append((_stat.st_mtime, _file.path, _stat.st_size))
+                except (OSError, ) as e:
+                    continue
+
+        return _entries
+
+    def evict(self)->int:
+        """
+        Remove the least recently used entries until the cache is within `maxsize`; returns the number of entries removed.
+        """
+        _entries = self.entries()
+        _size = sum(_entry[2] for _entry in _entries)
+        _removed = 0
+
+        for _mtime, _path, _entry_size in sorted(_entries):
+            if (_size <= self.maxsize):
+                break
+
+            try:
+                os.unlink(_path)
+            except (OSError, ) as e:
+                continue
+
+            _size -= _entry_size
+            _removed += 1
+
+        if (_removed):
+            print (f"Evicted {_removed:,} entries from {repr(self)}.")
+
+        return _removed
+
+    def clear(self)->None:
+        """
+        Remove all entries.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,287 @@
+"""
+# Git Reader
+
+Read the metadata `GitProperties` needs directly from the files in `.git`, without spawning `git`.
+
+This understands plain repositories and linked worktrees - where `.git` is a file containing `gitdir: ...`.
+Anything more unusual, e.g. `$GIT_DIR` being set, `core.worktree` or `[include]` in the config,
+makes `read_metadata()` return `None`, so that the caller can ask `git` itself instead.
+
+Results are cached per repository root, and re-read whenever `HEAD`, the ref it points to or the config is modified.
+"""
+
+import os
+import re
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from .. import exceptions
+from ..log import logger
+
+print = logger.debug
+
+# If any of these are set, `git` would not be looking at the `.git` we would find.
+GIT_ENVIRONMENT_OVERRIDES = (
+    "GIT_DIR",
+    "GIT_WORK_TREE",
+    "GIT_COMMON_DIR",
+    "GIT_CONFIG",
+    "GIT_CONFIG_PARAMETERS",
+    "GIT_CONFIG_COUNT",
+)
+
+PATTERN_SECTION = re.compile(r'^\[\s*(?P<section>[A-Za-z0-9.-]+)(?:\s+"(?P<subsection>(?:[^"\\]|\\.)*)")?\s*\]\s*(?:[#;].*)?$')
+PATTERN_VARIABLE = re.compile(r'^(?P<key>[A-Za-z][A-Za-z0-9-]*)\s*(?:=\s*(?P<value>.*))?$')
+
+class UnsupportedLayout(ValueError, exceptions.FalseEvaluatingException):
+    """
+    The repository cannot be read reliably without `git` itself.
+    """
+
+_cache:Dict[str, Tuple[Tuple[Any, ...], SimpleNamespace]] = {}
+
+def find_toplevel(
+    path:str,
+)->Optional[str]:
+    """
+    Return the closest directory at or above `path` containing `.git`, or `None` if there isn't one.
+    """
+    path = os.path.abspath(path)
+
+    while True:
+        if (os.path.exists(os.path.join(path, ".git"))):
+            return path
+
+        _parent = os.path.dirname(path)
+
+        if (_parent == path):
+            return None
+
+        path = _parent
+
+def resolve_git_dir(
+    toplevel:str,
+)->str:
+    """
+    Return the git directory of the work tree at `toplevel`, following `gitdir:` files of linked worktrees.
+    """
+    _dotgit = os.path.join(toplevel, ".git")
+
+    if (os.path.isdir(_dotgit)):
+        return _dotgit
+
+    with open(_dotgit, "r") as _f:
+        _content = _f.read().strip()
+
+    if (not _content.startswith("gitdir:")):
+        raise UnsupportedLayout(f"{repr(_dotgit)} is not a gitdir file.")
+
+    return os.path.normpath(os.path.join(toplevel, _content[len("gitdir:"):].strip()))
+
+def resolve_common_dir(
+    git_dir:str,
+)->str:
+    """
+    Return the directory containing the config and refs shared by all worktrees.
+    """
+    _commondir = os.path.join(git_dir, "commondir")
+
+    if (os.path.isfile(_commondir)):
+        with open(_commondir, "r") as _f:
+            return os.path.normpath(os.path.join(git_dir, _f.read().strip()))
+
+    return git_dir
+
+def parse_config_value(
+    value:str,
+)->str:
+    """
+    Unquote a value in a git config file, and strip any trailing comment.
+    """
+    _value = ""
+    _quoted = False
+    _chars = iter(value)
+
+    for _char in _chars:
+        if (_char == "\\"):
+            _escaped = next(_chars, "")
+            _value += {"n": "\n", "t": "\t", "b": "\b"}.get(_escaped, _escaped)
+        elif (_char == '"'):
+            _quoted = not _quoted
+        elif (_char in "#;" and not _quoted):
+            break
+        else:
+            _value += _char
+
+    return _value.strip() if (not _quoted) else _value
+
+def read_config(
+    path:str,
+)->Dict[Tuple[str, Optional[str], str], List[str]]:
+    """
+    Parse a git config file into a `dict` of `(section, subsection, key)` and all their values.
+
+    Section and key names are lower-cased, as they are case-insensitive; subsections are not.
+    """
+    _config = {}
+    _section = None
+
+    with open(path, "r") as _f:
+        for _line in _f:
+            _line = _line.strip()
+
+            if (not _line or _line[0] in "#;"):
+                continue
+            elif (_line.endswith("\\")):
+                raise UnsupportedLayout(f"{repr(path)} contains continued lines.")
+            elif (_match := PATTERN_SECTION.match(_line)):
+                _subsection = _match.group("subsection")
+                _section = (
+                    _match.group("section").lower(),
+                    re.sub(r"\\(.)", r"\1", _subsection) if (_subsection is not None) else None,
+                )
+
+                if (_section[0] in ("include", "includeif")):
+                    raise UnsupportedLayout(f"{repr(path)} includes other config files.")
+            elif (_section and (_match := PATTERN_VARIABLE.match(_line))):
+                _config.setdefault(
+                    (*_section, _match.group("key").lower()), []
+                ).append(
+                    parse_config_value(_match.group("value")) if (_match.group("value") is not None) else "true"
+                )
+            else:
+                raise UnsupportedLayout(f"{repr(path)} cannot be parsed at {repr(_line)}.")
+
+    return _config
+
+def ref_exists(
+    common_dir:str,
+    git_dir:str,
+    ref:str,
+)->bool:
+    """
+    Check if `ref` exists, either as a loose ref or in `packed-refs`.
+    """
+    for _dir in (git_dir, common_dir):
+        if (os.path.isfile(os.path.join(_dir, ref))):
+            return True
+
+    _packed_refs = os.path.join(common_dir, "packed-refs")
+
+    if (os.path.isfile(_packed_refs)):
+        with open(_packed_refs, "r") as _f:
+            for _line in _f:
+                if (_line.rstrip("\n").split(" ", 1)[-1] == ref):
+                    return True
+
+    return False
+
+def _mtime(path:str)->Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except (OSError, ) as e:
+        return None
+
+def head_ref(
+    git_dir:str,
+)->Optional[str]:
+    """
+    Return the ref `HEAD` points to, e.g. `refs/heads/main`, or `None` if it is detached.
+    """
+    with open(os.path.join(git_dir, "HEAD"), "r") as _f:
+        _head = _f.read().strip()
+
+    if (_head.startswith("ref:")):
+        return _head[len("ref:"):].strip()
+
+    return None
+
+def read_metadata(
+    path:str,
+)->Optional[SimpleNamespace]:
+    """
+    Return the `hook`, `branch` and top level `path` of the repository containing `path`,
+    as `git config --get remote.origin.url`, `git rev-parse --abbrev-ref HEAD` and `git rev-parse --show-toplevel` would.
+
+    Returns `None` if this cannot be done reliably without `git`.
+    """
+    if (any(_variable in os.environ for _variable in GIT_ENVIRONMENT_OVERRIDES)):
+        return None
+
+    _toplevel = find_toplevel(path)
+
+    if (_toplevel is None):
+        return None
+
+    _cached = _cache.get(_toplevel, None)
+
+    try:
+        _git_dir = resolve_git_dir(_toplevel)
+        _common_dir = resolve_common_dir(_git_dir)
+        _ref = head_ref(_git_dir)
+
+        _key = (
+            _git_dir,
+            _mtime(os.path.join(_git_dir, "HEAD")),
+            _mtime(os.path.join(_common_dir, "config")),
+            _mtime(os.path.join(_common_dir, "packed-refs")),
+            # The loose ref of the branch, which does not exist until its first commit.
+            *(
+                ( _mtime(os.path.join(_git_dir, _ref)), _mtime(os.path.join(_common_dir, _ref)) ) \
+                    if (_ref) \
+                        else ()
+            ),
+        )
+
+        if (_cached and _cached[0] == _key):
+            return _cached[1]
+
+        _metadata = _read_metadata(_toplevel, _git_dir, _common_dir)
+    except (OSError, UnsupportedLayout) as e:
+        print (f"Falling back to git for {repr(path)}: {type(e).__name__}: {str(e)}")
+        return None
+
+    _cache[_toplevel] = (_key, _metadata)
+
+    return _metadata
+
+def _read_metadata(
+    toplevel:str,
+    git_dir:str,
+    common_dir:str,
+)->SimpleNamespace:
+    """
+    Uncached implementation of `read_metadata()`.
+    """
+    _config = read_config(os.path.join(common_dir, "config"))
+
+    if (
+        _config.get(("core", None, "bare"), ["false"])[-1].lower() == "true" or \
+        ("core", None, "worktree") in _config
+    ):
+        raise UnsupportedLayout(f"{repr(common_dir)} has a non-standard work tree.")
+
+    # `git config --get` returns the last value, and fails if there are none.
+    _urls = _config.get(("remote", "origin", "url"), [])
+    _hook = _urls[-1] if (_urls) else exceptions.ShellReturnError(1, ["git", "config", "--get", "remote.origin.url"])
+
+    _ref = head_ref(git_dir)
+
+    if (_ref is not None):
+        if (not _ref.startswith("refs/heads/")):
+            raise UnsupportedLayout(f"HEAD points to {repr(_ref)}, which is not a branch.")
+
+        if (ref_exists(common_dir, git_dir, _ref)):
+            _branch = _ref[len("refs/heads/"):]
+        else:
+            # No commits yet - `git rev-parse` fails, which `GitProperties` treats as `main`.
+            _branch = "main"
+    else:
+        # Detached HEAD.
+        _branch = "HEAD"
+
+    return SimpleNamespace(
+        hook    = _hook,
+        branch  = _branch,
+        path    = os.path.realpath(toplevel),
+    )
@@ -0,0 +1,268 @@
+"""
+# Build Manifest
+
+A JSON file recording the inputs of every rendered Markdown, so that `RepositoryDirectory.compile()` can skip
+files whose inputs had not changed since they were last rendered.
+
+Each input is fingerprinted by its `mtime`, size and SHA-1 digest. A changed `mtime` alone, e.g. after a `git checkout`,
+does not invalidate an input as long as its size and digest are unchanged.
+"""
+
+import os
+import hashlib
+import json
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ..log import logger
+from ..dependencies import DependencyGraph
+
+from .results import RenderResult
+
+print = logger.debug
+
+MANIFEST_VERSION = 1
+
+Fingerprint = Optional[List[Union[int, str]]]   # [mtime_ns, size, sha1] or None if the file does not exist
+
+def digest(path:str)->str:
+    """
+    Return the SHA-1 digest of the contents of a file.
+    """
+    _hash = hashlib.sha1()
+
+    with open(path, "rb") as _f:
+        for _chunk in iter(lambda: _f.read(1 << 20), b""):
+            _hash.update(_chunk)
+
+    return _hash.hexdigest()
+
+def fingerprint(path:str)->Fingerprint:
+    """
+    Return the `Fingerprint` of a file, or `None` if it does not exist.
+    """
+    try:
+        _stat = os.stat(path)
+        return [_stat.st_mtime_ns, _stat.st_size, digest(path)]
+    except (OSError, ) as e:
+        return None
+
+def library_fingerprint()->str:
+    """
+    Return a digest identifying the installed version of `readme_compiler`.
+
+    Any change to the library's own source invalidates everything that it had rendered or cached.
+    """
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    _hash = hashlib.sha1()
+
+    for _dir, _subdirs, _files in os.walk(_root):
+        _subdirs.sort()
+
+        for _file in sorted(_files):
+            if (_file.endswith(".py")):
+                _stat = os.stat(os.path.join(_dir, _file))
+                _hash.update(f"{os.path.relpath(os.path.join(_dir, _file), _root)}:{_stat.st_mtime_ns}:{_stat.st_size};".encode("utf-8"))
+
+    return _hash.hexdigest()
+
+class BuildManifest():
+    """
+    Persistent record of the inputs of each rendered Markdown in a `RepositoryDirectory`.
+
+    Use classmethod `load()`.
+    """
+    def __init__(
+        self,
+        path:str,
+        *,
+        root:str,
+        environment:Dict[str, Any]              = None,
+        entries:Dict[str, Dict[str, Any]]       = None,
+    )->None:
+        self.path           = path
+        self.root           = root
+        self.environment    = environment if (isinstance(environment, dict)) else {}
+        self.entries        = entries if (isinstance(entries, dict)) else {}
+
+        # Fingerprints already computed during this run; inputs like `.footer` are shared by most files.
+        self._fingerprints:Dict[str, Fingerprint] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={repr(self.path)}, entries={len(self.entries):,})"
+
+    @classmethod
+    def load(
+        cls:Type["BuildManifest"],
+        path:str,
+        *,
+        root:str,
+        environment:Dict[str, Any]  = None,
+    )->"BuildManifest":
+        """
+        Load the manifest at `path`.
+
+        If the file does not exist, is malformed, or was built in a different `environment`, an empty manifest is returned.
+        """
+        _manifest = cls(path, root=root, environment=environment)
+
+        try:
+            with open(path, "r") as _f:
+                _data = json.load(_f)
+
+            if (
+                _data.get("version", None) == MANIFEST_VERSION and \
+                _data.get("environment", None) == _manifest.environment
+            ):
+                _manifest.entries = _data.get("entries", {})
+            else:
+                print (f"Build manifest {repr(path)} is out of date; all files will be rendered.")
+
+        except (OSError, ValueError, AttributeError) as e:
+            print (f"Build manifest {repr(path)} cannot be loaded: {type(e).__name__}: {str(e)}")
+
+        return _manifest
+
+    def save(self)->None:
+        """
+        Write the manifest back to its file.
+        """
+        # Forget about sources that no longer exist.
+        for _key in [ _key for _key in self.entries if (not os.path.exists(self.abspath(_key))) ]:
+            del self.entries[_key]
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            with open(self.path, "w") as _f:
+                json.dump(
+                    {
+                        "version":      MANIFEST_VERSION,
+                        "environment":  self.environment,
+                        "entries":      self.entries,
+                    },
+                    _f,
+                    indent=4,
+                    sort_keys=True,
+                )
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Build manifest {repr(self.path)} cannot be saved: {type(e).__name__}: {str(e)}")
+
+    def relpath(self, path:str)->str:
+        """
+        Key of `path` in the manifest: relative to the repository root if its inside the repository, absolute otherwise.
+        """
+        path = os.path.abspath(path)
+        _relpath = os.path.relpath(path, self.root)
+
+        return path if (_relpath.startswith("..")) else _relpath
+
+    def abspath(self, key:str)->str:
+        """
+        Reverse of `relpath()`.
+        """
+        return os.path.normpath(os.path.join(self.root, key))
+
+    def fingerprint(self, path:str)->Fingerprint:
+        """
+        Cached `fingerprint()` of `path`, computed at most once per run.
+        """
+        path = os.path.abspath(path)
+
+        if (path not in self._fingerprints):
+            self._fingerprints[path] = fingerprint(path)
+
+        return self._fingerprints[path]
+
+    def unchanged(
+        self,
+        path:str,
+        recorded:Fingerprint,
+    )->bool:
+        """
+        Check if the file at `path` still matches its `recorded` fingerprint.
+
+        The digest is only computed if the `mtime` has changed but the size has not.
+        """
+        try:
+            _stat = os.stat(path)
+        except (OSError, ) as e:
+            return recorded is None
+
+        if (recorded is None):
+            return False
+        elif ([_stat.st_mtime_ns, _stat.st_size] == recorded[:2]):
+            return True
+        elif (_stat.st_size != recorded[1]):
+            return False
+        elif (self.fingerprint(path)[2] == recorded[2]):
+            # Contents unchanged - remember the new `mtime` so we don't have to hash it again next time.
+            recorded[0] = _stat.st_mtime_ns
+            return True
+        else:
+            return False
+
+    def is_current(
+        self,
+        source:str,
+    )->bool:
+        """
+        Return `True` if `source` had been rendered before, and neither its inputs nor its output had changed since.
+        """
+        _entry = self.entries.get(self.relpath(source), None)
+
+        if (not _entry):
+            return False
+
+        return \
+            self.unchanged(self.abspath(_entry["rendered"]), _entry["output"]) and \
+            all(
+                self.unchanged(self.abspath(_key), _recorded) \
+                    for _key, _recorded in _entry["inputs"].items()
+            )
+
+    def output(
+        self,
+        source:str,
+    )->Fingerprint:
+        """
+        Return the recorded `Fingerprint` of the rendered file of `source`, or `None` if it had not been recorded.
+        """
+        return self.entries.get(self.relpath(source), {}).get("output", None)
+
+    def update(
+        self,
+        source:str,
+        result:RenderResult,
+    )->None:
+        """
+        Record the inputs and output of a saved `RenderResult` for `source`.
+        """
+        self.entries[self.relpath(source)] = {
+            "rendered": self.relpath(result.rendered_path),
+            "output":   fingerprint(result.rendered_path),
+            "inputs":   {
+                self.relpath(_path):self.fingerprint(_path) \
+                    for _path in sorted(result.dependencies)
+            },
+        }
+
+    def discard(
+        self,
+        source:str,
+    )->None:
+        """
+        Remove `source` from the manifest, so that it will be rendered next time.
+        """
+        self.entries.pop(self.relpath(source), None)
+
+    def graph(self)->DependencyGraph:
+        """
+        Return the `DependencyGraph` of all the sources recorded in the manifest.
+        """
+        return DependencyGraph(
+            {
+                self.abspath(_key):map(self.abspath, _entry["inputs"]) \
+                    for _key, _entry in self.entries.items()
+            },
+            root = self.root,
+        )
@@ -15,9 +15,12 @@ def resolve_repo_to_abspath(
     path:str,
     *,
     repo_root:str="./",
+    cwd:str=None,
 )->str:
     """
     Resolve root paths e.g. /README.md in repos into local paths, using the provided repo_root as reference.
+
+    Relative paths are resolved against `cwd` if provided, or the working directory of the process otherwise.
     """
     if (path[0] == "/"):
         # Absolute path alert!
@@ -27,7 +30,7 @@ def resolve_repo_to_abspath(
         )
     else:
         # Relative path Nothing to see here.
-        pass
+        path = bin.resolve_path(path, cwd=cwd)
 
     return os.path.abspath(
         path
@@ -65,6 +68,8 @@ class RepositoryPath():
     def abspath(
         self,
         path:str,
+        *,
+        cwd:str = None,
     )->str:
         """
         Resolve root paths e.g. /README.md in repos into local paths, using the provided self.root as reference.
@@ -72,6 +77,7 @@ class RepositoryPath():
         return resolve_repo_to_abspath(
             path,
             repo_root=self.root,
+            cwd=cwd,
         )
 
     def rendered(
@@ -104,6 +110,8 @@ class RepositoryPath():
     def parse(
         self,
         path:str,
+        *,
+        cwd:str = None,
     )->SimpleNamespace:
         """
         Proxy to bin.parse_markdown_path().
@@ -114,11 +122,45 @@ class RepositoryPath():
             rendered_folder     = self.repository.settings.paths.folder.rendered,
             source_index        = self.repository.settings.paths.index.source,
             source_folder       = self.repository.settings.paths.folder.source,
+            cwd                 = cwd,
         )
     
+    def classify(
+        self,
+        path:str,
+        *,
+        is_dir:bool = False,
+    )->SimpleNamespace:
+        """
+        Proxy to bin.classify_markdown_path(); does not touch the file system.
+        """
+        return bin.classify_markdown_path(
+            path=path,
+            is_dir              = is_dir,
+            rendered_index      = self.repository.settings.paths.index.rendered,
+            rendered_folder     = self.repository.settings.paths.folder.rendered,
+            source_index        = self.repository.settings.paths.index.source,
+            source_folder       = self.repository.settings.paths.folder.source,
+        )
+
+    def bootstrap(
+        self,
+        parsed:SimpleNamespace,
+    )->SimpleNamespace:
+        """
+        Proxy to bin.bootstrap_markdown_path().
+        """
+        return bin.bootstrap_markdown_path(
+            parsed,
+            rendered_folder     = self.repository.settings.paths.folder.rendered,
+            source_folder       = self.repository.settings.paths.folder.source,
+        )
+
     def prepare(
         self,
         path:str,
+        *,
+        cwd:str = None,
     )->SimpleNamespace:
         """
         Proxy to bin.prepare_markdown_path().
@@ -129,4 +171,5 @@ class RepositoryPath():
             rendered_folder     = self.repository.settings.paths.folder.rendered,
             source_index        = self.repository.settings.paths.index.source,
             source_folder       = self.repository.settings.paths.folder.source,
+            cwd                 = cwd,
         )
@@ -0,0 +1,41 @@
+import dataclasses
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+@dataclasses.dataclass(init=True, repr=True)
+class RenderResult():
+    """
+    Dataclass recording the outcome of saving a single rendered Markdown.
+
+    These are picklable, so worker processes can hand them back to the parent to be staged and reported.
+    """
+    path:str
+    rendered_path:str
+    size:int                = 0
+    dry_run:bool            = False
+
+    changed:Optional[bool]  = None      # `False` if the rendered file was identical to the one on disk, and had not been rewritten.
+    staged:Optional[bool]   = None      # `None` means staging had not been attempted.
+    error:Optional[str]     = None      # Description of the Exception, if saving had failed.
+
+    dependencies:List[str]  = dataclasses.field(default_factory=list)   # Absolute paths of all files read during the render.
+
+    @property
+    def key(self)->Tuple[str, str, bool]:
+        """
+        Identity of the result - the same file can be reported by multiple workers, e.g. `.footer`.
+        """
+        return (self.path, self.rendered_path, self.dry_run)
+
+    @property
+    def saved(self)->bool:
+        """
+        Return `True` if the rendered file on disk is up to date, whether it had been rewritten or not.
+        """
+        return not self.dry_run and self.error is None
+
+    @property
+    def stageable(self)->bool:
+        """
+        Return `True` if the rendered file had been rewritten and should be added to the repository.
+        """
+        return self.saved and self.changed is not False
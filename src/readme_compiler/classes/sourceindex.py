@@ -0,0 +1,185 @@
+"""
+# Source Index
+
+A JSON file recording the Markdown files discovered in a `RepositoryDirectory`, and how each of them is classified,
+so that the next run does not have to scan directories that had not changed.
+
+It is used as the cache of `walker.walk()`: each directory is recorded with its `mtime`, its subdirectories and
+its Markdown files. Adding, removing or renaming an entry updates the `mtime` of its directory, which is then scanned again.
+"""
+
+import os
+import json
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ..log import logger
+from ..settings.enums import MarkdownTemplateMode
+
+print = logger.debug
+
+SOURCE_INDEX_VERSION = 1
+
+Listing = Tuple[List[str], List[str], bool]     # Subdirectory names, file names, whether it has a .gitignore
+
+class SourceIndex():
+    """
+    Persistent record of the directories and Markdown sources of a `RepositoryDirectory`.
+
+    Use classmethod `load()`.
+    """
+    def __init__(
+        self,
+        path:str,
+        *,
+        root:str,
+        environment:Dict[str, Any]              = None,
+        directories:Dict[str, List[Any]]        = None,
+        sources:Dict[str, Dict[str, str]]       = None,
+    )->None:
+        self.path           = path
+        self.root           = root
+        self.environment    = environment if (isinstance(environment, dict)) else {}
+        self.directories    = directories if (isinstance(directories, dict)) else {}
+        self.sources        = sources if (isinstance(sources, dict)) else {}
+
+        # Directories and sources seen during this run; anything else is gone, and is dropped on `save()`.
+        self._visited:set = set()
+        self._classified:set = set()
+
+        self.hits   = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={repr(self.path)}, directories={len(self.directories):,}, sources={len(self.sources):,})"
+
+    @classmethod
+    def load(
+        cls:Type["SourceIndex"],
+        path:str,
+        *,
+        root:str,
+        environment:Dict[str, Any]  = None,
+    )->"SourceIndex":
+        """
+        Load the index at `path`.
+
+        If the file does not exist, is malformed, or was built in a different `environment`, an empty index is returned.
+        """
+        _index = cls(path, root=root, environment=environment)
+
+        try:
+            with open(path, "r") as _f:
+                _data = json.load(_f)
+
+            if (
+                _data.get("version", None) == SOURCE_INDEX_VERSION and \
+                _data.get("environment", None) == _index.environment
+            ):
+                _index.directories = _data.get("directories", {})
+                _index.sources = _data.get("sources", {})
+            else:
+                print (f"Source index {repr(path)} is out of date; all directories will be scanned.")
+
+        except (OSError, ValueError, AttributeError) as e:
+            print (f"Source index {repr(path)} cannot be loaded: {type(e).__name__}: {str(e)}")
+
+        return _index
+
+    def save(self)->None:
+        """
+        Write the index back to its file, forgetting the directories and sources that were not seen during this run.
+        """
+        if (self._visited):
+            self.directories = { _key:_value for _key, _value in self.directories.items() if (_key in self._visited) }
+            self.sources = { _key:_value for _key, _value in self.sources.items() if (_key in self._classified) }
+
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+            with open(self.path, "w") as _f:
+                json.dump(
+                    {
+                        "version":      SOURCE_INDEX_VERSION,
+                        "environment":  self.environment,
+                        "directories":  self.directories,
+                        "sources":      self.sources,
+                    },
+                    _f,
+                    indent=4,
+                    sort_keys=True,
+                )
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Source index {repr(self.path)} cannot be saved: {type(e).__name__}: {str(e)}")
+
+    def relpath(self, path:str)->str:
+        """
+        Key of `path` in the index, relative to the repository root.
+        """
+        return os.path.relpath(os.path.abspath(path), self.root)
+
+    def abspath(self, key:str)->str:
+        """
+        Reverse of `relpath()`.
+        """
+        return os.path.normpath(os.path.join(self.root, key))
+
+    def lookup(
+        self,
+        directory:str,
+        mtime:int,
+    )->Optional[Listing]:
+        """
+        Return the recorded listing of `directory` if its `mtime` had not changed, or `None` otherwise.
+        """
+        _key = self.relpath(directory)
+        _entry = self.directories.get(_key, None)
+
+        if (_entry and _entry[0] == mtime):
+            self._visited.add(_key)
+            self.hits += 1
+            return (_entry[1], _entry[2], _entry[3])
+
+        self.misses += 1
+        return None
+
+    def record(
+        self,
+        directory:str,
+        mtime:int,
+        subdirectories:List[str],
+        files:List[str],
+        has_gitignore:bool,
+    )->None:
+        """
+        Record a fresh listing of `directory`.
+        """
+        _key = self.relpath(directory)
+        self._visited.add(_key)
+        self.directories[_key] = [mtime, subdirectories, files, has_gitignore]
+
+    def classify(
+        self,
+        parsed:SimpleNamespace,
+    )->None:
+        """
+        Record the classification of a source, as returned by `RepositoryPath.classify()`.
+        """
+        _key = self.relpath(parsed.source)
+        self._classified.add(_key)
+        self.sources[_key] = {
+            "mode":     parsed.mode.name,
+            "rendered": self.relpath(parsed.rendered),
+        }
+
+    def classified(self)->Dict[str, SimpleNamespace]:
+        """
+        Return the recorded classification of every source, keyed by its absolute path.
+        """
+        return {
+            self.abspath(_key):SimpleNamespace(
+                mode        = MarkdownTemplateMode[_entry["mode"]],
+                source      = self.abspath(_key),
+                rendered    = self.abspath(_entry["rendered"]),
+            ) for _key, _entry in self.sources.items()
+        }
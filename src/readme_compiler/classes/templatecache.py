@@ -0,0 +1,264 @@
+"""
+# Template Cache
+
+LRU cache of compiled `MarkdownTemplate`s, keyed by the absolute path of their file and its `mtime` and size,
+so that a template used many times - e.g. `template.cls.md` by every `{% describe %}` of a class -
+is only read and parsed once, while any change to the file is still picked up.
+
+Compiled templates can also be kept across runs in a `TemplateStore`.
+"""
+
+import collections
+import functools
+import hashlib
+import importlib.util
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+import django
+
+from .. import settings
+from ..log import logger
+
+print = logger.debug
+
+class TemplateCache():
+    """
+    LRU cache of compiled templates, holding at most `maxsize` of them.
+    """
+    def __init__(
+        self,
+        maxsize:int             = None,
+        *,
+        store:"TemplateStore"   = None,
+    )->None:
+        self.maxsize = maxsize or settings.TEMPLATE_CACHE_SIZE
+
+        # Templates missing from the cache are looked up here before they are compiled.
+        self.store = store
+
+        self._templates:collections.OrderedDict = collections.OrderedDict()
+
+        # The current key of each path, so that outdated versions of a file are dropped straight away.
+        self._keys:Dict[str, Tuple[str, int, int]] = {}
+
+        self._lock = threading.RLock()
+
+        self.hits       = 0
+        self.misses     = 0
+        self.evictions  = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self._templates):,}, maxsize={self.maxsize:,}, hits={self.hits:,}, misses={self.misses:,})"
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def get(
+        self,
+        path:str,
+        loader:Callable[[str], Any],
+    )->Any:
+        """
+        Return the cached template of `path`, or load it with `loader(path)` and cache it
+        if it is not cached, or if the file had been modified since.
+
+        Raises `OSError` if `path` cannot be accessed.
+        """
+        path = os.path.abspath(path)
+
+        _stat = os.stat(path)
+        _key = (path, _stat.st_mtime_ns, _stat.st_size)
+
+        with self._lock:
+            if (_key in self._templates):
+                self._templates.move_to_end(_key)
+                self.hits += 1
+
+                return self._templates[_key]
+
+            self.misses += 1
+
+        _template = loader(path)
+
+        with self._lock:
+            # Drop the outdated version of this file, if any.
+            if ((_outdated := self._keys.get(path, None)) is not None):
+                self._templates.pop(_outdated, None)
+
+            self._templates[_key] = _template
+            self._keys[path] = _key
+
+            while (len(self._templates) > self.maxsize):
+                _evicted, _ = self._templates.popitem(last=False)
+                self._keys.pop(_evicted[0], None)
+                self.evictions += 1
+
+        return _template
+
+    def clear(self)->None:
+        """
+        Remove all templates from the cache; the statistics are kept.
+        """
+        with self._lock:
+            self._templates.clear()
+            self._keys.clear()
+
+    @property
+    def stats(self)->SimpleNamespace:
+        """
+        Hit, miss and eviction counts of the cache, with its current size.
+        """
+        return SimpleNamespace(
+            hits        = self.hits,
+            misses      = self.misses,
+            evictions   = self.evictions,
+            size        = len(self._templates),
+            maxsize     = self.maxsize,
+        )
+
+# Modules defining the template tags and filters that compiled templates refer to.
+TEMPLATE_LIBRARY_MODULES = (
+    "readme_compiler.django_setup",
+    "readme_compiler.filters",
+    "readme_compiler.templatetags",
+)
+
+@functools.lru_cache(maxsize=None)
+def library_digest()->str:
+    """
+    Return a digest of the template tag library, and of the versions of Django and Python that compiled templates are pickled with.
+
+    Compiled templates stored under a different digest are not loaded.
+    """
+    _hash = hashlib.sha1(f"django={django.__version__};python={sys.version};".encode("utf-8"))
+
+    for _name in TEMPLATE_LIBRARY_MODULES:
+        _spec = importlib.util.find_spec(_name)
+
+        with open(_spec.origin, "rb") as _f:
+            _hash.update(f"{_name}:".encode("utf-8") + hashlib.sha1(_f.read()).digest())
+
+    return _hash.hexdigest()
+
+class TemplateStore():
+    """
+    On-disk store of compiled templates, keyed by the SHA-1 of their source and the `library_digest()`,
+    so that unchanged templates do not have to be parsed again on the next run.
+
+    Each compiled template is pickled into `{directory}/{library digest}/{source digest}.pickle`;
+    directories of other library digests are removed the first time anything is stored.
+    """
+    def __init__(
+        self,
+        directory:str,
+    )->None:
+        self.directory = os.path.abspath(directory)
+
+        self._pruned = False
+
+        self.hits   = 0
+        self.misses = 0
+        self.stores = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directory={repr(self.directory)}, hits={self.hits:,}, misses={self.misses:,})"
+
+    def path(
+        self,
+        source:str,
+    )->str:
+        """
+        Return the path of the compiled template of `source`.
+        """
+        return os.path.join(
+            self.directory,
+            library_digest(),
+            hashlib.sha1(source.encode("utf-8")).hexdigest() + ".pickle",
+        )
+
+    def load(
+        self,
+        source:str,
+    )->Optional[Tuple[Any, Dict[str, Any]]]:
+        """
+        Return the stored `(nodelist, extra_data)` compiled from `source`, or `None` if it had not been stored.
+        """
+        _path = self.path(source)
+
+        try:
+            with open(_path, "rb") as _f:
+                _compiled = pickle.load(_f)
+
+            self.hits += 1
+            return _compiled
+
+        except (FileNotFoundError, ) as e:
+            pass
+        except (Exception, ) as e:
+            # Anything from a truncated file to a tag that no longer exists - compile it again.
+            print (f"Cannot load compiled template {repr(_path)}: {type(e).__name__}: {str(e)}")
+
+        self.misses += 1
+        return None
+
+    def save(
+        self,
+        source:str,
+        compiled:Tuple[Any, Dict[str, Any]],
+    )->None:
+        """
+        Store the `(nodelist, extra_data)` compiled from `source`.
+
+        Failures are logged and otherwise ignored; the template will simply be compiled again next time.
+        """
+        _path = self.path(source)
+
+        try:
+            if (not self._pruned):
+                self.prune()
+
+            os.makedirs(os.path.dirname(_path), exist_ok=True)
+
+            # Write to a temporary file first, so that other processes never load a partial file.
+            _fd, _temp = tempfile.mkstemp(dir=os.path.dirname(_path), suffix=".tmp")
+            try:
+                with os.fdopen(_fd, "wb") as _f:
+                    pickle.dump(compiled, _f, protocol=pickle.HIGHEST_PROTOCOL)
+
+                os.replace(_temp, _path)
+            except BaseException as e:
+                os.unlink(_temp)
+                raise
+
+            self.stores += 1
+
+        except (Exception, ) as e:
+            print (f"Cannot store compiled template {repr(_path)}: {type(e).__name__}: {str(e)}")
+
+    def prune(self)->None:
+        """
+        Remove the templates compiled by any other version of the template tag library.
+        """
+        self._pruned = True
+
+        try:
+            _entries = os.listdir(self.directory)
+        except (OSError, ) as e:
+            return
+
+        for _name in _entries:
+            if (_name != library_digest()):
+                shutil.rmtree(os.path.join(self.directory, _name), ignore_errors=True)
+
+    def clear(self)->None:
+        """
+        Remove all stored templates.
+        """
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,298 @@
+"""
+# Walker
+
+Discover files in a repository with `os.scandir`, without ever changing the working directory.
+
+Directories are pruned as early as possible - `.git`, any explicitly excluded paths,
+and anything ignored by the `.gitignore` files of the repository and `.git/info/exclude`.
+Files are yielded as soon as they are found, so that their consumers can start before the walk finishes.
+
+Directory listings can be cached across runs, e.g. by a `SourceIndex`; see `walk()`.
+"""
+
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from ..log import logger
+
+print = logger.debug
+
+class GitIgnore():
+    """
+    Patterns from a single `.gitignore`-style file, applying to paths below `base`.
+
+    Supports negation, directory-only patterns, anchoring and `**`, as described in `gitignore(5)`.
+    """
+    def __init__(
+        self,
+        base:str,
+        lines:Iterable[str],
+    )->None:
+        self.base = os.path.abspath(base)
+
+        # (compiled pattern, is negation, directory only)
+        self.rules:List[Tuple[re.Pattern, bool, bool]] = []
+
+        for _line in lines:
+            if (_rule := self.compile(_line)):
+                self.rules.append(_rule)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(base={repr(self.base)}, rules={len(self.rules):,})"
+
+    @classmethod
+    def from_file(
+        cls:Type["GitIgnore"],
+        path:str,
+        *,
+        base:str = None,
+    )->Optional["GitIgnore"]:
+        """
+        Read the patterns in `path`, applying to its directory unless `base` is provided.
+
+        Returns `None` if the file does not exist or has no patterns.
+        """
+        try:
+            with open(path, "r", errors="replace") as _f:
+                _ignore = cls(base or os.path.dirname(path), _f.read().splitlines())
+        except (OSError, ) as e:
+            return None
+
+        return _ignore if (_ignore.rules) else None
+
+    @staticmethod
+    def compile(
+        line:str,
+    )->Optional[Tuple[re.Pattern, bool, bool]]:
+        """
+        Compile a single line into a rule, or return `None` for blank lines and comments.
+        """
+        # Trailing spaces are ignored unless escaped.
+        line = re.sub(r"(?<!\\)\s+$", "", line)
+
+        if (not line or line.startswith("#")):
+            return None
+
+        _negate = line.startswith("!")
+        if (_negate):
+            line = line[1:]
+        elif (line.startswith("\\")):
+            line = line[1:]
+
+        _directory_only = line.endswith("/")
+        line = line.rstrip("/")
+
+        if (not line):
+            return None
+
+        # A slash anywhere but at the end anchors the pattern to the directory of the .gitignore.
+        _anchored = "/" in line
+        line = line.lstrip("/")
+
+        _regex = ""
+        _index = 0
+        while (_index < len(line)):
+            _char = line[_index]
+
+            if (line.startswith("**/", _index)):
+                _regex += "(?:.*/)?"
+                _index += 3
+                continue
+            elif (line.startswith("/**", _index) and _index + 3 == len(line)):
+                _regex += "/.*"
+                _index += 3
+                continue
+            elif (line.startswith("**", _index)):
+                _regex += ".*"
+                _index += 2
+                continue
+            elif (_char == "*"):
+                _regex += "[^/]*"
+            elif (_char == "?"):
+                _regex += "[^/]"
+            elif (_char == "\\" and _index + 1 < len(line)):
+                _index += 1
+                _regex += re.escape(line[_index])
+            elif (_char == "[" and (_end := line.find("]", _index + 2)) > 0):
+                _class = line[_index+1:_end]
+                if (_class.startswith("!")):
+                    _class = "^" + _class[1:]
+                _regex += f"[{_class}]"
+                _index = _end
+            else:
+                _regex += re.escape(_char)
+
+            _index += 1
+
+        if (not _anchored):
+            _regex = "(?:.*/)?" + _regex
+
+        try:
+            return (re.compile(_regex + r"\Z", re.DOTALL), _negate, _directory_only)
+        except (re.error, ) as e:
+            print (f"Ignoring invalid .gitignore pattern {repr(line)}: {str(e)}")
+            return None
+
+    def match(
+        self,
+        path:str,
+        is_dir:bool,
+    )->Optional[bool]:
+        """
+        Return `True` if `path` is ignored, `False` if it is explicitly re-included, or `None` if no pattern matches.
+        """
+        _relpath = os.path.relpath(path, self.base)
+
+        if (_relpath.startswith("..")):
+            return None
+
+        for _pattern, _negate, _directory_only in reversed(self.rules):
+            if (_directory_only and not is_dir):
+                continue
+
+            if (_pattern.match(_relpath)):
+                return not _negate
+
+        return None
+
+def is_ignored(
+    path:str,
+    is_dir:bool,
+    ignores:Iterable[GitIgnore],
+)->bool:
+    """
+    Check `path` against a stack of `GitIgnore`s, outermost first; deeper files take precedence.
+    """
+    for _ignore in reversed(list(ignores)):
+        _matched = _ignore.match(path, is_dir)
+
+        if (_matched is not None):
+            return _matched
+
+    return False
+
+def ancestor_ignores(
+    top:str,
+    root:str,
+)->List[GitIgnore]:
+    """
+    Return the `GitIgnore`s of the repository at `top` that apply to `root`, excluding the one in `root` itself.
+    """
+    top, root = os.path.abspath(top), os.path.abspath(root)
+
+    _ignores = [
+        GitIgnore.from_file(os.path.join(top, ".git", "info", "exclude"), base=top),
+    ]
+
+    _directory = top
+    _parts = os.path.relpath(root, top).split(os.sep) if (root != top) else []
+
+    for _part in _parts:
+        _ignores.append(GitIgnore.from_file(os.path.join(_directory, ".gitignore")))
+        _directory = os.path.join(_directory, _part)
+
+    return [ _ignore for _ignore in _ignores if (_ignore) ]
+
+def walk(
+    root:str,
+    *,
+    top:str                         = None,
+    match:Callable[[str], bool]     = None,
+    prune:Callable[[str], bool]     = None,
+    recursive:bool                  = True,
+    gitignore:bool                  = True,
+    cache:Any                       = None,
+)->Iterator[str]:
+    """
+    Yield the absolute paths of all files under `root` for which `match(name)` is `True`.
+
+    `.git` directories, and directories for which `prune(abspath)` is `True`, are not entered.
+    If `gitignore`, paths ignored by the `.gitignore`s between `top` - the repository root, defaulting to `root` - and each file
+    are skipped too.
+
+    If a `cache` is provided, e.g. a `SourceIndex`, directories whose `mtime` had not changed since they were recorded in it
+    are not scanned again. The cache is only valid for the same `match` and `prune`, so each should only be used with one of each.
+    """
+    root = os.path.abspath(root)
+
+    if (not recursive):
+        cache = None
+
+    _stack = [(root, ancestor_ignores(top or root, root) if (gitignore) else [])]
+
+    while (_stack):
+        _directory, _ignores = _stack.pop()
+
+        _listing = None
+
+        if (cache is not None):
+            try:
+                _mtime = os.stat(_directory).st_mtime_ns
+            except (OSError, ) as e:
+                continue
+
+            _listing = cache.lookup(_directory, _mtime)
+
+        if (_listing is None):
+            _listing = scan(_directory, match=match, prune=prune, recursive=recursive)
+
+            if (_listing is None):
+                continue
+            elif (cache is not None):
+                cache.record(_directory, _mtime, *_listing)
+
+        _subdirectories, _files, _has_gitignore = _listing
+
+        if (gitignore and _has_gitignore and (_ignore := GitIgnore.from_file(os.path.join(_directory, ".gitignore")))):
+            _ignores = _ignores + [_ignore, ]
+
+        for _name in _files:
+            _path = os.path.join(_directory, _name)
+
+            if (not (_ignores and is_ignored(_path, False, _ignores))):
+                yield _path
+
+        # Depth first, in alphabetical order.
+        _stack.extend(reversed([
+            (_path, _ignores) for _path in map(lambda name: os.path.join(_directory, name), _subdirectories) \
+                if (not (_ignores and is_ignored(_path, True, _ignores)))
+        ]))
+
+def scan(
+    directory:str,
+    *,
+    match:Callable[[str], bool]     = None,
+    prune:Callable[[str], bool]     = None,
+    recursive:bool                  = True,
+)->Optional[Tuple[List[str], List[str], bool]]:
+    """
+    List the names of the subdirectories to enter and the matching files in `directory`,
+    and whether it contains a `.gitignore`; or return `None` if it cannot be read.
+
+    `.gitignore` rules are not applied here, so that a cached listing stays valid when they change.
+    """
+    try:
+        with os.scandir(directory) as _iterator:
+            _entries = sorted(_iterator, key=lambda entry: entry.name)
+    except (OSError, ) as e:
+        print (f"Cannot scan {repr(directory)}: {type(e).__name__}: {str(e)}")
+        return None
+
+    _subdirectories, _files, _has_gitignore = [], [], False
+
+    for _entry in _entries:
+        try:
+            _is_dir = _entry.is_dir()
+        except (OSError, ) as e:
+            continue
+
+        if (_is_dir):
+            if (recursive and _entry.name != ".git" and not (prune and prune(_entry.path))):
+                _subdirectories.append(_entry.name)
+        elif (_entry.name == ".gitignore"):
+            _has_gitignore = True
+        elif (match is None or match(_entry.name)):
+            _files.append(_entry.name)
+
+    return (_subdirectories, _files, _has_gitignore)
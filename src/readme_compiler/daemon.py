@@ -0,0 +1,359 @@
+"""
+## Daemon Module
+
+A long-lived compile server, keeping Django, `black`, the described modules and every `RepositoryDirectory` warm between compiles.
+
+Clients connect to the unix socket at `socket_path()`, send a single JSON request on one line, e.g.
+```
+{"command": "compile", "root": "/path/to/repo", "changed": null, "jobs": 1, "force": false, "dry_run": false}
+```
+and receive the log of the compile as JSON lines of `{"log": "..."}`, followed by `{"success": true}` or `{"error": "..."}`.
+The other command is `{"command": "stop"}`, which shuts the daemon down.
+
+Requests are served one at a time. The client in `readme_compiler_client` only uses the standard library,
+so it does not pay for importing this package.
+
+Compiling imports the modules of the repository being compiled, so the daemon only serves its own user:
+the socket is only accessible to its owner, and lives in a directory that is only accessible to its owner by default;
+where the platform tells, clients running as any other user are turned away.
+Only repositories inside the `roots` the daemon was started for are compiled - the working directory it was started in by default.
+"""
+
+import json
+import logging
+import os, sys
+import socket
+import socketserver
+import stat
+import struct
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from . import settings
+from . import stdout
+from .classes import RepositoryDirectory, gitreader
+from .log import logger
+
+print = logger.debug
+
+def socket_path()->str:
+    """
+    Return the path of the daemon socket: `settings.DAEMON_SOCKET_LOCATION` if set,
+    otherwise `$README_COMPILER_SOCKET`, or a socket in the per-user `$XDG_RUNTIME_DIR`,
+    or in a per-user directory in the temporary directory.
+
+    `readme_compiler_client.socket_path()` must resolve to the same path.
+    """
+    return \
+        settings.DAEMON_SOCKET_LOCATION or \
+        os.environ.get("README_COMPILER_SOCKET", None) or \
+        os.path.join(
+            os.environ.get("XDG_RUNTIME_DIR", None) or os.path.join(tempfile.gettempdir(), f"readme-compiler-{os.getuid()}"),
+            "readme-compiler.sock",
+        )
+
+def private_directory(
+    path:str,
+)->str:
+    """
+    Create the directory `path` if it does not exist, accessible only to the current user.
+
+    Raises `PermissionError` if `path` already exists, but is not a directory owned by the current user and inaccessible to anyone else;
+    e.g. created by another user in a shared temporary directory in advance.
+    """
+    try:
+        os.mkdir(path, 0o700)
+    except (FileExistsError, ) as e:
+        pass
+
+    _stat = os.lstat(path)
+
+    if (
+        not stat.S_ISDIR(_stat.st_mode) or
+        _stat.st_uid != os.getuid() or
+        stat.S_IMODE(_stat.st_mode) & 0o077
+    ):
+        raise PermissionError(f"{repr(path)} must be a directory owned by the current user, and only accessible to them.")
+
+    return path
+
+class SocketLogHandler(logging.Handler):
+    """
+    `logging.Handler` streaming records to a client as JSON lines.
+    """
+    def __init__(
+        self,
+        stream:Any,
+    )->None:
+        super().__init__()
+        self.stream = stream
+
+    def emit(
+        self,
+        record:logging.LogRecord,
+    )->None:
+        try:
+            self.stream.write((json.dumps({"log": self.format(record)}) + "\n").encode("utf-8"))
+            self.stream.flush()
+        except (OSError, ValueError) as e:
+            # The client had gone away; carry on compiling anyway.
+            pass
+
+class CompileRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle a single request from a client.
+    """
+    server:"CompileDaemon"
+
+    def respond(
+        self,
+        **kwargs,
+    )->None:
+        try:
+            self.wfile.write((json.dumps(kwargs) + "\n").encode("utf-8"))
+        except (OSError, ) as e:
+            pass
+
+    def handle(self)->None:
+        try:
+            _request = json.loads(self.rfile.readline())
+        except (ValueError, ) as e:
+            return self.respond(error=f"Malformed request: {str(e)}")
+
+        _command = _request.get("command", "compile")
+
+        if (_command == "stop"):
+            self.respond(success=True)
+            self.server.stopping = True
+        elif (_command == "compile"):
+            _handler = SocketLogHandler(self.wfile)
+            logger.addHandler(_handler)
+
+            try:
+                _success = self.server.compile(
+                    _request["root"],
+                    changed     = _request.get("changed", None),
+                    jobs        = _request.get("jobs", None),
+                    incremental = not _request.get("force", False),
+                    dry_run     = _request.get("dry_run", False),
+                )
+            except (Exception, ) as e:
+                logger.removeHandler(_handler)
+                return self.respond(error=f"{type(e).__name__}: {str(e)}")
+
+            logger.removeHandler(_handler)
+            self.respond(success=_success)
+        else:
+            self.respond(error=f"Unknown command {repr(_command)}.")
+
+class CompileDaemon(socketserver.UnixStreamServer):
+    """
+    Unix socket server compiling `RepositoryDirectory`s on request.
+
+    Each `RepositoryDirectory` is kept between requests together with its render caches and `GitProperties`;
+    before each compile, the files its renders had read are checked, and any changed ones invalidated.
+
+    Only repositories inside `roots` are compiled; the current working directory by default.
+    """
+    def __init__(
+        self,
+        path:str            = None,
+        *,
+        roots:Iterable[str] = None,
+    )->None:
+        self.path = path or socket_path()
+        self.stopping = False
+
+        self.roots = [ os.path.realpath(_root) for _root in (roots or [os.getcwd(), ]) ]
+
+        if (not path and not settings.DAEMON_SOCKET_LOCATION and not os.environ.get("README_COMPILER_SOCKET", None)):
+            private_directory(os.path.dirname(self.path))
+
+        self.repositories:Dict[str, RepositoryDirectory] = {}
+
+        # Fingerprints of every file the renders of each repository depended on, as of the end of its last compile.
+        self._fingerprints:Dict[str, Dict[str, Any]] = {}
+
+        if (os.path.exists(self.path)):
+            # Left behind by a daemon that did not shut down cleanly.
+            os.unlink(self.path)
+
+        super().__init__(self.path, CompileRequestHandler)
+
+    def server_bind(self)->None:
+        # Bind with a restrictive umask, so that the socket is never accessible to anyone else, not even before the chmod.
+        _umask = os.umask(0o177)
+
+        try:
+            super().server_bind()
+        finally:
+            os.umask(_umask)
+
+        os.chmod(self.path, 0o600)
+
+    def verify_request(
+        self,
+        request:socket.socket,
+        client_address:Any,
+    )->bool:
+        """
+        Only serve clients running as the same user as the daemon, where the platform can tell.
+        """
+        if (not hasattr(socket, "SO_PEERCRED")):
+            # Not on Linux - the socket permissions have to do.
+            return True
+
+        _pid, _uid, _gid = struct.unpack("3i", request.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")))
+
+        if (_uid != os.getuid()):
+            logger.warning(f"Refused a request from user {_uid} (pid {_pid}).")
+            return False
+
+        return True
+
+    def allowed(
+        self,
+        root:str,
+    )->bool:
+        """
+        Return `True` if `root` is inside any of the `roots` this daemon serves.
+        """
+        _root = os.path.realpath(root)
+
+        return any(os.path.commonpath([_root, _allowed]) == _allowed for _allowed in self.roots)
+
+    def server_close(self)->None:
+        super().server_close()
+
+        if (os.path.exists(self.path)):
+            os.unlink(self.path)
+
+    @staticmethod
+    def head_path(
+        repository:RepositoryDirectory,
+    )->str:
+        """
+        Return the path of the `HEAD` of the repository, in its own git directory if it is a linked worktree.
+        """
+        try:
+            return os.path.join(gitreader.resolve_git_dir(repository.git.path), "HEAD")
+        except (OSError, gitreader.UnsupportedLayout) as e:
+            return os.path.join(repository.git.path, ".git", "HEAD")
+
+    def snapshot(
+        self,
+        repository:RepositoryDirectory,
+    )->Dict[str, Any]:
+        """
+        Fingerprint the `HEAD` of the repository, and every file its renders depended on.
+        """
+        _paths = {
+            self.head_path(repository),
+        }
+
+        for _dependencies in repository.dependencies.edges.values():
+            _paths.update(_dependencies)
+
+        return {
+            _path:(_stat.st_mtime_ns, _stat.st_size) if (_stat := _safe_stat(_path)) else None \
+                for _path in _paths
+        }
+
+    def repository(
+        self,
+        root:str,
+    )->RepositoryDirectory:
+        """
+        Return the `RepositoryDirectory` at `root`, ready to compile.
+
+        A new one is created on the first request, or if `HEAD` had moved, e.g. to a different branch;
+        otherwise the changed files are invalidated.
+
+        Raises `PermissionError` if `root` is not inside any of the `roots` of this daemon.
+        """
+        root = os.path.abspath(root)
+
+        if (not self.allowed(root)):
+            raise PermissionError(f"{repr(root)} is not inside any of the repositories this daemon serves: {', '.join(map(repr, self.roots))}.")
+        _repository = self.repositories.get(root, None)
+
+        if (_repository is not None):
+            _before = self._fingerprints.get(root, {})
+            _after = self.snapshot(_repository)
+
+            _changed = { _path for _path in _before if (_before[_path] != _after.get(_path, None)) }
+
+            if (_changed):
+                print (f"{len(_changed):,} files had changed in {repr(root)} since the last compile.")
+                _repository.invalidate(_changed)
+
+            if (self.head_path(_repository) in _changed):
+                _repository = None
+
+        if (_repository is None):
+            # Described modules are imported relative to the repository, as they would be by `python -m readme_compiler`.
+            if (root not in sys.path):
+                sys.path.insert(0, root)
+
+            _repository = self.repositories[root] = RepositoryDirectory(root)
+
+        return _repository
+
+    def compile(
+        self,
+        root:str,
+        *,
+        changed:Iterable[str]   = None,
+        jobs:Union[int, str]    = None,
+        incremental:bool        = True,
+        dry_run:bool            = False,
+    )->bool:
+        """
+        Compile the `RepositoryDirectory` at `root`; see `RepositoryDirectory.compile()`.
+        """
+        _repository = self.repository(root)
+
+        if (changed is not None):
+            changed = [ os.path.join(root, _path) for _path in changed ]  # No-op for absolute paths
+
+        try:
+            return _repository.compile(
+                changed     = changed,
+                jobs        = jobs,
+                incremental = incremental,
+                dry_run     = dry_run,
+            )
+        finally:
+            self._fingerprints[os.path.abspath(root)] = self.snapshot(_repository)
+
+    def serve(self)->None:
+        """
+        Serve requests until a client sends `stop`, or the process is interrupted.
+        """
+        logger.info(stdout.blue("readme-compiler") + f" daemon listening on {stdout.white(self.path)}.")
+
+        try:
+            while (not self.stopping):
+                self.handle_request()
+        except (KeyboardInterrupt, ) as e:
+            pass
+        finally:
+            self.server_close()
+
+        logger.info(stdout.blue("readme-compiler") + " daemon stopped.")
+
+def _safe_stat(path:str)->Optional[os.stat_result]:
+    try:
+        return os.stat(path)
+    except (OSError, ) as e:
+        return None
+
+def serve(
+    path:str            = None,
+    *,
+    roots:Iterable[str] = None,
+)->None:
+    """
+    Run a `CompileDaemon` on `path`, or `socket_path()` by default, serving the repositories inside `roots`.
+    """
+    CompileDaemon(path, roots=roots).serve()
@@ -0,0 +1,308 @@
+"""
+## Dependencies Module
+
+Record the files that are read while a Markdown is being rendered.
+
+Anything that reads a file on behalf of a render - loading a template, embedding a fragment, describing a module -
+calls `record()` with its path. The files are collected by the innermost active `DependencyRecorder`,
+which passes them on to its enclosing recorder when it exits, so an outer render also depends on everything its embeds read.
+
+Recorders are stored in a `contextvars.ContextVar`, so concurrent renders on different threads do not mix their records.
+
+The records of all renders are collected into a `DependencyGraph`,
+which answers which rendered files are affected when a fragment, template or module changes.
+"""
+
+import contextvars
+import inspect
+import json
+import os
+import sys
+from types import ModuleType, TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+_active_recorder:contextvars.ContextVar = contextvars.ContextVar("readme_compiler_dependency_recorder", default=None)
+
+class DependencyRecorder():
+    """
+    Context manager collecting all the paths recorded while it is active.
+    """
+    files:Set[str]
+
+    def __init__(self) -> None:
+        self.files  = set()
+        self.parent = None
+        self._token = None
+
+    def __enter__(self) -> "DependencyRecorder":
+        self.parent = _active_recorder.get()
+        self._token = _active_recorder.set(self)
+
+        return self
+
+    def __exit__(
+        self,
+        exception_type:Type[BaseException]  = None,
+        exception_message:BaseException     = None,
+        exception_traceback:TracebackType   = None,
+    ) -> bool:
+        _active_recorder.reset(self._token)
+
+        # Whatever we depend on, our parent depends on too.
+        if (self.parent is not None):
+            self.parent.add(*self.files)
+
+        return False
+
+    def add(
+        self,
+        *paths:str,
+    ) -> None:
+        """
+        Add absolute versions of `paths` to this recorder.
+        """
+        self.files.update(
+            os.path.abspath(_path) for _path in paths if _path
+        )
+
+def current() -> Optional[DependencyRecorder]:
+    """
+    Return the innermost active `DependencyRecorder`, i.e. that of the render in progress, if any.
+    """
+    return _active_recorder.get()
+
+def record(
+    *paths:str,
+) -> None:
+    """
+    Record `paths` as dependencies of the render in progress, if any.
+
+    Paths that do not exist can be recorded too - their creation will then invalidate the render.
+    """
+    if (_recorder := _active_recorder.get()):
+        _recorder.add(*paths)
+
+def module_files(
+    obj:Any,
+) -> Iterable[str]:
+    """
+    Return the source files of the module that `obj` belongs to.
+
+    If the module is a package, the files of all its loaded submodules are included too,
+    as describing a package typically goes through its children.
+    """
+    _module = obj if (isinstance(obj, ModuleType)) else inspect.getmodule(obj)
+
+    if (not isinstance(_module, ModuleType)):
+        return []
+
+    _modules = [_module, ]
+
+    if (hasattr(_module, "__path__")):
+        _prefix = _module.__name__ + "."
+        _modules += [
+            _submodule for _name, _submodule in list(sys.modules.items()) \
+                if (_name.startswith(_prefix) and isinstance(_submodule, ModuleType))
+        ]
+
+    return [
+        _file for _file in map(lambda module: getattr(module, "__file__", None), _modules) \
+            if (isinstance(_file, str))
+    ]
+
+def record_object(
+    obj:Any,
+) -> None:
+    """
+    Record the source files of the module that `obj` belongs to as dependencies of the render in progress, if any.
+    """
+    if (_active_recorder.get()):
+        record(*module_files(obj))
+
+class DependencyGraph():
+    """
+    Directed graph of the files each rendered source depends on.
+
+    Edges point from a source to every file that was read while rendering it,
+    including the source itself and everything read by its embeds;
+    so the graph is already transitively closed, and does not need to be traversed recursively.
+    """
+    def __init__(
+        self,
+        edges:Dict[str, Iterable[str]]  = None,
+        *,
+        root:str                        = None,
+    ) -> None:
+        """
+        Initialise a `DependencyGraph` from a `dict` of sources and their dependencies.
+
+        If `root` is provided, paths inside it will be exported relative to it.
+        """
+        self.root   = root
+        self.edges:Dict[str, Set[str]] = {}
+
+        # Reverse of `edges` - maps each dependency to all the sources that read it.
+        self._dependents:Dict[str, Set[str]] = {}
+
+        for _source, _dependencies in (edges or {}).items():
+            self.add(_source, _dependencies)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(sources={len(self.edges):,}, dependencies={len(self._dependents):,})"
+
+    def __contains__(self, source:str) -> bool:
+        return os.path.abspath(source) in self.edges
+
+    def add(
+        self,
+        source:str,
+        dependencies:Iterable[str],
+    ) -> None:
+        """
+        Set the dependencies of `source`, replacing any it had before.
+        """
+        source = os.path.abspath(source)
+
+        for _dependency in self.edges.get(source, ()):
+            self._dependents[_dependency].discard(source)
+
+        self.edges[source] = set(map(os.path.abspath, dependencies))
+
+        for _dependency in self.edges[source]:
+            self._dependents.setdefault(_dependency, set()).add(source)
+
+    def get(
+        self,
+        source:str,
+        default:Any = None,
+    ) -> Optional[Set[str]]:
+        """
+        Return the dependencies of `source`, or `default` if it had not been recorded.
+        """
+        return self.edges.get(os.path.abspath(source), default)
+
+    def dependents(
+        self,
+        path:str,
+    ) -> Set[str]:
+        """
+        Return all the sources that read `path` when they were rendered.
+        """
+        return set(self._dependents.get(os.path.abspath(path), ()))
+
+    def affected(
+        self,
+        paths:Iterable[str],
+    ) -> Set[str]:
+        """
+        Return all the sources that need to be rendered again if `paths` had changed.
+
+        Changed paths that had been rendered as sources themselves are included.
+        """
+        _affected = set()
+
+        for _path in map(os.path.abspath, paths):
+            _affected.update(self.dependents(_path))
+
+            if (_path in self.edges):
+                _affected.add(_path)
+
+        return _affected
+
+    def rebuild_counts(self) -> List[Tuple[str, int]]:
+        """
+        List every dependency with the number of other sources that depend on it, most depended-on first.
+
+        These are the files that cause the most rebuilds when they change.
+        """
+        return sorted(
+            (
+                (_dependency, len(_sources - {_dependency, })) \
+                    for _dependency, _sources in self._dependents.items()
+            ),
+            key = lambda item: (-item[1], item[0]),
+        )
+
+    def relpath(
+        self,
+        path:str,
+    ) -> str:
+        """
+        Return `path` relative to `root` if it is inside it, or absolute otherwise.
+        """
+        if (self.root):
+            _relpath = os.path.relpath(path, self.root)
+
+            if (not _relpath.startswith("..")):
+                return _relpath
+
+        return path
+
+    def as_dict(self) -> Dict[str, List[str]]:
+        """
+        Return the graph as a `dict` of sources and their sorted dependencies.
+        """
+        return {
+            self.relpath(_source):sorted(map(self.relpath, _dependencies)) \
+                for _source, _dependencies in sorted(self.edges.items())
+        }
+
+    def to_json(
+        self,
+        *,
+        indent:int = 4,
+    ) -> str:
+        """
+        Export the graph as JSON, together with the rebuild count of every dependency.
+        """
+        return json.dumps(
+            {
+                "sources":          self.as_dict(),
+                "rebuild_counts":   { self.relpath(_dependency):_count for _dependency, _count in self.rebuild_counts() },
+            },
+            indent = indent,
+        )
+
+    def to_dot(
+        self,
+        *,
+        name:str = "dependencies",
+    ) -> str:
+        """
+        Export the graph in Graphviz DOT language, with edges pointing from each dependency to its dependents.
+
+        Sources are drawn as boxes; dependencies are labelled with the number of sources they would rebuild.
+        """
+        _counts = dict(self.rebuild_counts())
+        _lines = [
+            f"digraph {json.dumps(name)} {{",
+            "    rankdir=LR;",
+        ]
+
+        for _path in sorted(set(self.edges) | set(self._dependents)):
+            _attributes = [f"label={json.dumps(self.relpath(_path) + (f' ({_counts[_path]})' if _counts.get(_path) else ''))}"]
+
+            if (_path in self.edges): _attributes.append("shape=box")
+
+            _lines.append(f"    {json.dumps(self.relpath(_path))} [{', '.join(_attributes)}];")
+
+        for _source, _dependencies in sorted(self.edges.items()):
+            for _dependency in sorted(_dependencies - {_source, }):
+                _lines.append(f"    {json.dumps(self.relpath(_dependency))} -> {json.dumps(self.relpath(_source))};")
+
+        _lines.append("}")
+
+        return "\n".join(_lines) + "\n"
+
+    def export(
+        self,
+        path:str,
+    ) -> None:
+        """
+        Write the graph to `path`: in DOT language if it ends with `.dot` or `.gv`, or as JSON otherwise.
+        """
+        with open(path, "w") as _f:
+            if (os.path.splitext(path)[1].lower() in (".dot", ".gv")):
+                _f.write(self.to_dot())
+            else:
+                _f.write(self.to_json())
@@ -9,6 +9,10 @@ see `_mapper.py` for the actual interface.
 
 
 from . import json_elements
+from . import ownership
+from . import sourcemap
+from . import registry
+from . import metadatastore
 
 from . import object
 from . import annotation
@@ -17,3 +21,4 @@ from . import parameter
 from . import cls
 from . import attribute
 from . import module
+from . import static
@@ -8,6 +8,7 @@ import builtins
 from typing import Any, Dict
 
 from .              import annotation   # For annotation.types
+from .              import registry
 
 from .object        import  ObjectDescription
 from .annotation    import  AnnotationDescription, \
@@ -51,18 +52,21 @@ class describe():
 
         Returns an instance of `ObjectDescription`, or one of its subclasses,
         having analysed its contents.
+
+        An object already described with the same `metadata` in the current render gets the same description back;
+        see `registry`.
         """
         
         if (isinstance(obj, CLASS_TYPES)):
-            return cls.type(obj, metadata=metadata)
+            return registry.get(cls.type, obj, metadata)
         elif (isinstance(obj, MODULE_TYPES)):
-            return cls.module(obj, metadata=metadata)
+            return registry.get(cls.module, obj, metadata)
         elif (isinstance(obj, FUNCTION_TYPES)):
-            return cls.function(obj, metadata=metadata)
+            return registry.get(cls.function, obj, metadata)
         elif (isinstance(obj, PARAMETER_TYPES)):
-            return cls.parameter(obj, metadata=metadata)
+            return registry.get(cls.parameter, obj, metadata)
         elif (isinstance(obj, ANNOTATION_TYPES)): # This includes `type` - cannot be placed above class.
-            return cls.annotation(obj, metadata=metadata)
+            return registry.get(cls.annotation, obj, metadata)
         else:
             # Fallback
-            return cls.object(obj, metadata=metadata)
\ No newline at end of file
+            return registry.get(cls.object, obj, metadata)
\ No newline at end of file
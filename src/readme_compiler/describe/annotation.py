@@ -10,6 +10,7 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, U
 from .. import stdout
 
 from . import exceptions
+from . import registry
 from .json_elements import JSONDescriptionCachedProperty, JSONDescriptionLRUCache, JSONDescriptionProperty
 from .object import ObjectDescription
 
@@ -229,7 +230,7 @@ class AnnotationDescription(ObjectDescription):
                 self.args = [ self.obj.__name__ ]
             else:
                 # Otherwise, give it the qualified name
-                self.args = [ ObjectDescription(self.obj).qualname ]
+                self.args = [ registry.get(ObjectDescription, self.obj).qualname ]
         
         else:
             # Really no clue what this is.
@@ -3,16 +3,17 @@ import inspect
 import re
 from types import ModuleType 
 import typing
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union, ForwardRef, get_origin, get_args, get_type_hints
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union, ForwardRef, get_origin, get_args
 
 
 from .json_elements import JSONDescriptionCachedProperty, JSONDescriptionLRUCache, JSONDescriptionProperty
-from .object import ObjectDescription
+from .object import ObjectDescription, getfile, get_type_hints
 from .annotation import PropertyType
 from .parameter import AnnotationDescription
 
 
 from . import exceptions
+from . import registry
 
 class AttributeDescription(ObjectDescription):
     """
@@ -80,7 +81,7 @@ class AttributeDescription(ObjectDescription):
         """
         return ".".join(
             (
-                ObjectDescription(self.parent).qualname,
+                registry.get(ObjectDescription, self.parent).qualname,
                 self.name,
             )
         )
@@ -176,7 +177,7 @@ class AttributeDescription(ObjectDescription):
                 if (issubclass(cls, PropertyDescription)): cls = AttributeDescription
 
                 try:
-                    _path = inspect.getfile(parent)
+                    _path = getfile(parent)
                 except TypeError as e:
                     _path = None
 
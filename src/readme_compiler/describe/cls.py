@@ -1,4 +1,5 @@
 import builtins
+import functools
 import inspect
 import re
 from types import   SimpleNamespace, \
@@ -15,6 +16,8 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, U
 
 from .. import stdout
 
+from . import registry
+
 from .json_elements import JSONDescriptionCachedProperty, JSONDescriptionLRUCache, JSONDescriptionProperty
 from .object import ObjectDescription
 from .function import FunctionDescription
@@ -167,8 +170,9 @@ class ClassDescription(ObjectDescription):
                                 if (self.named_methods_only is None) \
                                 else False
 
+        # Inherited methods are shared with the descriptions of the classes they came from.
         _method_descriptions = map(
-            FunctionDescription,
+            functools.partial(registry.get, FunctionDescription),
             self.functions
         )
 
@@ -24,4 +24,9 @@ class AttributeNotApplicable(FalseEvaluatingException, AttributeError):
 class ObjectDescriptionRequired(FalseEvaluatingException, TypeError):
     """
     Used by `DescriptionMetadata`, raised if a non-`ObjectDescription` instance is passed as parent.
-    """
\ No newline at end of file
+    """
+
+class StaticObjectNotCallable(FalseEvaluatingException, TypeError):
+    """
+    A function built from source code by the static backend was called; it only stands for the real function.
+    """
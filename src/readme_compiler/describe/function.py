@@ -1,4 +1,5 @@
 import inspect
+import keyword
 import re
 from types import (
     ModuleType,
@@ -12,6 +13,7 @@ from types import (
 import typing
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
 
+from .. import settings
 from .. import stdout
 
 from .json_elements import (
@@ -19,7 +21,7 @@ from .json_elements import (
     JSONDescriptionLRUCache,
     JSONDescriptionProperty,
 )
-from .object import ObjectDescription
+from .object import ObjectDescription, getmodule, getraises
 from .parameter import AnnotationDescription, ParameterDescription
 
 from .. import format
@@ -78,7 +80,7 @@ def isfunction(method: Callable) -> bool:
     """
     This look for the module of the method, and see if `module.method` is identical to method.
     """
-    _module = inspect.getmodule(method)
+    _module = getmodule(method)
 
     if isinstance(_module, ModuleType):
         return getattr(_module, method.__name__, None) is method
@@ -175,6 +177,190 @@ def signature(
     return _signature
 
 
+PLACEHOLDER_CODE = "__VOID_FUNCTION__()"
+
+
+def signature_stub(
+    obj: Callable,
+    *,
+    name:str     = None,
+) -> str:
+    """
+    Get the one-line stub of a callable, i.e. `def name(...): __VOID_FUNCTION__()`, to be formatted for `signature_source_code()`.
+    """
+    if (not name):      name = obj.__name__
+
+    _signature = signature(obj=obj, remove_self_cls=True)
+
+    return f"def {name}{_signature}: {PLACEHOLDER_CODE}"
+
+
+# Anything `black` would rewrite, reject or split in ways `render_signature_stub()` does not reproduce.
+NATIVE_UNSAFE_PATTERN = re.compile(r"[<>#'\\\n\t]|,\s*[)\]}]|\de\+|[^\x20-\x7e]")
+
+# Binary operators, around which `black` normalises the spacing, and which it splits lines at:
+# any `+`, `*`, `/`, `%` or `@` past the leading `*` or `**` of the parameter, which are stripped first, and any `-` following an operand.
+NATIVE_OPERATOR_PATTERN = re.compile(r"[+*/%@]|[\w.)\]}]\s*-")
+
+# Double quoted strings, whose contents are neither operators nor commas.
+NATIVE_QUOTED_PATTERN = re.compile(r'"[^"]*"')
+
+# Single quoted strings without any quotes or escapes inside, which `black` turns into double quoted ones.
+NATIVE_STRING_PATTERN = re.compile(r"(?<![\w'\"])(b?)'([^'\"\\\n]*)'")
+
+# Parameters without brackets or operators, which `black` leaves on one line however long they are.
+NATIVE_ATOMIC_PATTERN = re.compile(r"^(?:/|\*{1,2}|\*{0,2}[A-Za-z_]\w*(?:: [\w.]+)?(?:(?:=| = )(?:-?[\w.]+|\"[^\"]*\"))?)$")
+
+
+def signature_parts(
+    signature: inspect.Signature,
+) -> Tuple[List[str], Optional[str]]:
+    """
+    Split a signature into the `str` of each parameter, including the `/` and `*` separators, and of its return annotation;
+    exactly as they appear in `str(signature)`.
+    """
+    _parts = []
+    _render_pos_only_separator = False
+    _render_kw_only_separator = True
+
+    for _parameter in signature.parameters.values():
+        if _parameter.kind is inspect.Parameter.POSITIONAL_ONLY:
+            _render_pos_only_separator = True
+        elif _render_pos_only_separator:
+            _parts.append("/")
+            _render_pos_only_separator = False
+
+        if _parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            _render_kw_only_separator = False
+        elif (
+            _parameter.kind is inspect.Parameter.KEYWORD_ONLY
+            and _render_kw_only_separator
+        ):
+            _parts.append("*")
+            _render_kw_only_separator = False
+
+        _parts.append(str(_parameter))
+
+    if _render_pos_only_separator:
+        _parts.append("/")
+
+    if signature.return_annotation is inspect.Signature.empty:
+        _return = None
+    else:
+        _return = inspect.formatannotation(signature.return_annotation)
+
+    return _parts, _return
+
+
+def render_signature_stub(
+    name: str,
+    signature: inspect.Signature,
+    *,
+    line_length: int = format.SIGNATURE_MODE.line_length,
+) -> Optional[str]:
+    """
+    Lay out the `signature_stub()` of `signature` exactly as `format.format_signature()` would, without running `black`:
+    on one line if it fits, otherwise with the parameters on their own lines inside the brackets.
+
+    Returns `None` for anything it cannot guarantee to lay out the same as `black`, e.g. parameters that `black` would split further.
+    """
+
+    def _fits(line: str) -> bool:
+        return len(line) <= line_length
+
+    if not name.isidentifier() or keyword.iskeyword(name) or not name.isascii():
+        # e.g. `<lambda>`, which `black` cannot parse.
+        return None
+
+    _parts, _return = signature_parts(signature)
+
+    _normalised = []
+    for _part in _parts + ([_return] if _return is not None else []):
+        _part = NATIVE_STRING_PATTERN.sub(r'\1"\2"', _part)
+
+        if NATIVE_UNSAFE_PATTERN.search(_part):
+            return None
+
+        if _part != "/" and NATIVE_OPERATOR_PATTERN.search(
+            NATIVE_QUOTED_PATTERN.sub('""', _part.lstrip("*"))
+        ):
+            return None
+
+        _normalised.append(_part)
+
+    if _return is not None:
+        _parts, _return = _normalised[:-1], _normalised[-1]
+    else:
+        _parts = _normalised
+
+    _indent = " " * 4
+    _body = _indent + PLACEHOLDER_CODE + "\n"
+    _tail = ")" + (f" -> {_return}" if _return is not None else "") + ":"
+
+    _line = f"def {name}(" + ", ".join(_parts) + _tail
+    if _fits(_line) or (not _parts and _return is None):
+        return _line + "\n" + _body
+
+    if not _parts or not _fits(_tail):
+        # `black` splits the return annotation instead.
+        return None
+
+    if len(_parts) == 1:
+        if "," in NATIVE_QUOTED_PATTERN.sub('""', _parts[0]):
+            # `black` splits the brackets inside the parameter instead, without a trailing comma.
+            return None
+
+        # A single parameter is always given a trailing comma.
+        _lines = [_parts[0] + ","]
+    elif _fits(_indent + ", ".join(_parts)):
+        _lines = [", ".join(_parts)]
+    else:
+        # A trailing comma after `*`, `*args`, `**kwargs` needs Python 3.6, which `black` only assumes if `/` is used.
+        _trailing_comma = "/" in _parts or not any(
+            _part.startswith("*") for _part in _parts
+        )
+
+        _lines = [_part + "," for _part in _parts[:-1]]
+        _lines.append(_parts[-1] + ("," if _trailing_comma else ""))
+
+    for _param_line in _lines:
+        if not _fits(_indent + _param_line) and not NATIVE_ATOMIC_PATTERN.match(
+            _param_line.rstrip(",")
+        ):
+            return None
+
+    return (
+        f"def {name}(\n"
+        + "".join(_indent + _param_line + "\n" for _param_line in _lines)
+        + _tail
+        + "\n"
+        + _body
+    )
+
+
+def format_signature_stub(
+    obj: Callable,
+    *,
+    name: str = None,
+) -> str:
+    """
+    Format the `signature_stub()` of a callable, with the renderer chosen by `settings.SIGNATURE_RENDERER`.
+
+    The native renderer falls back to `black` for signatures it cannot lay out.
+    """
+    if (not name):      name = obj.__name__
+
+    if settings.SIGNATURE_RENDERER == "native":
+        _rendered = render_signature_stub(
+            name, signature(obj=obj, remove_self_cls=True)
+        )
+
+        if _rendered is not None:
+            return _rendered
+
+    return format.format_signature(signature_stub(obj, name=name))
+
+
 def signature_source_code(
     obj: Callable,
     *,
@@ -186,7 +372,6 @@ def signature_source_code(
 
     You can specify a name and qualname override; otherwise it will just use __name__ and __qualname__, which is at times not very intuitive.
     """
-    PLACEHOLDER_CODE = "__VOID_FUNCTION__()"
     PLACEHOLDER_PATTERN = re.compile(
         r":\s+" + re.escape(PLACEHOLDER_CODE) + r"\s*$", re.MULTILINE
     )
@@ -204,11 +389,7 @@ def signature_source_code(
     if (not name):      name = obj.__name__
     if (not qualname):  qualname = obj.__qualname__
 
-    _signature = signature(obj=obj, remove_self_cls=True)
-
-    _formatted_code = format.source_code(
-        f"def {name}{_signature}: {PLACEHOLDER_CODE}"
-    )
+    _formatted_code = format_signature_stub(obj, name=name)
 
     # Further transformations:
 
@@ -267,18 +448,8 @@ def raises(obj: Callable) -> List[str]:
     """
     Return a list of `str` names of `BaseException`s that are mentioned literally in the source code of the callable.
     """
-    RAISES_PATTERN = re.compile(
-        r"(?<=[:\n])\s*raise\s+(?P<exception_type>[A-Z][\w\._]+)\(", re.MULTILINE
-    )
-
-    _exceptions = []
-    for _raise in RAISES_PATTERN.finditer(inspect.getsource(obj)):
-        _type_name = _raise.group("exception_type")
-
-        # We can't actually resolve _type_name into the actual class because of different local and global contextes.
-        _exceptions.append(_type_name)
-
-    return _exceptions
+    # We can't actually resolve the names into the actual classes because of different local and global contextes.
+    return getraises(obj)
 
 
 class FunctionDescription(ObjectDescription):
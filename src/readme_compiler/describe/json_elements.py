@@ -7,11 +7,13 @@ import typing
 from typing import Any, Callable, Dict, Iterable, Optional
 
 
+import readme_compiler.dependencies as dependencies
 import readme_compiler.stdout as stdout
 
 
 import readme_compiler.describe as describe
 import readme_compiler.describe.exceptions as exceptions
+import readme_compiler.describe.metadatastore as metadatastore
 
 
 class JSONDescriptionElement():
@@ -61,8 +63,12 @@ class JSONDescriptionElement():
                     )
                 ):
                     # [ ObjectDescription(...), ObjectDescription(...), ... ]
-                    for _item in _return:
+                    for _index, _item in enumerate(_return):
                         if (isinstance(_item, describe.object.ObjectDescription)):
+                            # Descriptions from the registry are shared - change a copy instead.
+                            if (isinstance(_return, list)):
+                                _item = _return[_index] = describe.registry.detach(_item)
+
                             if (isinstance(_metadata_for_attr, dict)):
                                 _item.metadata = _metadata_for_attr.get(_item.name, None)
                             else:
@@ -144,8 +150,22 @@ class JSONDescriptionProperty(property, JSONDescriptionElement):
 class JSONDescriptionCachedProperty(functools.cached_property, JSONDescriptionElement):
     """
     Wrapper around `functools.cached_property`.
+
+    Whatever is recorded while the value is computed is kept by the registry for the description,
+    so that later renders reusing the cached value depend on it too.
     """
 
+    def __get__(
+        self,
+        instance:Any,
+        owner:type=None,
+    ) -> Any:
+        if (instance is None or self.attrname in vars(instance)):
+            return super().__get__(instance, owner)
+
+        with describe.registry.REGISTRY.track(instance):
+            return super().__get__(instance, owner)
+
 class JSONDescriptionLRUCache(JSONDescriptionElement):
     """
     Wrapper around `functools.lru_cache`.
@@ -352,6 +372,8 @@ class DescriptionMetadata(dict):
             with open(self.parent.metadata_path, "w") as _f:
                 json.dump(_return, _f, default=str, indent=4)
 
+            metadatastore.STORE.add(self.parent.metadata_path)
+
         except (TypeError, ) as e:
             # TypeError: Object of type ### is not JSON serializable
             # We can't do this Exception any better, it does not actually tell us what that object actually is
@@ -370,20 +392,22 @@ class DescriptionMetadata(dict):
         This is called automatically after a DescriptionMetadata instance is initialised.
         """
         if (self.parent.metadata_path):
+            # Record this even if it doesn't exist - adding a sidecar later should trigger a re-render.
+            dependencies.record(self.parent.metadata_path)
+
             try:
-                with open(self.parent.metadata_path, "r") as _f:
-                    _data = json.load(_f)
-                    
-                self.update(_data)
+                # Only opens the sidecar if it was listed in its directory.
+                _data = metadatastore.load(self.parent.metadata_path)
 
             except (json.JSONDecodeError, ) as e:
                 # TypeError: Object of type ### is not JSON serializable
                 # We can't do this Exception any better, it does not actually tell us what that object actually is
                 print (stdout.red(f"### Metadata file for {self.parent.qualname} is not well formatted JSON."))
                 raise e
-            
-            except (IOError, OSError, RuntimeError, IsADirectoryError) as e:
-                # print (stdout.yellow(f">>> No metadata file found for {self.parent.qualname}."))
-                pass
+
+            if (_data is not None):
+                self.update(_data)
+            # else:
+            #     print (stdout.yellow(f">>> No metadata file found for {self.parent.qualname}."))
 
         return self
\ No newline at end of file
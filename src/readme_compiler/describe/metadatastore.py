@@ -0,0 +1,236 @@
+"""
+## Metadata Store Module
+
+Index of the sidecar metadata files of descriptions, so that describing an object does not try to open a sidecar
+that, more often than not, does not exist.
+
+Each directory is listed once, the first time a sidecar in it is asked for, and only the sidecars listed are opened.
+Sidecars written by `DescriptionMetadata.export()` are added as they are written;
+any other changes to a directory are only picked up after `clear()`, which `RepositoryDirectory.invalidate()` does.
+
+If `settings.README_METADATA_CONSOLIDATED` is set, the metadata of all the objects in a directory can be kept in a single file of that name instead,
+as a JSON object by the file names of their sidecars; see `consolidate()`.
+Sidecars are still read and written as before, and take precedence over the consolidated file.
+
+Use `load()`.
+"""
+
+import copy
+import fnmatch
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from .. import dependencies
+from .. import settings
+
+from ..log import logger
+
+print = logger.debug
+
+class MetadataStore():
+    """
+    Index of the metadata files in each directory asked so far, with the contents of their consolidated files.
+    """
+    def __init__(self)->None:
+        self._lock = threading.RLock()
+
+        # Directory => names of the files in it.
+        self._listings:Dict[str, Set[str]] = {}
+
+        # Path of a consolidated file => its metadata by sidecar name.
+        self._consolidated:Dict[str, Dict[str, Any]] = {}
+
+        self.opened     = 0
+        self.skipped    = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(directories={len(self._listings):,}, opened={self.opened:,}, skipped={self.skipped:,})"
+
+    def listing(
+        self,
+        directory:str,
+    )->Set[str]:
+        """
+        Return the names of the files in `directory`, listing it if it had not been yet; empty if it does not exist.
+        """
+        with self._lock:
+            if ((_names := self._listings.get(directory, None)) is not None):
+                return _names
+
+        try:
+            with os.scandir(directory) as _entries:
+                _names = { _entry.name for _entry in _entries if (_entry.is_file()) }
+        except (OSError, ) as e:
+            # FileNotFoundError, NotADirectoryError etc - nothing to read.
+            _names = set()
+
+        with self._lock:
+            return self._listings.setdefault(directory, _names)
+
+    def exists(
+        self,
+        path:str,
+    )->bool:
+        """
+        Return `True` if `path` was found by the listing of its directory.
+        """
+        _directory, _name = os.path.split(os.path.abspath(path))
+
+        return _name in self.listing(_directory)
+
+    @staticmethod
+    def consolidated_path(
+        directory:str,
+    )->Optional[str]:
+        """
+        Return the path of the consolidated metadata file of `directory`, or `None` if `settings.README_METADATA_CONSOLIDATED` is not set.
+        """
+        if (not settings.README_METADATA_CONSOLIDATED):
+            return None
+
+        return os.path.join(directory, settings.README_METADATA_CONSOLIDATED)
+
+    def consolidated(
+        self,
+        directory:str,
+    )->Dict[str, Any]:
+        """
+        Return the metadata in the consolidated file of `directory` by sidecar name; empty if there is none.
+
+        Raises `json.JSONDecodeError` if the file is not well formatted.
+        """
+        if ((_path := self.consolidated_path(directory)) is None):
+            return {}
+
+        with self._lock:
+            if ((_metadata := self._consolidated.get(_path, None)) is not None):
+                return _metadata
+
+        _metadata = {}
+
+        if (self.exists(_path)):
+            try:
+                with open(_path, "r") as _f:
+                    _metadata = json.load(_f)
+
+            except (json.JSONDecodeError, ) as e:
+                logger.warning(f"Consolidated metadata file {_path} is not well formatted JSON.")
+                raise e
+
+            except (OSError, ) as e:
+                pass
+
+            if (not isinstance(_metadata, dict)):
+                logger.warning(f"Consolidated metadata file {_path} does not contain a JSON object; ignored.")
+                _metadata = {}
+
+        with self._lock:
+            return self._consolidated.setdefault(_path, _metadata)
+
+    def load(
+        self,
+        path:str,
+    )->Optional[Dict[str, Any]]:
+        """
+        Return the metadata in the sidecar at `path`, or its entry in the consolidated file of its directory;
+        `None` if there is neither.
+
+        The consolidated file is recorded as a dependency of the render in progress, if it is enabled;
+        recording the sidecar itself is left to the caller.
+
+        Raises `json.JSONDecodeError` if the file read is not well formatted.
+        """
+        _path = os.path.abspath(path)
+        _directory, _name = os.path.split(_path)
+
+        if (_name in self.listing(_directory)):
+            try:
+                with open(_path, "r") as _f:
+                    _data = json.load(_f)
+
+                self.opened += 1
+                return _data
+            except (OSError, ) as e:
+                # Removed since the directory was listed.
+                pass
+
+        self.skipped += 1
+
+        if ((_consolidated_path := self.consolidated_path(_directory)) is not None):
+            # Creating the consolidated file later should trigger a re-render too.
+            dependencies.record(_consolidated_path)
+
+            if ((_data := self.consolidated(_directory).get(_name, None)) is not None):
+                # Callers are free to change what they get.
+                return copy.deepcopy(_data)
+
+        return None
+
+    def add(
+        self,
+        path:str,
+    )->None:
+        """
+        Add `path` to the listing of its directory, after it had been written.
+        """
+        _directory, _name = os.path.split(os.path.abspath(path))
+
+        with self._lock:
+            if ((_names := self._listings.get(_directory, None)) is not None):
+                _names.add(_name)
+
+            # A consolidated file that was written is read again on next use.
+            self._consolidated.pop(os.path.join(_directory, _name), None)
+
+    def consolidate(
+        self,
+        directory:str,
+    )->Optional[str]:
+        """
+        Gather the metadata of all the sidecars in `directory` into its consolidated file, on top of what it had already;
+        the sidecars are left in place.
+
+        Returns the path of the consolidated file, or `None` if `settings.README_METADATA_CONSOLIDATED` is not set.
+        """
+        _directory = os.path.abspath(directory)
+
+        if ((_path := self.consolidated_path(_directory)) is None):
+            return None
+
+        _pattern = settings.README_METADATA_DIRECTORY.format(descriptor="*", qualname="*")
+        _metadata = dict(self.consolidated(_directory))
+
+        for _name in sorted(self.listing(_directory)):
+            if (fnmatch.fnmatch(_name, _pattern) and (_data := self.load(os.path.join(_directory, _name))) is not None):
+                _metadata[_name] = _data
+
+        with open(_path, "w") as _f:
+            json.dump(_metadata, _f, default=str, indent=4)
+
+        self.add(_path)
+
+        return _path
+
+    def clear(self)->None:
+        """
+        Forget all listings and consolidated files; directories are listed again on next use.
+        """
+        with self._lock:
+            self._listings      = {}
+            self._consolidated  = {}
+
+STORE = MetadataStore()
+
+def load(path:str)->Optional[Dict[str, Any]]:
+    """
+    Return the metadata of the sidecar at `path` from the shared `MetadataStore`, or `None` if there is none.
+    """
+    return STORE.load(path)
+
+def clear()->None:
+    """
+    Forget all directories listed so far.
+    """
+    STORE.clear()
@@ -2,14 +2,17 @@ import os, sys
 
 import abc
 import builtins
+import dataclasses
 import functools
 import inspect
 import re
+import weakref
 
 from types import ModuleType, MethodType, MethodWrapperType, FunctionType, TracebackType, FrameType, CodeType, SimpleNamespace
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union, get_origin, get_args
 import typing
 
+from .. import dependencies
 from .. import settings
 from .. import stdout
 from .. import format
@@ -17,6 +20,8 @@ from .. import format
 from ..log import logger
 
 from . import exceptions
+from . import ownership
+from . import sourcemap
 from .json_elements import  JSONDescriptionElement, \
                             JSONDescriptionCachedProperty, \
                             JSONDescriptionLRUCache, \
@@ -31,65 +36,350 @@ ATTRIBUTE_BLACKLIST = (
     "do_not_call_in_templates",
 )
 
-def tidy_annotations(obj:Any):
+def getmodule(obj:Any) -> Optional[ModuleType]:
     """
-    This aims to fix `|` in annotations that are not resolved.
-    The object is changed in place.
+    Replacement of `inspect.getmodule` that also knows the modules of objects built by the static backend,
+    which are never imported into `sys.modules`.
 
-    This enables get_type_hints to not error against 'bool | None' etc.
+    Anything else is looked up in `ownership.INDEX`, rather than by scanning `sys.modules` for its file.
     """
-    _annotations = getattr(obj, "__annotations__", None)
+    if ((_origin := describe.static.origin(obj)) is not None):
+        return _origin.module
 
-    if (_annotations is None): return
+    return ownership.getmodule(obj)
 
-    _substitutes = {}
+def getfile(obj:Any) -> str:
+    """
+    Wrapper around `inspect.getfile` that also knows the files of objects built by the static backend.
+    """
+    if ((_origin := describe.static.origin(obj)) is not None):
+        return _origin.path
+
+    return inspect.getfile(obj)
+
+def getfiles(obj:Any) -> List[str]:
+    """
+    Return the source files that define `obj`: that of its module, and for classes, those of every class in its MRO,
+    whose members are described along with it.
+    """
+    _files = []
+
+    for _obj in (obj.__mro__ if (isinstance(obj, type)) else (obj, )):
+        _file = getattr(getmodule(_obj), "__file__", None)
+
+        if (isinstance(_file, str) and _file not in _files):
+            _files.append(_file)
+
+    return _files
+
+def getsource(obj:Any) -> str:
+    """
+    Replacement of `inspect.getsource` that looks the source code up in `sourcemap`,
+    and also knows the source code of objects built by the static backend.
+    """
+    if ((_origin := describe.static.origin(obj)) is not None):
+        return _origin.source
+
+    return sourcemap.getsource(obj)
+
+def getcomments(obj:Any) -> Optional[str]:
+    """
+    Replacement of `inspect.getcomments` that looks the comments up in `sourcemap`,
+    and also knows the comments of objects built by the static backend.
+    """
+    if ((_origin := describe.static.origin(obj)) is not None):
+        return _origin.comments
+
+    return sourcemap.getcomments(obj)
+
+def getraises(obj:Any) -> List[str]:
+    """
+    Names of the exceptions mentioned literally in `raise` statements in the source code of `obj`, from `sourcemap`,
+    or from the static backend.
+    """
+    if ((_origin := describe.static.origin(obj)) is not None):
+        return _origin.raises
+
+    return sourcemap.getraises(obj)
 
-    def _try_load(type_hint:str):
+def getdoc(obj:Any) -> Optional[str]:
+    """
+    Wrapper around `inspect.getdoc` that also finds the inherited docstrings of objects built by the static backend.
+    """
+    if (describe.static.origin(obj) is not None):
+        return describe.static.getdoc(obj)
+
+    return inspect.getdoc(obj)
+
+def isdunder(name:str) -> bool:
+    """
+    Return `True` if `name` is a `__double_underscore__` name.
+    """
+    return \
+        name.startswith("__") and \
+        name.endswith("__") and \
+        len(name)>4
+
+def issunder(name:str) -> bool:
+    """
+    Return `True` if `name` is a `_single_underscore` name.
+    """
+    return \
+        name.startswith("_") and \
+        len(name)>1 and \
+        name[1]!="_"
+
+# Kinds of members, tested in this order; anything else is an "attribute".
+MEMBER_KINDS = (
+    ("module",      (ModuleType, )),
+    ("class",       (type, )),
+    ("function",    (FunctionType, MethodType, MethodWrapperType, )),
+)
+
+@dataclasses.dataclass(init=True, repr=True)
+class Member():
+    """
+    A member of a described object, classified once by `ObjectDescription.members`.
+    """
+    name:str
+    value:Any
+    kind:str                # One of `MEMBER_KINDS`, "attribute", or "missing" if it cannot be retrieved.
+    dunder:bool
+    sunder:bool
+    isproperty:bool
+
+    @classmethod
+    def classify(
+        cls:Type["Member"],
+        obj:Any,
+        name:str,
+    ) -> "Member":
+        """
+        Retrieve and classify the member `name` of `obj`.
+        """
         try:
-            eval(type_hint, globals(), locals())
-            return True
-        except NameError as e:
-            return False
-
-    if (_annotations):
-        for _key, _value in zip(_annotations.keys(), _annotations.values()):
-            if (isinstance(_value, str)):
-                if ("|" in _value):
-                    _type_hints = tuple([ _type_hint.strip() for _type_hint in _value.split("|") ])
-
-                    # After all that, there could still be weird type references further up the MRO that we do not have access to. In that case, make them `Any`.
-                    if (
-                        all(
-                            map(
-                                _try_load,
-                                _type_hints,
-                            )
-                        )
-                    ):
-                        _substitutes[_key] = Union.__getitem__(
-                            _type_hints
-                        )
-                    else:
-                        _substitutes[_key] = Any
-                else:
-                    if (not _try_load(_value)):
-                        _substitutes[_key] = Any
+            _value = getattr(obj, name)
+        except (Exception, ) as e:
+            # e.g. `type.__abstractmethods__`, which is listed by `dir()` but raises `AttributeError`.
+            print (f"Cannot get member {repr(name)} of {repr(obj)}: {type(e).__name__}: {str(e)}")
+            _value = inspect._empty
+            _kind = "missing"
+        else:
+            _kind = next(
+                (_kind for _kind, _types in MEMBER_KINDS if (isinstance(_value, _types))),
+                "attribute",
+            )
+
+        return cls(
+            name        = name,
+            value       = _value,
+            kind        = _kind,
+            dunder      = isdunder(name),
+            sunder      = issunder(name),
+            isproperty  = isinstance(_value, (property, functools.cached_property)),
+        )
 
-    if (_substitutes):
-        _annotations.update(_substitutes)
+    @functools.cached_property
+    def module(self) -> Optional[ModuleType]:
+        """
+        The module that the value came from, if any.
+        """
+        return getmodule(self.value)
 
-def get_type_hints(obj:Any):
+@dataclasses.dataclass(init=True, repr=True, frozen=True)
+class DescriptionField():
     """
-    Wrapper around `typing.get_type_hints` to get around "|" in type hints causing `TypeError`.
+    A `JSONDescriptionElement` of a description class, exported by `as_dict` and `as_export_dict`.
     """
-    tidy_annotations(obj)
+    name:str
+    element:JSONDescriptionElement
+    metadata_override:bool
+
+    @classmethod
+    def schema(
+        cls:Type["DescriptionField"],
+        description_type:type,
+    ) -> Dict[str, "DescriptionField"]:
+        """
+        Find all the fields of `description_type`, by name in the order of `dir()`.
+        """
+        return {
+            _name:cls(
+                name                = _name,
+                element             = _element,
+                metadata_override   = _element.metadata_override,
+            ) \
+                for _name in dir(description_type) \
+                    if (isinstance(_element := getattr(description_type, _name, None), JSONDescriptionElement)) # From the class - otherwise `property`s would have returned the VALUE instead of itself!
+        }
+
+    @property
+    def iscallable(self) -> bool:
+        """
+        `True` if the field is a `JSONDescriptionLRUCache`, which has to be called for its value.
+        """
+        return isinstance(self.element, JSONDescriptionLRUCache)
+
+    def get(
+        self,
+        description:"ObjectDescription",
+    ) -> Any:
+        """
+        Return the value of this field of `description`.
+        """
+        _value = getattr(description, self.name)
+
+        if (self.iscallable):
+            return _value()
+
+        return _value
+
+# Resolved type hints of every object asked so far; see `get_type_hints()`.
+TYPE_HINTS:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Returned by `_resolve_annotation()` for annotations that cannot be resolved.
+_UNRESOLVED = object()
+
+def split_union(annotation:str) -> List[str]:
+    """
+    Split a string annotation at each `|` that is not inside brackets or quotes, e.g. `"Dict[str, int | None] | None"` into two parts.
+    """
+    _parts = []
+    _depth = 0
+    _quote = None
+    _start = 0
+
+    for _pos, _char in enumerate(annotation):
+        if (_quote):
+            if (_char == _quote): _quote = None
+        elif (_char in "\'\""):
+            _quote = _char
+        elif (_char in "([{"):
+            _depth += 1
+        elif (_char in ")]}"):
+            _depth -= 1
+        elif (_char == "|" and not _depth):
+            _parts.append(annotation[_start:_pos].strip())
+            _start = _pos+1
+
+    _parts.append(annotation[_start:].strip())
+
+    return _parts
+
+def _resolve_annotation(
+    annotation:Any,
+    globalns:Dict[str, Any],
+    localns:Dict[str, Any],
+) -> Any:
+    """
+    Evaluate `annotation` as `typing.get_type_hints` would, returning `_UNRESOLVED` if it cannot be.
+
+    `|` unions that the running version of Python cannot evaluate, e.g. `"bool | None"` before 3.10 or with a string on either side,
+    are evaluated one member at a time and turned into a `Union`.
+    """
+    if (annotation is None):
+        return type(None)
+
+    try:
+        if (isinstance(annotation, str)):
+            annotation = eval(annotation, globalns, localns)
+
+            if (annotation is None):
+                return type(None)
+
+        # Anything nested, e.g. `List["MyClass"]`.
+        return typing._eval_type(annotation, globalns, localns)
+
+    except (Exception, ) as e:
+        pass
+
+    if (
+        isinstance(annotation, str) and \
+        len(_parts := split_union(annotation)) > 1
+    ):
+        _members = tuple(
+            _resolve_annotation(_part, globalns, localns) \
+                for _part in _parts
+        )
+
+        if (_UNRESOLVED not in _members):
+            return Union.__getitem__(_members)
+
+    return _UNRESOLVED
+
+def resolve_type_hints(obj:Any) -> Dict[str, Any]:
+    """
+    Resolve the type hints of `obj` in the namespaces of the modules that define them, without caching.
+
+    Annotations that cannot be resolved become `Any`, instead of raising like `typing.get_type_hints` does.
+    """
+    _hints = {}
 
     if (isinstance(obj, type)):
-        for base in reversed(obj.__mro__):
-            tidy_annotations(base)
-            
-    return typing.get_type_hints(obj)
-    
+        for _base in reversed(obj.__mro__):
+            _annotations = _base.__dict__.get("__annotations__", {})
+
+            if (not isinstance(_annotations, dict) or not _annotations):
+                continue
+
+            # Same as `typing.get_type_hints`: names in the class body take precedence over those of its module.
+            _module = getmodule(_base)
+            _globalns = dict(vars(_base))
+            _localns = vars(_module) if (_module is not None) else {}
+
+            for _name, _annotation in _annotations.items():
+                _hints[_name] = _resolve_annotation(_annotation, _globalns, _localns)
+
+    else:
+        _annotations = getattr(obj, "__annotations__", None)
+
+        if (_annotations is None):
+            if (isinstance(obj, typing._allowed_types)):
+                return {}
+
+            raise TypeError(f"{obj!r} is not a module, class, method, or function.")
+
+        if (isinstance(obj, ModuleType)):
+            _globalns = vars(obj)
+        else:
+            _globalns = getattr(inspect.unwrap(obj), "__globals__", None)
+
+            if (_globalns is None):
+                _module = getmodule(obj)
+                _globalns = vars(_module) if (_module is not None) else {}
+
+        for _name, _annotation in _annotations.items():
+            _hints[_name] = _resolve_annotation(_annotation, _globalns, None)
+
+    _strip = getattr(typing, "_strip_annotations", lambda annotation: annotation)
+
+    return {
+        _name:(_strip(_hint) if (_hint is not _UNRESOLVED) else Any) \
+            for _name, _hint in _hints.items()
+    }
+
+def get_type_hints(obj:Any) -> Dict[str, Any]:
+    """
+    Memoized `resolve_type_hints()`, in place of `typing.get_type_hints` which cannot cope with `|` and unresolvable names.
+
+    Each object is only resolved once; the returned `dict` is shared, and must not be modified.
+    """
+    try:
+        return TYPE_HINTS[obj]
+    except (KeyError, ) as e:
+        pass
+    except (TypeError, ) as e:
+        # Not hashable or not weakly referenceable - resolve it every time.
+        return resolve_type_hints(obj)
+
+    _hints = resolve_type_hints(obj)
+
+    try:
+        TYPE_HINTS[obj] = _hints
+    except (TypeError, ) as e:
+        pass
+
+    return _hints
 
 class ObjectDescription():
     """
@@ -97,6 +387,14 @@ class ObjectDescription():
     """
     obj:object
 
+    # The fields of each class, by name in the order of `dir()`; found once when the class is created, see `__init_subclass__()`.
+    schema:Dict[str, DescriptionField]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls.schema = DescriptionField.schema(cls)
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.qualname})"
 
@@ -121,9 +419,14 @@ class ObjectDescription():
         # - there is this hidden flag in the source code that allows you to skip it.
         try:
             self.obj.do_not_call_in_templates = True
-        except AttributeError as e:
+        except (AttributeError, TypeError) as e:
+            # TypeError: cannot set 'do_not_call_in_templates' attribute of immutable type 'type'
             pass
-        
+
+        # Whatever is described, e.g. a base class in another module, changes the rendered text with its source code.
+        if (dependencies.current() is not None):
+            dependencies.record(*getfiles(obj))
+
         self.metadata = metadata
 
     @JSONDescriptionProperty
@@ -172,7 +475,7 @@ class ObjectDescription():
     @JSONDescriptionCachedProperty
     def path(self) -> str:
         try:
-            return inspect.getfile(self.obj)
+            return getfile(self.obj)
         except (TypeError, ) as e:
             # TypeError: <class 'module'> is a built-in class
             # This will happen because `.type_description` exists, and `builtins.module` will be queried sooner or later.
@@ -256,7 +559,7 @@ class ObjectDescription():
                 str
             )
         ):
-            _doc = inspect.getdoc(self.obj)
+            _doc = getdoc(self.obj)
 
         return format.split_title(
             _doc
@@ -264,12 +567,12 @@ class ObjectDescription():
 
     @JSONDescriptionCachedProperty.with_metadata_override
     def comments(self) -> Union[str, None]:
-        return inspect.getcomments(self.obj)
+        return getcomments(self.obj)
 
     @JSONDescriptionCachedProperty
     def source(self) -> str:
         try:
-            return inspect.getsource(self.obj)
+            return getsource(self.obj)
         except (OSError, ) as e:
             # OSError: could not find class definition
             return "**No Source Code Available**"
@@ -289,21 +592,69 @@ class ObjectDescription():
             )) or \
             getattr(self.obj, "__isabstractmethod__", False) # check if @abc.abstractmethod has done something to the function.
 
-    @property
-    def as_dict(self) -> Dict[str, str]:
+    def select(
+        self,
+        fields:Iterable[str] = None,
+        *,
+        exclude:Iterable[str] = (),
+        metadata_override:bool = False,
+    ) -> List[DescriptionField]:
         """
-        Return all representations of this object as a dictionary.
+        Return the fields in `schema` named in `fields`, or all of them, except those in `exclude`;
+        if `metadata_override`, only those that can be overridden by metadata.
+
+        Raises `AttributeNotApplicable` if any of `fields` or `exclude` is not a field of this class.
+        """
+        _schema = type(self).schema
+        _fields = list(_schema) if (fields is None) else list(fields)
+        _exclude = set(exclude)
+
+        if (_unknown := [ _name for _name in (*_fields, *_exclude) if (_name not in _schema) ]):
+            raise exceptions.AttributeNotApplicable(
+                f"{type(self).__name__} has no fields {', '.join(map(repr, _unknown))}."
+            )
+
+        return [
+            _field for _field in map(_schema.__getitem__, _fields) \
+                if (
+                    _field.name not in _exclude and \
+                    (_field.metadata_override or not metadata_override)
+                )
+        ]
+
+    def to_dict(
+        self,
+        fields:Iterable[str] = None,
+        *,
+        exclude:Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """
+        Return the representations of this object in `fields`, or all of them except those in `exclude`, as a dictionary.
+
+        e.g. `to_dict(exclude=["source"])` to skip reading the source code.
         """
         return {
-            _key:(getattr(self, _key) if (not isinstance(_construct, JSONDescriptionLRUCache)) else getattr(self, _key)()) \
-                for _key in dir(self) \
-                    if (isinstance(_construct := getattr(type(self), _key, None), JSONDescriptionElement)) # Make sure to getattr from type(self) - otherwise we `property`s would have returned the VALUE instead of itself!
+            _field.name:_field.get(self) \
+                for _field in self.select(fields, exclude=exclude)
         }
-    
+
     @property
-    def as_export_dict(self) -> Dict[str, str]:
+    def as_dict(self) -> Dict[str, Any]:
         """
-        Return the representation of this object 
+        Return all representations of this object as a dictionary.
+        """
+        return self.to_dict()
+
+    def to_export_dict(
+        self,
+        fields:Iterable[str] = None,
+        *,
+        exclude:Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """
+        Return the representation of this object for its metadata, limited to `fields`, or all of them except those in `exclude`.
+
+        Only the fields that can be overridden by metadata are exported; children are exported in full.
         """
         def _nested_export(key_obj:Union[str, Any]) -> Any:
             if (isinstance(key_obj, str)):
@@ -334,20 +685,23 @@ class ObjectDescription():
                 return obj
 
         return {
-            _key:_nested_export(_key) \
-                for _key in dir(self) \
-                    if (
-                        isinstance(_construct := getattr(type(self), _key, None), JSONDescriptionElement) and \
-                        _construct.metadata_override
-                    ) # Make sure to getattr from type(self) - otherwise we `property`s would have returned the VALUE instead of itself!
+            _field.name:_nested_export(_field.name) \
+                for _field in self.select(fields, exclude=exclude, metadata_override=True)
         }
 
+    @property
+    def as_export_dict(self) -> Dict[str, Any]:
+        """
+        Return the representation of this object 
+        """
+        return self.to_export_dict()
+
     @property
     def caption(self) -> str:
         """
         For printing only - used in `.explain()`.
         """
-        return f"{stdout.cyan(type(self).__name__)}{stdout.blue(' of ')}{stdout.cyan(self.obj)}{stdout.blue(' from module ')}{stdout.cyan(ObjectDescription(self.module).qualname)}"
+        return f"{stdout.cyan(type(self).__name__)}{stdout.blue(' of ')}{stdout.cyan(self.obj)}{stdout.blue(' from module ')}{stdout.cyan(describe.registry.get(ObjectDescription, self.module).qualname)}"
 
     @JSONDescriptionProperty
     def type(self) -> Type:
@@ -355,14 +709,14 @@ class ObjectDescription():
 
     @JSONDescriptionProperty
     def type_description(self) -> Type:
-        return describe.cls.ClassDescription(self.type)
+        return describe.registry.get(describe.cls.ClassDescription, self.type)
 
     def explain(self, *, indent:int=0) -> None:
         print = logger.info
 
         print (" "*indent + self.caption)
         print ("")
-        for _key, _value in zip(self.as_dict, self.as_dict.values()):
+        for _key, _value in self.as_dict.items():
             print (" "*indent + "- " +stdout.blue(_key) + ":")
 
             # Expand generators
@@ -413,6 +767,19 @@ class ObjectDescription():
                 print (" "*(indent+2) +f"{stdout.yellow(type(_value).__name__)} instance: {stdout.white(str(_value))}")
             print ("")
 
+    @functools.cached_property
+    def members(self) -> Dict[str, Member]:
+        """
+        Every member listed by `dir()`, retrieved and classified in a single pass.
+
+        `children()` and `attributes_descriptions` are filtered views of this table,
+        so that each member is only retrieved once however many views are used.
+        """
+        return {
+            _name:Member.classify(self.obj, _name) \
+                for _name in dir(self.obj)
+        }
+
     def children(
         self,
         *,
@@ -424,31 +791,22 @@ class ObjectDescription():
         """
         Get children of the object, filtered by the parameters specified.
         """
-        for _attr in filter(
-            # Filter
-            lambda name: (
-                # Double Underscores
-                not (
-                    name.startswith("__") and \
-                    name.endswith("__") and \
-                    len(name)>4
-                ) \
-                    if (not dunder) else True
-            ) and (
-                # Single Underscores
-                not (
-                    name.startswith("_") and \
-                    len(name)>1 and \
-                    name[1]!="_"
-                ) \
-                    if (not sunder) else True
-            ) and (
+        if (modules):
+            modules = [
+                _module.__name__ if (isinstance(_module, ModuleType)) else _module \
+                    for _module in modules
+            ]
+
+        for _member in self.members.values():
+            if (
+                _member.kind == "missing" or \
+                (_member.dunder and not dunder) or \
+                (_member.sunder and not sunder) or \
                 # Django callable override
-                not name in ATTRIBUTE_BLACKLIST
-            ),
-            dir(self.obj)
-        ):
-            _value = getattr(self.obj, _attr)
+                _member.name in ATTRIBUTE_BLACKLIST
+            ): continue
+
+            _value = _member.value
 
             # If the value is not of the right class, skip it
             if (classes):
@@ -456,27 +814,24 @@ class ObjectDescription():
 
             # If the value is not of the right module, skip it
             if (modules):
-                
-                modules = [ 
-                    _module.__name__ if (isinstance(_module, ModuleType)) else _module \
-                        for _module in modules
-                ]
-
-                if (not any(
-                    map(
-                        lambda _module_name: inspect.getmodule(_value).__name__.startswith(_module_name),
-                        modules
+                if (
+                    _member.module is None or \
+                    not any(
+                        map(
+                            lambda _module_name: _member.module.__name__.startswith(_module_name),
+                            modules
+                        )
                     )
-                )): continue
-        
+                ): continue
+
             else:
                 # if no modules are provided, at least remove the builtins.
-                if (inspect.getmodule(_value) is builtins): continue
+                if (_member.module is builtins): continue
 
 
             # Switch lambda function names with their attribute names
             if (callable(_value) and _value.__name__ in ("<lambda>", "<locals>")):
-                _value.__name__ = _attr
+                _value.__name__ = _member.name
             
             yield _value
 
@@ -485,7 +840,7 @@ class ObjectDescription():
         """
         Guess the module where the object came from.
         """
-        return inspect.getmodule(self.obj)
+        return getmodule(self.obj)
             
     @JSONDescriptionProperty
     def modules(self):
@@ -518,7 +873,7 @@ class ObjectDescription():
                                         []
                                     ),
                 map(
-                    describe.module.ModuleDescription,
+                    functools.partial(describe.registry.get, describe.module.ModuleDescription),
                     self.modules
                 )
             )
@@ -544,7 +899,7 @@ class ObjectDescription():
         
         return list(
             map(
-                describe.cls.ClassDescription,
+                functools.partial(describe.registry.get, describe.cls.ClassDescription),
                 self.classes
             )
         )
@@ -583,67 +938,32 @@ class ObjectDescription():
         Return an Iterator of all children attributes which are not modules, classes and functions.
         """
 
-        REMOVE_TYPES = (
-            ModuleType,
-            type,
-            FunctionType,
-            MethodType,
-            MethodWrapperType,
-        )
-
-        dunder:bool = False
-        sunder:bool = False
+        _members = self.members
 
         def _valid_attributes(name:str):
             # attribute blacklist; to do with django built in attributes.
             if (name in ATTRIBUTE_BLACKLIST): return False
 
-            # dunder
-            if (not dunder and (
-                name.startswith("__") and \
-                name.endswith("__") and \
-                len(name)>4
-            )): return False
-            
-            # sunder
-            if (not sunder and (
-                name.startswith("_") and \
-                len(name)>1 and \
-                name[1] != "_"
-            )): return False
-
-            # REMOVE_TYPES
-            try:
-                if (
-                    # Make sure it has the attribute - otherwise we might get all the type_hints out
-                    hasattr(self.obj, name) and \
-                    isinstance(
-                        getattr(self.obj, name, inspect._empty),
-                        REMOVE_TYPES
-                    )
-                ): return False
-            except KeyboardInterrupt as e:
-                return input(f"Include {self.qualname}.{name} as attribute? [Y/N] ").lower().startswith("Y")
+            # dunder and sunder
+            if (isdunder(name) or issunder(name)): return False
+
+            # Type hints without values are attributes as well
+            if ((_member := _members.get(name, None)) is None or _member.kind == "missing"): return True
+
+            # Modules, classes and functions
+            if (_member.kind != "attribute"): return False
 
             # Belongs to module if self.obj is a module
             if (
-                # Make sure it has the attribute - otherwise we might get all the type_hints out
-                hasattr(self.obj, name) and \
-                isinstance(self.obj, ModuleType)
-            ):
-                if (
-                    inspect.getmodule(
-                        getattr(self.obj, name)
-                    ) is not \
-                    self.obj
-                ):
-                    return False
+                isinstance(self.obj, ModuleType) and \
+                _member.module is not self.obj
+            ): return False
 
             return True
 
         try:
             _attrs = set(
-                dir(self.obj) + list(get_type_hints(self.obj).keys())
+                list(_members) + list(get_type_hints(self.obj).keys())
             )
         except (TypeError, ) as e:
             if ("unsupported operand type(s)" in str(e)):
@@ -668,4 +988,6 @@ class ObjectDescription():
             )
         ))
 
-    
\ No newline at end of file
+    
+# `__init_subclass__()` only runs for the subclasses.
+ObjectDescription.schema = DescriptionField.schema(ObjectDescription)
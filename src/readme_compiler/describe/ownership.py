@@ -0,0 +1,172 @@
+"""
+## Ownership Module
+
+Find the module that an object belongs to, the same way `inspect.getmodule` does, without scanning `sys.modules`
+every time an object has no `__module__` to go by.
+
+`inspect.getmodule` falls back to comparing the source file of the object with the file of every loaded module;
+`ModuleIndex` records those files once, and only records them again when new modules had been imported.
+Results are also kept per object, keyed by its identity, until the index is refreshed.
+
+Use `getmodule()`.
+"""
+
+import builtins
+import inspect
+import os
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ..log import logger
+
+print = logger.debug
+
+class ModuleIndex():
+    """
+    Index of the modules in `sys.modules` by the absolute paths of their files, with the owning module of every object looked up so far.
+    """
+    # Forget the owners looked up so far once this many are kept, so that a long running process does not hold onto every object it had described.
+    MAX_OWNERS = 2**16
+
+    def __init__(self)->None:
+        self._lock = threading.RLock()
+
+        # `(len(sys.modules), last module name)` when the index was built; `sys.modules` only ever appends new modules at the end.
+        self._version:Tuple[int, Optional[str]] = None
+
+        self._files:Dict[str, ModuleType] = {}
+
+        # `id(obj)` => `(obj, module)`; `obj` is kept so that its `id` cannot be reused while the entry exists.
+        self._owners:Dict[int, Tuple[Any, Optional[ModuleType]]] = {}
+
+        self.hits       = 0
+        self.misses     = 0
+        self.refreshes  = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(files={len(self._files):,}, owners={len(self._owners):,}, hits={self.hits:,}, misses={self.misses:,}, refreshes={self.refreshes:,})"
+
+    @staticmethod
+    def version()->Tuple[int, Optional[str]]:
+        """
+        Identify the current contents of `sys.modules`.
+        """
+        _modules = sys.modules
+
+        try:
+            return (len(_modules), next(reversed(_modules), None))
+        except (RuntimeError, ) as e:
+            # dictionary changed size during iteration - another thread is importing.
+            return (-1, None)
+
+    def refresh(self)->None:
+        """
+        Index the files of `sys.modules` again if any modules had been imported or removed since the last time.
+        """
+        _version = self.version()
+
+        if (_version == self._version):
+            return
+
+        with self._lock:
+            _files = {}
+
+            for _module in list(sys.modules.values()):
+                if (not isinstance(_module, ModuleType)):
+                    continue
+
+                try:
+                    _path = inspect.getabsfile(_module)
+                except (TypeError, FileNotFoundError) as e:
+                    # TypeError: <module 'sys' (built-in)> is a built-in module
+                    continue
+
+                # Same as `inspect.getmodule`: the real path of each file is recorded as well.
+                _files[_path] = _files[os.path.realpath(_path)] = _module
+
+            self._files     = _files
+            self._owners    = {}
+            self._version   = _version if (_version[0] >= 0) else None
+
+            self.refreshes += 1
+
+    def clear(self)->None:
+        """
+        Forget everything; the index is built again on next use.
+        """
+        with self._lock:
+            self._files     = {}
+            self._owners    = {}
+            self._version   = None
+
+    def getmodule(
+        self,
+        obj:Any,
+    )->Optional[ModuleType]:
+        """
+        Return the module `obj` belongs to, or `None` if it cannot be determined; the same as `inspect.getmodule(obj)`.
+        """
+        if (isinstance(obj, ModuleType)):
+            return obj
+
+        # By far the most common case - no need to remember these.
+        if (hasattr(obj, "__module__")):
+            try:
+                return sys.modules.get(obj.__module__, None)
+            except (TypeError, ) as e:
+                # TypeError: unhashable type
+                return None
+
+        self.refresh()
+
+        if ((_owner := self._owners.get(id(obj), None)) is not None and _owner[0] is obj):
+            self.hits += 1
+            return _owner[1]
+
+        self.misses += 1
+        _module = self.lookup(obj)
+
+        with self._lock:
+            if (len(self._owners) >= self.MAX_OWNERS):
+                self._owners.clear()
+
+            self._owners[id(obj)] = (obj, _module)
+
+        return _module
+
+    def lookup(
+        self,
+        obj:Any,
+    )->Optional[ModuleType]:
+        """
+        Find the module of an `obj` without a `__module__` from its source file, then `__main__` and `builtins`.
+        """
+        try:
+            _path = inspect.getabsfile(obj)
+        except (TypeError, FileNotFoundError) as e:
+            # Objects without a file, e.g. instances.
+            return None
+
+        if ((_module := self._files.get(_path, None)) is not None):
+            return _module
+
+        _name = getattr(obj, "__name__", None)
+
+        if (not isinstance(_name, str)):
+            return None
+
+        for _module in (sys.modules.get("__main__", None), builtins):
+            if (_module is not None and getattr(_module, _name, None) is obj):
+                return _module
+
+        return None
+
+INDEX = ModuleIndex()
+
+def getmodule(obj:Any)->Optional[ModuleType]:
+    """
+    Return the module `obj` belongs to, using the shared `ModuleIndex`.
+    """
+    return INDEX.getmodule(obj)
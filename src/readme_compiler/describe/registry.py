@@ -0,0 +1,277 @@
+"""
+## Registry Module
+
+Identity map of descriptions, so that an object is described once and the same description - with all of its cached properties -
+is shared by every template, class and annotation that refers to it, instead of each of them describing it again.
+
+Descriptions are registered by their class, the identity of the described object, their metadata and any other arguments.
+Only descriptions that load their sidecar metadata, or are given empty metadata, are registered;
+those given any other metadata are particular to their caller, and are always created anew.
+
+One registry is shared by every render, until it is `clear()`ed - e.g. at the start of each compile.
+A description records its source files and sidecar metadata as dependencies of the render in progress when it is created,
+or when it computes its cached properties; the registry keeps what each description recorded,
+together with the registered descriptions it got in the meantime, and records all of them again for every render that reuses it.
+
+Use `get()` in place of calling a description class directly.
+"""
+
+import collections
+import contextlib
+import contextvars
+import functools
+import inspect
+import threading
+from types import SimpleNamespace
+import weakref
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+from .. import dependencies
+
+from ..log import logger
+
+import readme_compiler.describe as describe
+
+print = logger.debug
+
+# Arguments that are keyed by value rather than by identity.
+_VALUE_TYPES = (type(None), bool, int, float, str)
+
+# Record of the registered description being created, or computing a cached property, in this context.
+_building:contextvars.ContextVar = contextvars.ContextVar("readme_compiler_registry_building", default=None)
+
+class DescriptionRegistry():
+    """
+    Registry of the descriptions created so far.
+    """
+    # Forget the least recently used descriptions once this many are kept.
+    MAXSIZE = 2**14
+
+    def __init__(self)->None:
+        self._lock = threading.RLock()
+
+        self._entries:collections.OrderedDict = collections.OrderedDict()
+
+        # Every description ever registered, including those evicted since, which may still be shared by whoever got them:
+        # the files each of them recorded, and the registered descriptions it got while recording them.
+        self._records:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        # All the files recorded by each description and everything it got, as of `self._version`.
+        self._closures:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._version = 0
+
+        self.hits   = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(entries={len(self._entries):,}, hits={self.hits:,}, misses={self.misses:,})"
+
+    @staticmethod
+    def key(
+        cls:Type["describe.object.ObjectDescription"],
+        obj:Any,
+        metadata:Optional[Dict[str, Any]],
+        arguments:Dict[str, Any],
+    )->Optional[Tuple[Any, ...]]:
+        """
+        Return the key of the description of `obj` by `cls`, or `None` if it must not be shared.
+
+        `obj` and any arguments that are not plain values are keyed by their `id()`;
+        their entries keep them alive, so that the `id()`s cannot be reused while registered.
+        """
+        if (metadata is None):
+            _metadata = None
+        elif (isinstance(metadata, dict) and not metadata):
+            _metadata = ()
+        else:
+            return None
+
+        return (
+            cls,
+            id(obj),
+            _metadata,
+            tuple(
+                (_name, _value if (isinstance(_value, _VALUE_TYPES)) else id(_value)) \
+                    for _name, _value in sorted(arguments.items())
+            ),
+        )
+
+    def link(
+        self,
+        description:"describe.object.ObjectDescription",
+    )->None:
+        """
+        Note that `description` was handed to the registered description being created or computed, if any.
+        """
+        if ((_parent := _building.get()) is not None and description not in _parent.children):
+            with self._lock:
+                _parent.children.add(description)
+                self._version += 1
+
+    def files(
+        self,
+        description:"describe.object.ObjectDescription",
+    )->Set[str]:
+        """
+        Return all the files recorded by `description`, and by the registered descriptions it got, so far.
+        """
+        with self._lock:
+            if ((_closure := self._closures.get(description, None)) is not None and _closure[0] == self._version):
+                return _closure[1]
+
+            _files = set()
+            _seen = set()
+            _pending = [description, ]
+
+            while (_pending):
+                _description = _pending.pop()
+
+                if (id(_description) in _seen or (_record := self._records.get(_description, None)) is None):
+                    continue
+
+                _seen.add(id(_description))
+                _files.update(_record.files)
+                _pending.extend(_record.children)
+
+            self._closures[description] = (self._version, _files)
+
+        return _files
+
+    @contextlib.contextmanager
+    def track(
+        self,
+        description:"describe.object.ObjectDescription",
+    )->Iterator[None]:
+        """
+        Attribute the files recorded, and the registered descriptions got, within this context to `description`, if it is registered;
+        e.g. while it computes a cached property.
+        """
+        if ((_record := self._records.get(description, None)) is None):
+            yield
+            return
+
+        _token = _building.set(_record)
+
+        try:
+            with dependencies.DependencyRecorder() as _recorder:
+                yield
+        finally:
+            _building.reset(_token)
+
+            if (not _recorder.files <= _record.files):
+                with self._lock:
+                    _record.files.update(_recorder.files)
+                    self._version += 1
+
+    def get(
+        self,
+        cls:Type["describe.object.ObjectDescription"],
+        obj:Any,
+        metadata:Dict[str, Any] = None,
+        **kwargs,
+    )->"describe.object.ObjectDescription":
+        """
+        Return the registered description of `obj` by `cls`, creating it with `cls(obj, metadata=metadata, **kwargs)` if there is none.
+        """
+        if ((_key := self.key(cls, obj, metadata, kwargs)) is None):
+            return cls(obj, metadata=metadata, **kwargs)
+
+        with self._lock:
+            if ((_entry := self._entries.get(_key, None)) is not None):
+                self._entries.move_to_end(_key)
+                self.hits += 1
+
+        if (_entry is not None):
+            _description = _entry[0]
+
+            # Whatever it, and the descriptions it got, had recorded so far, this render depends on too.
+            if (dependencies.current() is not None):
+                dependencies.record(*self.files(_description))
+
+            self.link(_description)
+            return _description
+
+        self.misses += 1
+        _record = SimpleNamespace(files=set(), children=weakref.WeakSet())
+        _token = _building.set(_record)
+
+        try:
+            with dependencies.DependencyRecorder() as _recorder:
+                _description = cls(obj, metadata=metadata, **kwargs)
+        finally:
+            _building.reset(_token)
+
+        # e.g. `FunctionDescription` returns an exception for objects that are not functions.
+        if (not isinstance(_description, describe.object.ObjectDescription)):
+            return _description
+
+        _record.files.update(_recorder.files)
+
+        with self._lock:
+            self._entries[_key] = (_description, obj, tuple(kwargs.values()))
+            self._records[_description] = _record
+
+            while (len(self._entries) > self.MAXSIZE):
+                self._entries.popitem(last=False)
+
+        self.link(_description)
+        return _description
+
+    def isregistered(
+        self,
+        description:"describe.object.ObjectDescription",
+    )->bool:
+        """
+        Return `True` if `description` was handed out by this registry, and may be shared.
+        """
+        with self._lock:
+            return description in self._records
+
+    def clear(self)->None:
+        """
+        Forget all descriptions.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._records = weakref.WeakKeyDictionary()
+            self._closures = weakref.WeakKeyDictionary()
+            self._version += 1
+
+REGISTRY = DescriptionRegistry()
+
+def get(
+    cls:Type["describe.object.ObjectDescription"],
+    obj:Any,
+    metadata:Dict[str, Any] = None,
+    **kwargs,
+)->"describe.object.ObjectDescription":
+    """
+    Return the description of `obj` by `cls` from the shared `DescriptionRegistry`.
+    """
+    return REGISTRY.get(cls, obj, metadata, **kwargs)
+
+def detach(
+    description:"describe.object.ObjectDescription",
+)->"describe.object.ObjectDescription":
+    """
+    Return a description that can be changed without affecting anyone else:
+    `description` itself if it is not shared, or else a copy of it without any of its cached properties,
+    which may have depended on what is about to be changed.
+    """
+    if (not REGISTRY.isregistered(description)):
+        return description
+
+    _type = type(description)
+    _copy = object.__new__(_type)
+    _copy.__dict__.update(
+        (_name, _value) for _name, _value in vars(description).items() \
+            if (not isinstance(inspect.getattr_static(_type, _name, None), functools.cached_property))
+    )
+
+    return _copy
+
+def clear()->None:
+    """
+    Forget all descriptions registered so far.
+    """
+    REGISTRY.clear()
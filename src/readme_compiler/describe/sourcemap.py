@@ -0,0 +1,414 @@
+"""
+## Source Map Module
+
+Index of the source files of modules, each read and parsed once and shared by all descriptions,
+so that the source code, comments and raised exceptions of every function and class in a file
+are looked up in its index, instead of `inspect` finding, reading and tokenizing them again for each object.
+
+Answers are the same as those of `inspect.getsource()` and `inspect.getcomments()`;
+anything the index cannot answer, e.g. `lambda`s or code without a source file, is left to `inspect`.
+
+Use `getsource()`, `getcomments()` and `getraises()`, or `get()` for the `ModuleSource` of a file.
+"""
+
+import ast
+import functools
+import inspect
+import io
+import os
+import re
+import threading
+import tokenize
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ..log import logger
+
+print = logger.debug
+
+# Lines of a text with its newlines already translated, as `linecache` splits them.
+LINE_PATTERN = re.compile(r"[^\n]*\n|[^\n]+$")
+
+# Same as `inspect.findsource()`: the first line of a function, from the first line of its code.
+DEFINITION_PATTERN = re.compile(r"^(\s*def\s)|(\s*async\s+def\s)|(.*(?<!\w)lambda(:|\s))|^(\s*@)")
+
+# Exceptions mentioned literally in `raise` statements.
+RAISES_PATTERN = re.compile(
+    r"(?<=[:\n])\s*raise\s+(?P<exception_type>[A-Z][\w\._]+)\(", re.MULTILINE
+)
+
+class ModuleSource():
+    """
+    The source file of a module, read once, with its lines, AST, and an index of the definitions in it.
+
+    Line numbers `lnum` are 0-based indices into `lines`, as in `inspect.findsource()`.
+    """
+    def __init__(
+        self,
+        path:str,
+    ) -> None:
+        self.path = path
+
+        _stat = os.stat(path)
+        self.key = (_stat.st_mtime_ns, _stat.st_size)
+
+        with open(path, "rb") as _f:
+            _bytes = _f.read()
+
+        # Same as `linecache`, which reads with universal newlines.
+        self.text   = _bytes.decode(self.encoding(_bytes)).replace("\r\n", "\n").replace("\r", "\n")
+        self.lines  = LINE_PATTERN.findall(self.text)
+
+        # `linecache` ends the last line too.
+        if (self.lines and not self.lines[-1].endswith("\n")):
+            self.lines[-1] += "\n"
+
+        self._lock = threading.RLock()
+        self._blocks:Dict[int, int] = {}
+        self._raises:Dict[int, List[str]] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={repr(self.path)}, lines={len(self.lines):,})"
+
+    @staticmethod
+    def encoding(source:bytes) -> str:
+        """
+        The encoding declared by `source`, as `tokenize` would find it.
+        """
+        try:
+            return tokenize.detect_encoding(io.BytesIO(source).readline)[0]
+        except (SyntaxError, ) as e:
+            return "utf-8"
+
+    @functools.cached_property
+    def tree(self) -> ast.Module:
+        """
+        The AST of the module; raises `SyntaxError` if it cannot be parsed.
+        """
+        return ast.parse(self.text, filename=self.path)
+
+    @functools.cached_property
+    def index(self) -> SimpleNamespace:
+        """
+        The definitions of the module by their first line, including decorators, and the first line of each class by its `__qualname__`.
+        """
+        _definitions = {}
+        _classes = {}
+
+        def _visit(node:ast.AST, stack:List[str]) -> None:
+            # Same order as `inspect._ClassFinder`, so that the same one of any duplicated class is found.
+            for _child in ast.iter_child_nodes(node):
+                if (isinstance(_child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))):
+                    _lnum = min(
+                        [ _decorator.lineno for _decorator in _child.decorator_list ] + [ _child.lineno ]
+                    ) - 1
+                    _definitions.setdefault(_lnum, _child)
+
+                    if (isinstance(_child, ast.ClassDef)):
+                        _classes.setdefault(".".join(stack + [_child.name]), _lnum)
+                        _visit(_child, stack + [_child.name])
+                    else:
+                        _visit(_child, stack + [_child.name, "<locals>"])
+                else:
+                    _visit(_child, stack)
+
+        _visit(self.tree, [])
+
+        return SimpleNamespace(
+            definitions = _definitions,
+            classes     = _classes,
+        )
+
+    def segment(
+        self,
+        node:ast.AST,
+    ) -> str:
+        """
+        The source text of expression `node`.
+        """
+        # Same as `ast.get_source_segment()`, which would split the whole text into lines again on every call.
+        try:
+            _lines = [ _line.encode("utf-8") for _line in self.lines[node.lineno-1:node.end_lineno] ]
+
+            if (len(_lines) == 1):
+                return _lines[0][node.col_offset:node.end_col_offset].decode("utf-8")
+
+            return (
+                _lines[0][node.col_offset:] + \
+                b"".join(_lines[1:-1]) + \
+                _lines[-1][:node.end_col_offset]
+            ).decode("utf-8")
+        except (AttributeError, TypeError, IndexError, UnicodeDecodeError) as e:
+            return "..."
+
+    def block(
+        self,
+        lnum:int,
+    ) -> int:
+        """
+        The end of the block starting at `lnum`, exclusive; the same as `inspect.getblock()` would find.
+        """
+        with self._lock:
+            if (lnum in self._blocks):
+                return self._blocks[lnum]
+
+        try:
+            _node = self.index.definitions.get(lnum, None)
+        except (SyntaxError, ValueError) as e:
+            _node = None
+
+        if (_node is None):
+            # e.g. `lambda`s.
+            _end = lnum + len(inspect.getblock(self.lines[lnum:]))
+        else:
+            _end = _node.end_lineno
+
+            # Comments after the last statement are part of the block if they are indented at least as much as its body.
+            _body_line = self.lines[_node.body[0].lineno-1]
+            _body_col0 = len(_body_line) - len(_body_line.lstrip(" \t"))
+
+            if (_body_col0 == _node.body[0].col_offset):
+                for _index in range(_node.end_lineno, len(self.lines)):
+                    _line = self.lines[_index]
+                    _stripped = _line.lstrip(" \t")
+
+                    if (not _stripped.strip()):
+                        continue
+                    elif (_stripped[:1] != "#"):
+                        break
+                    elif (len(_line) - len(_stripped) >= _body_col0):
+                        _end = _index + 1
+
+        with self._lock:
+            self._blocks[lnum] = _end
+
+        return _end
+
+    def source(
+        self,
+        lnum:int,
+    ) -> str:
+        """
+        The source code of the block starting at `lnum`.
+        """
+        return "".join(self.lines[lnum:self.block(lnum)])
+
+    def comments(
+        self,
+        lnum:int,
+        *,
+        module:bool = False,
+    ) -> Optional[str]:
+        """
+        The comment lines right above the block starting at `lnum`, or at the top of the file if `module`;
+        the same as `inspect.getcomments()`.
+        """
+        _lines = self.lines
+
+        if (module):
+            _start = 1 if (_lines and _lines[0][:2] == "#!") else 0
+            while (_start < len(_lines) and _lines[_start].strip() in ("", "#")): _start += 1
+
+            _comments = []
+            while (_start < len(_lines) and _lines[_start][:1] == "#"):
+                _comments.append(_lines[_start].expandtabs())
+                _start += 1
+
+            return "".join(_comments) if (_comments) else None
+
+        if (lnum <= 0 or lnum >= len(_lines)):
+            return None
+
+        _end = lnum - 1
+        _indent = inspect.indentsize(_lines[lnum])
+
+        if (not (_lines[_end].lstrip()[:1] == "#" and inspect.indentsize(_lines[_end]) == _indent)):
+            return None
+
+        _comments = []
+        while (
+            _end >= 0 and \
+            _lines[_end].expandtabs().lstrip()[:1] == "#" and \
+            inspect.indentsize(_lines[_end]) == _indent
+        ):
+            _comments.insert(0, _lines[_end].expandtabs().lstrip())
+            _end -= 1
+
+        while (_comments and _comments[0].strip() == "#"): _comments.pop(0)
+        while (_comments and _comments[-1].strip() == "#"): _comments.pop()
+
+        return "".join(_comments)
+
+    def raises(
+        self,
+        lnum:int,
+    ) -> List[str]:
+        """
+        Names of the exceptions mentioned literally in `raise` statements of the block starting at `lnum`.
+        """
+        with self._lock:
+            if (lnum in self._raises):
+                return list(self._raises[lnum])
+
+        _raises = find_raises(self.source(lnum))
+
+        with self._lock:
+            self._raises[lnum] = _raises
+
+        return list(_raises)
+
+def find_raises(source:str) -> List[str]:
+    """
+    Names of the exceptions mentioned literally in `raise` statements of `source`.
+
+    We cannot resolve them into the actual classes, because of the different local and global contexts.
+    """
+    return [
+        _raise.group("exception_type") \
+            for _raise in RAISES_PATTERN.finditer(source)
+    ]
+
+# `ModuleSource` of every file read so far, by path.
+SOURCES:Dict[str, ModuleSource] = {}
+
+_LOCK = threading.Lock()
+
+def get(path:str) -> ModuleSource:
+    """
+    Return the `ModuleSource` of `path`, reading it again if it had changed since.
+
+    Raises `OSError` if it cannot be read.
+    """
+    _stat = os.stat(path)
+
+    with _LOCK:
+        _source = SOURCES.get(path, None)
+
+    if (_source is not None and _source.key == (_stat.st_mtime_ns, _stat.st_size)):
+        return _source
+
+    _source = ModuleSource(path)
+
+    with _LOCK:
+        SOURCES[path] = _source
+
+    return _source
+
+def clear() -> None:
+    """
+    Forget all files read so far.
+    """
+    with _LOCK:
+        SOURCES.clear()
+
+def locate(obj:Any) -> Optional[Tuple[ModuleSource, int]]:
+    """
+    Return the `ModuleSource` of `obj` and the first line of its definition, as `inspect.findsource()` would find them;
+    or `None` if the index cannot tell, and `inspect` has to be asked instead.
+
+    Raises `OSError` if `obj` is a class that is not defined in its source file.
+    """
+    if (not (
+        inspect.ismodule(obj) or \
+        inspect.isclass(obj) or \
+        inspect.ismethod(obj) or \
+        inspect.isfunction(obj) or \
+        inspect.iscode(obj)
+    )):
+        return None
+
+    try:
+        _path = inspect.getsourcefile(obj)
+    except (TypeError, ) as e:
+        return None
+
+    if (not _path):
+        return None
+
+    try:
+        _source = get(_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return None
+
+    if (not _source.lines):
+        # OSError: could not get source code
+        return None
+
+    if (inspect.ismodule(obj)):
+        return (_source, 0)
+
+    if (inspect.isclass(obj)):
+        try:
+            _lnum = _source.index.classes.get(obj.__qualname__, None)
+        except (SyntaxError, ValueError) as e:
+            return None
+
+        if (_lnum is None):
+            # Same as `inspect`, which would look in the same file.
+            raise OSError("could not find class definition")
+
+        return (_source, _lnum)
+
+    if (inspect.ismethod(obj)):
+        obj = obj.__func__
+
+    if (inspect.isfunction(obj)):
+        obj = obj.__code__
+
+    _lnum = getattr(obj, "co_firstlineno", 0) - 1
+
+    if (not 0 <= _lnum < len(_source.lines)):
+        return None
+
+    while (_lnum > 0 and not DEFINITION_PATTERN.match(_source.lines[_lnum])):
+        _lnum -= 1
+
+    return (_source, _lnum)
+
+def getsource(obj:Any) -> str:
+    """
+    `inspect.getsource()`, answered by the index whenever it can.
+    """
+    _unwrapped = inspect.unwrap(obj)
+
+    if ((_located := locate(_unwrapped)) is None):
+        return inspect.getsource(obj)
+
+    _source, _lnum = _located
+
+    if (inspect.ismodule(_unwrapped)):
+        return "".join(_source.lines)
+
+    return _source.source(_lnum)
+
+def getcomments(obj:Any) -> Optional[str]:
+    """
+    `inspect.getcomments()`, answered by the index whenever it can.
+    """
+    try:
+        _located = locate(obj)
+    except (OSError, ) as e:
+        return None
+
+    if (_located is None):
+        return inspect.getcomments(obj)
+
+    _source, _lnum = _located
+
+    return _source.comments(_lnum, module=inspect.ismodule(obj))
+
+def getraises(obj:Any) -> List[str]:
+    """
+    Names of the exceptions mentioned literally in `raise` statements in the source code of `obj`.
+    """
+    _unwrapped = inspect.unwrap(obj)
+
+    if ((_located := locate(_unwrapped)) is None):
+        return find_raises(inspect.getsource(obj))
+
+    _source, _lnum = _located
+
+    if (inspect.ismodule(_unwrapped)):
+        return find_raises("".join(_source.lines))
+
+    return _source.raises(_lnum)
@@ -0,0 +1,961 @@
+"""
+## Static Module
+
+Build the objects of a module from the AST of its source file, without importing it,
+so that they can be described by the usual `ModuleDescription`, `ClassDescription`, `FunctionDescription` and `AttributeDescription`.
+
+- Modules are `StaticModule`s - genuine `ModuleType` objects whose source is never executed.
+- Classes are created with `type()` from the members found in their bodies; only built-in and other static classes are kept as their bases.
+- Functions are stubs carrying the name, docstring and `__signature__` of the function they stand for; calling them raises `StaticObjectNotCallable`.
+- Anything else is its literal value, the object it names, or otherwise an `Expression` holding its source text.
+
+Nothing in the described package is run: decorators other than `property`, `classmethod`, `staticmethod`,
+`functools.cached_property` and those of `abc` are ignored, and names imported from modules that had not already been
+imported by someone else are left as `Expression`s.
+
+Use `get_object()`, or `{% describe %}` with `backend='static'`.
+"""
+
+import abc
+import ast
+import builtins
+import collections
+import functools
+import importlib.machinery
+import inspect
+import os
+import sys
+import threading
+import typing
+import weakref
+from types import ModuleType, FunctionType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
+
+from ..log import logger
+from ..exceptions import InvalidFunctionArgument, SourceHasNoSuchAttribute, SourceNotFound
+
+from . import exceptions
+from . import sourcemap
+from .sourcemap import ModuleSource
+
+print = logger.debug
+
+# Decorators that are safe to apply to static functions; anything else is ignored.
+DECORATORS = {
+    property:                       property,
+    classmethod:                    classmethod,
+    staticmethod:                   staticmethod,
+    functools.cached_property:      functools.cached_property,
+    abc.abstractproperty:           property,
+    abc.abstractclassmethod:        classmethod,
+    abc.abstractstaticmethod:       staticmethod,
+}
+
+ABSTRACT_DECORATORS = (
+    abc.abstractmethod,
+    abc.abstractproperty,
+    abc.abstractclassmethod,
+    abc.abstractstaticmethod,
+)
+
+# Class attributes that cannot be set on a class built with `type()` from placeholders.
+CLASS_NAMESPACE_BLACKLIST = (
+    "__slots__",
+    "__dict__",
+    "__weakref__",
+    "__module__",
+    "__qualname__",
+    "__init_subclass__",
+    "__class_getitem__",
+    "__set_name__",
+)
+
+# Module attributes set by `StaticLoader`, which cannot be overridden by placeholders.
+MODULE_NAMESPACE_PROTECTED = (
+    "__name__",
+    "__file__",
+    "__path__",
+    "__package__",
+    "__annotations__",
+)
+
+
+# Where each static object came from; see `origin()`.
+ORIGINS:weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+class Expression():
+    """
+    An expression that cannot be evaluated without running the module, e.g. a function call,
+    or a name imported from a module that is not loaded.
+
+    Its `repr()` is its source text, so that signatures and values show it as written.
+    """
+    def __init__(
+        self,
+        text:str,
+    ) -> None:
+        self.text = text
+
+    def __repr__(self) -> str:
+        return self.text
+
+    __str__ = __repr__
+
+class StaticModule(ModuleType):
+    """
+    A module built from the AST of its source file by `StaticLoader`; its source is never executed.
+    """
+
+class Origin():
+    """
+    Where a static object was defined: its module, and the AST node of its definition.
+    """
+    def __init__(
+        self,
+        module:StaticModule,
+        node:ast.AST,
+        source:ModuleSource = None,
+    ) -> None:
+        self.module     = module
+        self.node       = node
+        self.static     = source
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(module={repr(self.module.__name__)}, node={type(self.node).__name__})"
+
+    @property
+    def path(self) -> str:
+        return self.static.path if (self.static) else ""
+
+    @property
+    def lineno(self) -> int:
+        """
+        The first line of the definition, including its decorators.
+        """
+        return min(
+            [ _decorator.lineno for _decorator in getattr(self.node, "decorator_list", []) ] + \
+                [ getattr(self.node, "lineno", 1), ]
+        )
+
+    @property
+    def source(self) -> str:
+        """
+        The source code of the definition, as `inspect.getsource()` would return it.
+        """
+        if (not self.static):
+            raise OSError(f"{repr(self.module)} has no source file.")
+
+        if (isinstance(self.node, ast.Module)):
+            return "".join(self.static.lines)
+
+        return self.static.source(self.lineno-1)
+
+    @property
+    def comments(self) -> Optional[str]:
+        """
+        The comment lines right above the definition, as `inspect.getcomments()` would return them.
+        """
+        if (not self.static):
+            return None
+
+        return self.static.comments(self.lineno-1, module=isinstance(self.node, ast.Module))
+
+    @property
+    def raises(self) -> List[str]:
+        """
+        Names of the exceptions mentioned literally in `raise` statements of the definition.
+        """
+        if (isinstance(self.node, ast.Module)):
+            return sourcemap.find_raises(self.source)
+
+        return self.static.raises(self.lineno-1) if (self.static) else []
+
+def origin(obj:Any) -> Optional[Origin]:
+    """
+    Return the `Origin` of `obj` if it was built by the static backend, or `None` otherwise.
+    """
+    try:
+        return ORIGINS.get(obj, None)
+    except (TypeError, ) as e:
+        # Objects that cannot be weakly referenced are never static.
+        return None
+
+def getdoc(obj:Any) -> Optional[str]:
+    """
+    `inspect.getdoc()` of a static object.
+
+    Undocumented methods inherit the docstring of the method they override in a static base class;
+    `inspect` would look for the class in `sys.modules` instead.
+    """
+    _doc = getattr(obj, "__doc__", None)
+
+    if (
+        _doc is None and \
+        isinstance(obj, FunctionType) and \
+        (_origin := origin(obj)) is not None
+    ):
+        _class = _origin.module
+        for _name in obj.__qualname__.split(".")[:-1]:
+            _class = vars(_class).get(_name, None) if (hasattr(_class, "__dict__")) else None
+
+        if (isinstance(_class, type)):
+            for _base in _class.__mro__[1:]:
+                if ((_doc := getattr(vars(_base).get(obj.__name__, None), "__doc__", None)) is not None):
+                    break
+
+    if (not isinstance(_doc, str)):
+        return inspect.getdoc(obj)
+
+    return inspect.cleandoc(_doc)
+
+def _not_callable(*args, **kwargs):
+    raise exceptions.StaticObjectNotCallable(
+        "Functions built from source code by the static backend cannot be called."
+    )
+
+class Builder():
+    """
+    Evaluate the statements of a module or a class body into a namespace, without running any of them.
+    """
+    def __init__(
+        self,
+        loader:"StaticLoader",
+        module:StaticModule,
+        source:ModuleSource,
+    ) -> None:
+        self.loader = loader
+        self.module = module
+        self.source = source
+
+        # Annotations are kept as strings, as they would be at run time.
+        self.postponed = any(
+            isinstance(_node, ast.ImportFrom) and \
+            _node.module == "__future__" and \
+            any(_alias.name == "annotations" for _alias in _node.names) \
+                for _node in source.tree.body
+        )
+
+    def register(
+        self,
+        obj:Any,
+        node:ast.AST,
+    ) -> Any:
+        ORIGINS[obj] = Origin(self.module, node, self.source)
+        return obj
+
+    def run(
+        self,
+        body:List[ast.stmt],
+        namespace:Dict[str, Any],
+        *,
+        scope:collections.ChainMap,
+        qualname:str = "",
+    ) -> None:
+        """
+        Bind the names defined by the statements in `body` into `namespace`; names are looked up in `scope`.
+        """
+        for _node in body:
+            if (isinstance(_node, ast.ClassDef)):
+                namespace[_node.name] = self.build_class(_node, scope=scope, qualname=qualname)
+
+            elif (isinstance(_node, (ast.FunctionDef, ast.AsyncFunctionDef))):
+                _function = self.build_function(_node, scope=scope, qualname=qualname)
+
+                if (_function is not None):
+                    namespace[_node.name] = _function
+
+            elif (isinstance(_node, ast.Assign)):
+                _value = self.value(_node.value, scope=scope)
+
+                for _target in _node.targets:
+                    if (isinstance(_target, ast.Name)):
+                        namespace[_target.id] = _value
+
+                    elif (
+                        isinstance(_target, ast.Attribute) and \
+                        isinstance(_target.value, ast.Name) and \
+                        origin(_class := scope.get(_target.value.id, None)) is not None and \
+                        isinstance(_class, type)
+                    ):
+                        # e.g. `Logger.manager = Manager(...)` after the class is defined
+                        setattr(_class, _target.attr, _value)
+
+            elif (isinstance(_node, ast.Delete)):
+                for _target in _node.targets:
+                    if (isinstance(_target, ast.Name)):
+                        namespace.pop(_target.id, None)
+
+            elif (isinstance(_node, ast.AnnAssign)):
+                if (isinstance(_node.target, ast.Name)):
+                    namespace.setdefault("__annotations__", {})[_node.target.id] = self.annotation(
+                        _node.annotation,
+                        scope = scope,
+                        resolve = True,
+                    )
+
+                    if (_node.value is not None):
+                        namespace[_node.target.id] = self.value(_node.value, scope=scope)
+
+            elif (isinstance(_node, ast.Import)):
+                for _alias in _node.names:
+                    if (_alias.asname):
+                        _value = self.loader.import_module(_alias.name, within=self.module)
+                    else:
+                        _value = self.loader.import_module(_alias.name.split(".")[0], within=self.module)
+
+                        # `import a.b` binds `a`, but also needs `a.b` to exist.
+                        if (_alias.name != _alias.name.split(".")[0]):
+                            self.loader.import_module(_alias.name, within=self.module)
+
+                    if (_value is not None):
+                        namespace[_alias.asname or _alias.name.split(".")[0]] = _value
+
+            elif (isinstance(_node, ast.ImportFrom)):
+                _base = self.loader.resolve_name(_node.module, _node.level, within=self.module)
+
+                for _alias in _node.names:
+                    if (_alias.name == "*"):
+                        namespace.update(self.loader.import_star(_base, within=self.module))
+                        continue
+
+                    _value = self.loader.import_from(_base, _alias.name, within=self.module)
+
+                    if (_value is not None):
+                        namespace[_alias.asname or _alias.name] = _value
+
+            elif (isinstance(_node, ast.If)):
+                self.run(_node.body + _node.orelse, namespace, scope=scope, qualname=qualname)
+
+            elif (isinstance(_node, ast.Try)):
+                self.run(
+                    _node.body + \
+                        [ _statement for _handler in _node.handlers for _statement in _handler.body ] + \
+                        _node.orelse + \
+                        _node.finalbody,
+                    namespace,
+                    scope=scope,
+                    qualname=qualname,
+                )
+
+            elif (isinstance(_node, (ast.With, ast.AsyncWith))):
+                self.run(_node.body, namespace, scope=scope, qualname=qualname)
+
+    def build_class(
+        self,
+        node:ast.ClassDef,
+        *,
+        scope:collections.ChainMap,
+        qualname:str = "",
+    ) -> type:
+        """
+        Create a class with the members defined in the body of `node`.
+        """
+        _qualname = qualname + node.name
+
+        _bases = []
+        _abstract = False
+        for _base in node.bases + [ _keyword.value for _keyword in node.keywords if (_keyword.arg == "metaclass") ]:
+            _value = self.value(_base, scope=scope)
+
+            if (_value in (abc.ABC, abc.ABCMeta) or self.source.segment(_base).split(".")[-1] in ("ABC", "ABCMeta")):
+                _abstract = True
+            elif (
+                _base in node.bases and \
+                isinstance(_value, type) and \
+                (origin(_value) is not None or getattr(_value, "__module__", None) == "builtins")
+            ):
+                _bases.append(_value)
+
+                if (hasattr(_value, "__abstractmethods__")):
+                    _abstract = True
+
+            elif (_base in node.bases and isinstance(_value, type) and issubclass(_value, type)):
+                # A metaclass from elsewhere; it is still a metaclass.
+                _bases.append(type)
+
+        _namespace = {
+            "__module__":       self.module.__name__,
+            "__qualname__":     _qualname,
+            "__doc__":          ast.get_docstring(node, clean=False),
+            "__annotations__":  {},
+        }
+
+        _body = {}
+        self.run(
+            node.body,
+            _body,
+            scope=scope.new_child(_body),
+            qualname=_qualname + ".",
+        )
+
+        _namespace["__annotations__"].update(_body.pop("__annotations__", {}))
+        _namespace.update({
+            _name:_value for _name, _value in _body.items() \
+                if (_name not in CLASS_NAMESPACE_BLACKLIST)
+        })
+
+        try:
+            _class = type(node.name, tuple(_bases), _namespace)
+        except (TypeError, ) as e:
+            # e.g. built-in bases with conflicting layouts
+            print (f"Cannot create static class {_qualname} with bases {_bases}: {type(e).__name__}: {str(e)}")
+            _class = type(node.name, (), _namespace)
+
+        if (_abstract):
+            _class.__abstractmethods__ = frozenset(
+                _name for _name in dir(_class) \
+                    if (getattr(getattr(_class, _name, None), "__isabstractmethod__", False))
+            )
+
+        return self.register(_class, node)
+
+    def build_function(
+        self,
+        node:Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        *,
+        scope:collections.ChainMap,
+        qualname:str = "",
+    ) -> Any:
+        """
+        Create a stub function with the name, docstring and signature of `node`, and apply the decorators that are known to be safe.
+        """
+        _origin = Origin(self.module, node, self.source)
+
+        _function = FunctionType(
+            _not_callable.__code__.replace(
+                co_name         = node.name,
+                co_filename     = self.source.path,
+                co_firstlineno  = _origin.lineno,
+            ),
+            _not_callable.__globals__,
+            node.name,
+        )
+
+        _function.__qualname__  = qualname + node.name
+        _function.__module__    = self.module.__name__
+        _function.__doc__       = ast.get_docstring(node, clean=False)
+        _function.__signature__ = self.signature(node, scope=scope)
+
+        self.register(_function, node)
+
+        _value = _function
+        for _decorator in reversed(node.decorator_list):
+            _value = self.decorate(_value, _decorator, scope=scope)
+
+        return _value
+
+    def decorate(
+        self,
+        value:Any,
+        decorator:ast.expr,
+        *,
+        scope:collections.ChainMap,
+    ) -> Any:
+        """
+        Apply `decorator` to `value` if it is known to be safe; otherwise return `value` as it is.
+        """
+        if (
+            isinstance(decorator, ast.Attribute) and \
+            decorator.attr in ("getter", "setter", "deleter") and \
+            isinstance(_property := self.value(decorator.value, scope=scope), property)
+        ):
+            # @name.setter etc
+            return getattr(_property, decorator.attr)(value)
+
+        _decorator = self.value(decorator, scope=scope)
+
+        if (not callable(_decorator)):
+            return value
+
+        if (_decorator in ABSTRACT_DECORATORS):
+            try:
+                value.__isabstractmethod__ = True
+            except (AttributeError, ) as e:
+                pass
+
+        if (_decorator in DECORATORS):
+            return DECORATORS[_decorator](value)
+
+        return value
+
+    def signature(
+        self,
+        node:Union[ast.FunctionDef, ast.AsyncFunctionDef],
+        *,
+        scope:collections.ChainMap,
+    ) -> inspect.Signature:
+        """
+        Build the `inspect.Signature` of a function definition.
+        """
+        _arguments = node.args
+        _parameters = []
+
+        _positional = [ (_arg, inspect.Parameter.POSITIONAL_ONLY) for _arg in getattr(_arguments, "posonlyargs", []) ] + \
+                      [ (_arg, inspect.Parameter.POSITIONAL_OR_KEYWORD) for _arg in _arguments.args ]
+        _defaults = [ None, ] * (len(_positional) - len(_arguments.defaults)) + list(_arguments.defaults)
+
+        _all = _positional + \
+               ([ (_arguments.vararg, inspect.Parameter.VAR_POSITIONAL), ] if (_arguments.vararg) else []) + \
+               [ (_arg, inspect.Parameter.KEYWORD_ONLY) for _arg in _arguments.kwonlyargs ] + \
+               ([ (_arguments.kwarg, inspect.Parameter.VAR_KEYWORD), ] if (_arguments.kwarg) else [])
+        _defaults += ([ None, ] if (_arguments.vararg) else []) + \
+                     list(_arguments.kw_defaults) + \
+                     ([ None, ] if (_arguments.kwarg) else [])
+
+        for (_arg, _kind), _default in zip(_all, _defaults):
+            _parameters.append(
+                inspect.Parameter(
+                    _arg.arg,
+                    _kind,
+                    default     = self.value(_default, scope=scope) if (_default is not None) else inspect.Parameter.empty,
+                    annotation  = self.annotation(_arg.annotation, scope=scope) if (_arg.annotation is not None) else inspect.Parameter.empty,
+                )
+            )
+
+        return inspect.Signature(
+            _parameters,
+            return_annotation = self.annotation(node.returns, scope=scope) if (node.returns is not None) else inspect.Signature.empty,
+        )
+
+    def value(
+        self,
+        node:ast.expr,
+        *,
+        scope:collections.ChainMap,
+    ) -> Any:
+        """
+        Return the value of expression `node` if it is a literal, or only names other objects;
+        otherwise return its `Expression`.
+        """
+        try:
+            return ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError) as e:
+            pass
+
+        try:
+            _value = self.evaluate(node, scope=scope)
+
+            # If it names a placeholder, the name says more than the placeholder does.
+            if (not isinstance(_value, Expression)):
+                return _value
+        except (Exception, ) as e:
+            pass
+
+        _function = self.value(node.func, scope=scope) if (isinstance(node, ast.Call)) else None
+
+        if (_function in (property, classmethod, staticmethod) and not node.keywords):
+            # e.g. `name = property(get_name, set_name)`; these are safe to call.
+            try:
+                return _function(*map(
+                    lambda arg: self.evaluate(arg, scope=scope),
+                    node.args,
+                ))
+            except (Exception, ) as e:
+                pass
+
+        _expression = Expression(self.source.segment(node))
+
+        # Instances of classes of this module belong to this module, as far as `inspect.getmodule` is concerned.
+        if (
+            isinstance(_function, type) and \
+            (_origin := origin(_function)) is not None and \
+            _origin.module is self.module
+        ):
+            self.register(_expression, node)
+
+        return _expression
+
+    def annotation(
+        self,
+        node:ast.expr,
+        *,
+        scope:collections.ChainMap,
+        resolve:bool = False,
+    ) -> Any:
+        """
+        Return the annotation `node`, as it would be found in the signature.
+
+        If `resolve`, string annotations are evaluated too, as `typing.get_type_hints()` would.
+        """
+        if (self.postponed and not resolve):
+            return self.source.segment(node)
+
+        try:
+            return self.evaluate(node, scope=scope, strings=resolve)
+        except (Exception, ) as e:
+            return Expression(self.source.segment(node))
+
+    def evaluate(
+        self,
+        node:ast.expr,
+        *,
+        scope:collections.ChainMap,
+        strings:bool = False,
+    ) -> Any:
+        """
+        Evaluate an expression made only of literals, names, attributes, subscripts and `|`, without calling anything.
+
+        If `strings`, string constants are parsed and evaluated as expressions too.
+        Raises `NameError` or `TypeError` for anything else.
+        """
+        _evaluate = functools.partial(self.evaluate, scope=scope, strings=strings)
+
+        if (isinstance(node, ast.Constant)):
+            if (strings and isinstance(node.value, str)):
+                return _evaluate(ast.parse(node.value.strip(), mode="eval").body)
+
+            return node.value
+
+        elif (isinstance(node, ast.Name)):
+            if (node.id in scope):
+                return scope[node.id]
+            elif (hasattr(builtins, node.id)):
+                return getattr(builtins, node.id)
+            else:
+                raise NameError(f"name {repr(node.id)} is not defined statically")
+
+        elif (isinstance(node, ast.Attribute)):
+            _base = _evaluate(node.value)
+
+            if (isinstance(_base, ModuleType)):
+                # Never trigger a module `__getattr__`, which might import things.
+                if (node.attr in vars(_base)):
+                    return vars(_base)[node.attr]
+                elif (isinstance(_base, StaticModule)):
+                    return self.loader.import_from(_base.__name__, node.attr, within=self.module)
+            elif (isinstance(_base, (type, property))):
+                return getattr(_base, node.attr)
+
+            raise TypeError(f"cannot evaluate attribute {repr(node.attr)} of {type(_base).__name__} statically")
+
+        elif (isinstance(node, ast.Subscript)):
+            _base = _evaluate(node.value)
+            _slice = node.slice.value if (isinstance(node.slice, getattr(ast, "Index", ()))) else node.slice
+
+            if (
+                isinstance(_base, type) or \
+                getattr(_base, "__module__", None) in ("typing", "typing_extensions", "collections.abc")
+            ):
+                return _base[_evaluate(_slice)]
+
+            raise TypeError(f"cannot subscript {type(_base).__name__} statically")
+
+        elif (isinstance(node, ast.Tuple)):
+            return tuple(map(_evaluate, node.elts))
+
+        elif (isinstance(node, ast.List)):
+            return list(map(_evaluate, node.elts))
+
+        elif (isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr)):
+            return _evaluate(node.left) | _evaluate(node.right)
+
+        raise TypeError(f"cannot evaluate {type(node).__name__} statically")
+
+class StaticLoader():
+    """
+    Build `StaticModule`s by name.
+
+    Source files are found on `path`, defaulting to `sys.path`, the same way the import system finds them,
+    but none of them - nor their parent packages - are imported.
+
+    Modules are kept until any of their source files change.
+    """
+    def __init__(
+        self,
+        path:List[str] = None,
+    ) -> None:
+        self.path = path
+
+        self.modules:Dict[str, StaticModule] = {}
+        self.sources:Dict[str, ModuleSource] = {}
+
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(modules={len(self.modules):,})"
+
+    def refresh(self) -> None:
+        """
+        Forget all modules if any of their source files had changed since they were built.
+        """
+        with self._lock:
+            for _name, _source in self.sources.items():
+                try:
+                    _stat = os.stat(_source.path)
+                    _key = (_stat.st_mtime_ns, _stat.st_size)
+                except (OSError, ) as e:
+                    _key = None
+
+                if (_key != _source.key):
+                    print (f"{repr(_source.path)} had changed; static modules will be built again.")
+                    self.clear()
+                    return
+
+    def clear(self) -> None:
+        """
+        Forget all modules.
+        """
+        with self._lock:
+            self.modules.clear()
+            self.sources.clear()
+
+    def find_spec(
+        self,
+        name:str,
+    ) -> Optional[importlib.machinery.ModuleSpec]:
+        """
+        Find the spec of module `name` without importing its parent packages.
+        """
+        _spec = None
+        _parts = name.split(".")
+
+        for _index in range(len(_parts)):
+            _path = self.path if (_spec is None) else _spec.submodule_search_locations
+
+            if (_index and _path is None):
+                # Parent is not a package
+                return None
+
+            _spec = importlib.machinery.PathFinder.find_spec(".".join(_parts[:_index+1]), _path)
+
+            if (_spec is None):
+                return None
+
+        return _spec
+
+    def load(
+        self,
+        name:str,
+    ) -> StaticModule:
+        """
+        Return the `StaticModule` of `name`, building it if necessary.
+
+        Raises `SourceNotFound` if there is no Python source for `name`.
+        """
+        with self._lock:
+            if (name in self.modules):
+                return self.modules[name]
+
+            _spec = self.find_spec(name)
+
+            if (_spec is None):
+                raise SourceNotFound(f"No module named {repr(name)} can be found on the path.")
+
+            _module = StaticModule(name)
+            _module.__annotations__ = {}
+
+            if (_spec.submodule_search_locations is not None):
+                _module.__path__ = list(_spec.submodule_search_locations)
+                _module.__package__ = name
+            else:
+                _module.__package__ = name.rpartition(".")[0]
+
+            if (_spec.has_location):
+                if (not _spec.origin.endswith(".py")):
+                    raise exceptions.ObjectNotDescribable(
+                        f"{repr(name)} cannot be described statically; {repr(_spec.origin)} is not a Python source file."
+                    )
+
+                _source = sourcemap.get(_spec.origin)
+                _module.__file__ = _spec.origin
+                _module.__doc__ = ast.get_docstring(_source.tree, clean=False)
+            else:
+                # Namespace package
+                _source = None
+
+            # Cache it before building, so that circular imports find the partial module like they would at run time.
+            self.modules[name] = _module
+
+            # Importing a submodule sets it on its parent.
+            if ((_parent := self.modules.get(name.rpartition(".")[0], None)) is not None):
+                setattr(_parent, name.rpartition(".")[2], _module)
+
+            if (_source is not None):
+                self.sources[name] = _source
+
+                _builder = Builder(self, _module, _source)
+                ORIGINS[_module] = Origin(_module, _source.tree, _source)
+
+                # Whatever the module assigns to these, they stay as the loader had set them.
+                _protected = {
+                    _name:vars(_module)[_name] for _name in MODULE_NAMESPACE_PROTECTED \
+                        if (_name in vars(_module))
+                }
+
+                _builder.run(
+                    _source.tree.body,
+                    vars(_module),
+                    scope=collections.ChainMap(vars(_module)),
+                )
+
+                vars(_module).update(_protected)
+
+            return _module
+
+    def is_static(
+        self,
+        name:str,
+        *,
+        within:StaticModule,
+    ) -> bool:
+        """
+        Modules of the same top level package as `within` are built statically; anything else is left to the import system.
+        """
+        return name.split(".")[0] == within.__name__.split(".")[0]
+
+    def import_module(
+        self,
+        name:str,
+        *,
+        within:StaticModule,
+    ) -> Optional[ModuleType]:
+        """
+        Return module `name`, as imported by `within`: a `StaticModule` if it is part of the same package,
+        or the real module if it had already been imported; `None` otherwise.
+        """
+        if (self.is_static(name, within=within)):
+            try:
+                return self.load(name)
+            except (ImportError, exceptions.ObjectNotDescribable) as e:
+                return None
+        else:
+            return sys.modules.get(name, None)
+
+    def import_from(
+        self,
+        name:str,
+        attribute:str,
+        *,
+        within:StaticModule,
+    ) -> Any:
+        """
+        Return `attribute` of module `name`, as `from name import attribute` in `within` would; `None` if it cannot be found.
+        """
+        if (not name):
+            return None
+
+        _module = self.import_module(name, within=within)
+
+        if (_module is not None and attribute in vars(_module)):
+            return vars(_module)[attribute]
+
+        # Could be a submodule
+        return self.import_module(f"{name}.{attribute}", within=within)
+
+    def import_star(
+        self,
+        name:str,
+        *,
+        within:StaticModule,
+    ) -> Dict[str, Any]:
+        """
+        Return the names bound by `from name import *` in `within`: those in the `__all__` of the module if it is a list of names,
+        or else all of its names that do not start with an underscore; empty if the module cannot be found.
+        """
+        if (not name or (_module := self.import_module(name, within=within)) is None):
+            return {}
+
+        _namespace = vars(_module)
+        _all = _namespace.get("__all__", None)
+
+        if (isinstance(_all, (list, tuple)) and all(isinstance(_name, str) for _name in _all)):
+            return {
+                _name:_value for _name in _all \
+                    if ((_value := self.import_from(name, _name, within=within)) is not None)
+            }
+
+        return {
+            _name:_value for _name, _value in list(_namespace.items()) \
+                if (not _name.startswith("_"))
+        }
+
+    @staticmethod
+    def resolve_name(
+        name:Optional[str],
+        level:int,
+        *,
+        within:StaticModule,
+    ) -> Optional[str]:
+        """
+        Resolve a relative import of `name` in `within`.
+        """
+        if (not level):
+            return name
+
+        _package = within.__package__.split(".")
+
+        if (level - 1 >= len(_package)):
+            return None
+
+        _base = ".".join(_package[:len(_package)-(level-1)])
+
+        return f"{_base}.{name}" if (name) else _base
+
+LOADER = StaticLoader()
+
+def load(
+    name:str,
+) -> StaticModule:
+    """
+    Return the `StaticModule` of `name` from the default loader, building it again if any of its source files had changed.
+    """
+    LOADER.refresh()
+
+    return LOADER.load(name)
+
+def get_object(
+    obj:Optional[str],
+    source:str,
+) -> Any:
+    """
+    ### Get the static object referenced by `obj` and `source`
+
+    The static counterpart of `bin.get_object()`:
+    - if `obj` is `None`, return the module `source`;
+    - if `obj` is a `str`, return attribute or submodule `obj` of module `source`.
+    """
+    if (not isinstance(source, str)):
+        raise InvalidFunctionArgument(
+            f"{repr(source)} not recognised as a `source` for a static object; a module name is expected."
+        )
+
+    _module = load(source)
+
+    if (obj is None):
+        return _module
+
+    elif (isinstance(obj, str)):
+        _value = LOADER.import_from(source, obj, within=_module)
+
+        if (_value is None):
+            raise SourceHasNoSuchAttribute(
+                f"Requested attribute {repr(obj)} is not found in {repr(_module)}."
+            )
+
+        return _value
+
+    else:
+        raise InvalidFunctionArgument(
+            f"Parameters not understood for static `get_object()`: obj={repr(obj)}, source={repr(source)}"
+        )
+
+def source_files(
+    obj:Any,
+) -> List[str]:
+    """
+    Return the source files that describing `obj` might read:
+    the file of its module, or all Python files of its package.
+    """
+    _module = obj if (isinstance(obj, StaticModule)) else getattr(origin(obj), "module", None)
+
+    if (_module is None):
+        return []
+
+    _files = [ _module.__file__, ] if (getattr(_module, "__file__", None)) else []
+
+    for _directory in getattr(_module, "__path__", []):
+        for _root, _directories, _names in os.walk(_directory):
+            _directories[:] = [ _name for _name in _directories if (not _name.startswith(".") and _name != "__pycache__") ]
+            _files += [ os.path.join(_root, _name) for _name in _names if (_name.endswith(".py")) ]
+
+    return sorted(set(_files))
@@ -13,11 +13,26 @@ print = logger.debug
 
     
 
-def shell_output(command:List[str])->str:
+def shell_output(
+    command:List[str],
+    *,
+    cwd:str = None,
+    input:str = None,
+)->str:
+    """
+    Run `command` and return its stripped output, or a `FalseEvaluatingException` if it failed.
+
+    `command` runs in `cwd` if provided; the working directory of this process is never changed.
+    `input`, if provided, is fed to its standard input.
+    """
     try:    
-        print(f"Calling {repr(command)}...")
+        print(f"Calling {repr(command)}{f' in {repr(cwd)}' if cwd else ''}...")
 
-        _return = subprocess.check_output(command)
+        _return = subprocess.check_output(
+            command,
+            cwd     = cwd,
+            input   = input.encode("utf-8") if (input is not None) else None,
+        )
 
         if (isinstance(_return, bytes)):
             _return = _return.decode("utf-8")
@@ -3,7 +3,9 @@ Markdown and Python source code formatting.
 """
 
 import contextlib
+import functools
 import inspect
+import os
 import re
 
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type, Union
@@ -13,8 +15,54 @@ import black.mode
 import black.report
 
 
+from . import settings
+from .classes.formatcache import FormatCache
 from .classes.io import SpoofedStdoutIO
 
+# Mode used to format signatures, e.g. `describe.function.signature_source_code()`.
+SIGNATURE_MODE = black.FileMode(line_length=20)
+
+@functools.lru_cache(maxsize=None)
+def format_cache() -> Optional[FormatCache]:
+    """
+    Return the `FormatCache` shared by all formatting functions, or `None` if it is disabled by `settings.FORMAT_CACHE_SIZE`.
+    """
+    if (not settings.FORMAT_CACHE_SIZE):
+        return None
+
+    _directory = settings.FORMAT_CACHE_LOCATION or os.path.join(
+        os.environ.get("XDG_CACHE_HOME", None) or os.path.join(os.path.expanduser("~"), ".cache"),
+        "readme-compiler",
+        "format",
+    )
+
+    return FormatCache(_directory, maxsize=settings.FORMAT_CACHE_SIZE)
+
+def format_cache_key(
+    source_code:str,
+    *,
+    write_back:black.WriteBack,
+    mode:black.mode.Mode,
+) -> str:
+    """
+    Return the key of the formatted `source_code` in the `format_cache()`.
+    """
+    return FormatCache.key(
+        source_code,
+        mode.get_cache_key(),
+        write_back.name,
+        black.__version__,
+    )
+
+def clear_cache() -> None:
+    """
+    Forget all formatted source code, both in memory and on disk.
+    """
+    format_signature.cache_clear()
+
+    if ((_cache := format_cache()) is not None):
+        _cache.clear()
+
 def format_source_code(
     source_code:str,
     *,
@@ -23,27 +71,71 @@ def format_source_code(
 ) -> str:
     """
     Use `black` to format the code of object.
+
+    Results are kept in the `format_cache()`, so that unchanged code is not formatted again on the next run.
     """
-    with    SpoofedStdoutIO() as _io, \
-            contextlib.redirect_stdout(_io) as context:
+    def _format() -> Optional[str]:
+        with    SpoofedStdoutIO() as _io, \
+                contextlib.redirect_stdout(_io) as context:
 
-        _report = black.report.Report(quiet=True)
+            _report = black.report.Report(quiet=True)
 
-        black.reformat_code(
-            content     = source_code,
-            fast        = False,
-            write_back  = write_back,
-            mode        = mode,
-            report      = _report,
-        )
+            black.reformat_code(
+                content     = source_code,
+                fast        = False,
+                write_back  = write_back,
+                mode        = mode,
+                report      = _report,
+            )
 
-        _io.seek(0)
-        _return = _io.getvalue()
+            _io.seek(0)
+            _return = _io.getvalue()
+
+            return _return.decode("utf-8") if _return else None
+
+    if ((_cache := format_cache()) is None):
+        return _format()
+
+    return _cache.get_or_set(
+        format_cache_key(source_code, write_back=write_back, mode=mode),
+        _format,
+    )
 
-        return _return.decode("utf-8") if _return else None
-    
 source_code = format_source_code
 
+@functools.lru_cache(maxsize=4096)
+def format_signature(
+    source_code:str,
+    *,
+    mode:black.mode.Mode        = SIGNATURE_MODE,
+) -> str:
+    """
+    Fast path of `format_source_code()` for synthetic stubs like `def func(a, b=1): __VOID_FUNCTION__()`,
+    returning exactly the same text.
+
+    `black`'s AST equivalence check is skipped, and no `stdout` is redirected;
+    the results are memoized by `(source_code, mode)`, and shared with `format_source_code()` through the `format_cache()`.
+    """
+    def _format() -> Optional[str]:
+        try:
+            _return = black.format_str(source_code, mode=mode)
+        except (Exception, ) as e:
+            # `black.reformat_code()` outputs the source unchanged if it cannot be formatted.
+            _return = source_code
+
+        if (_return and not _return.endswith("\n")):
+            _return += "\n"
+
+        return _return or None
+
+    if ((_cache := format_cache()) is None):
+        return _format()
+
+    return _cache.get_or_set(
+        format_cache_key(source_code, write_back=black.WriteBack.YES, mode=mode),
+        _format,
+    )
+
 def prefix(
     source_code:str,
     lead:str,
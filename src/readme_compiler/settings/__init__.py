@@ -11,6 +11,7 @@ README_SOURCE_DIRECTORY                 =   ".readme.source"
 
 README_METADATA_INDEX                   =   ".README.metadata.json"
 README_METADATA_DIRECTORY               =   "{descriptor}.{qualname}.metadata.json"    # this does not include path
+README_METADATA_CONSOLIDATED            =   None    # e.g. ".metadata.json" - one file holding the metadata of all objects in its directory, by sidecar name; `None` to disable
 
 README_BRANCH_DESCRIPTION_TEMPLATE      =   "branch.{branch}.md"
 
@@ -20,4 +21,26 @@ TEMPLATE_LOCATION                       =   "/.readme.templates"
 TEMPLATE_FILE_NAME                      =   "template.{template}.md"
 
 LOGO_URL                                =   f"/{README_SOURCE_DIRECTORY}/.logo"
-FOOTER_LOCATION                         =   f"/{README_SOURCE_DIRECTORY}/.footer"
\ No newline at end of file
+FOOTER_LOCATION                         =   f"/{README_SOURCE_DIRECTORY}/.footer"
+
+TEMPLATE_CACHE_SIZE                     =   128     # compiled templates kept in memory by each `RepositoryDirectory`
+STATE_LOCATION                          =   None    # where the files below are kept; `None` uses `readme-compiler` in the git directory of the repository, e.g. `/.git/readme-compiler`
+TEMPLATE_STORE_LOCATION                 =   "templates" # compiled templates kept across runs, inside STATE_LOCATION; `None` to disable
+
+SIGNATURE_RENDERER                      =   "native"    # "native" lays out signatures without `black` where it can; "black" always uses `black`
+
+DESCRIBE_BACKEND                        =   "import"    # "import" describes imported modules; "static" describes them from their source code, without importing them
+
+FORMAT_CACHE_LOCATION                   =   None    # `None` uses $XDG_CACHE_HOME/readme-compiler/format, or ~/.cache/readme-compiler/format
+FORMAT_CACHE_SIZE                       =   64 * 1024 * 1024    # bytes of formatted source code kept across runs; `0` to disable
+
+BUILD_MANIFEST_LOCATION                 =   "manifest.json"     # inside STATE_LOCATION
+
+SOURCE_INDEX_LOCATION                   =   "sources.json"      # inside STATE_LOCATION
+
+DISCOVERY_USE_GIT_INDEX                 =   False   # list Markdown files with `git ls-files` instead of scanning the file system
+
+WATCH_DEBOUNCE                          =   0.25    # seconds of quiet before recompiling changed files
+WATCH_POLL_INTERVAL                     =   1.0     # seconds between scans if inotify is not available
+
+DAEMON_SOCKET_LOCATION                  =   None    # `None` uses $README_COMPILER_SOCKET, or a per-user socket in $XDG_RUNTIME_DIR or the temporary directory
\ No newline at end of file
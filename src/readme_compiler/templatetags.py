@@ -15,7 +15,8 @@ from .django_setup import register  # Required to avoid django.template.library.
 
 import readme_compiler
 
-from . import bin, classes, settings, stdout
+from . import bin, classes, dependencies, exceptions, settings, stdout
+from .describe import static
 from .settings.enums import RenderPurpose
 
 @django_setup.register.simple_tag(
@@ -33,7 +34,11 @@ def embed(
     """
     if (isinstance(_repository := context.get("repository_object", None), classes.RepositoryDirectory)):
         # Make sure we are pointing to the rendered path (not very crucial)
-        path = _repository.repopath.parse(path).source
+        # Relative paths are relative to the template being rendered, not the working directory of the process.
+        path = _repository.repopath.parse(
+            path,
+            cwd = context.get("template_directory", None),
+        ).source
 
         # This is always a dry_run because we are returning the value
         _return = _repository.render(path, dry_run = True, purpose=RenderPurpose.EMBED)
@@ -68,7 +73,14 @@ def logo(
     Insert a logo.
     """
     if (isinstance(_repository := context.get("repository_object", None), classes.RepositoryDirectory)):
-        path = _repository.repopath.abspath(_repository.repopath.parse(settings.LOGO_URL).source)
+        _directory = context.get("template_directory", None)
+
+        path = _repository.repopath.abspath(
+            _repository.repopath.parse(settings.LOGO_URL, cwd=_directory).source,
+            cwd = _directory,
+        )
+
+        dependencies.record(path)
         
         with open(path, "r") as _f:
             _url = _f.read().format(**kwargs)
@@ -86,15 +98,20 @@ def describe(
     obj:str,
     source:str=None,
     metadata:Dict[str, Any]=None,
+    backend:str=None,
 ):
     """
     ### `describe` an object using a template.
 
     This template tag can dynamically import modules and their attributes, then describe it.
 
+    With `backend='static'`, `source` is not imported; its objects are read from its source code instead.
+    The backend defaults to that of the repository, i.e. `settings.DESCRIBE_BACKEND` unless overridden.
+
     Usage:
     ```
     {% describe 'module' obj='MyClass' source='test_repo' %}
+    {% describe 'module' obj=None source='test_repo' backend='static' %}
     ```
     """
 
@@ -105,13 +122,38 @@ def describe(
     #     metadata]
     # ))
 
+    if (backend is None):
+        if (isinstance(_repository := context.get("repository_object", None), classes.RepositoryDirectory)):
+            backend = _repository.settings.describe_backend
+        else:
+            backend = settings.DESCRIBE_BACKEND
+
     if (not isinstance(obj, readme_compiler.describe.object)):
-        obj = bin.get_object(
-            obj     = obj,
-            source  = source,
-            globals = globals(),
-            locals  = context,
-        )
+        if (backend == "static" and source is not None):
+            obj = static.get_object(
+                obj     = obj,
+                source  = source,
+            )
+
+            # The rendered text changes with the source code of the described module.
+            dependencies.record(*static.source_files(obj))
+
+        elif (backend in ("import", "static")):
+            # Without a `source`, `obj` is looked up in the context by both backends.
+            obj = bin.get_object(
+                obj     = obj,
+                source  = source,
+                globals = globals(),
+                locals  = context,
+            )
+
+            # The rendered text changes with the source code of the described module.
+            dependencies.record_object(obj)
+
+        else:
+            raise exceptions.InvalidFunctionArgument(
+                f"Unknown describe backend {repr(backend)}; 'import' or 'static' expected."
+            )
 
         # `template` here is:
         # - 'module'
@@ -0,0 +1,369 @@
+"""
+## Watch Module
+
+Keep a `RepositoryDirectory` alive, and recompile the Markdowns affected whenever their inputs change.
+
+Changes are detected with inotify where it is available (Linux), by polling modification times otherwise.
+Events arriving within `settings.WATCH_DEBOUNCE` seconds of each other are collected into a single recompile,
+so that an editor saving several files at once only triggers one.
+"""
+
+import abc
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+import readme_compiler.classes as classes
+
+from . import bin
+from . import settings
+from . import stdout
+from .log import logger
+
+print = logger.debug
+
+class ChangeWatcher(abc.ABC):
+    """
+    Base class for watching a set of directories for changed files.
+
+    Directories are watched non-recursively; call `update()` to change the set of watched directories.
+    """
+    def __init__(
+        self,
+        directories:Iterable[str],
+    ) -> None:
+        self.directories:Set[str] = set()
+
+        # Set if the watcher may have missed some changes; everything should then be considered changed.
+        self.overflowed = False
+
+        self.update(directories)
+
+    def __enter__(self) -> "ChangeWatcher":
+        return self
+
+    def __exit__(self, *args) -> bool:
+        self.close()
+        return False
+
+    def update(
+        self,
+        directories:Iterable[str],
+    ) -> None:
+        """
+        Replace the set of watched directories.
+        """
+        self.directories = set(map(os.path.abspath, directories))
+
+    @abc.abstractmethod
+    def wait(
+        self,
+        timeout:float = None,
+    ) -> Set[str]:
+        """
+        Block until some files had changed, and return their absolute paths.
+
+        Returns an empty `set` if nothing had changed within `timeout` seconds; `None` waits indefinitely.
+        """
+
+    def close(self) -> None:
+        """
+        Release any resources held by the watcher.
+        """
+        pass
+
+class PollingWatcher(ChangeWatcher):
+    """
+    Portable `ChangeWatcher` comparing the modification times and sizes of files every `interval` seconds.
+    """
+    def __init__(
+        self,
+        directories:Iterable[str],
+        *,
+        interval:float = None,
+    ) -> None:
+        self.interval = interval or settings.WATCH_POLL_INTERVAL
+        self._snapshot:Dict[str, Tuple[int, int]] = {}
+
+        super().__init__(directories)
+
+    def update(
+        self,
+        directories:Iterable[str],
+    ) -> None:
+        super().update(directories)
+
+        # Changes made before the directories were watched are not reported.
+        self._snapshot = self.snapshot()
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Return the modification time and size of every file in the watched directories.
+        """
+        _snapshot = {}
+
+        for _directory in self.directories:
+            try:
+                with os.scandir(_directory) as _entries:
+                    for _entry in _entries:
+                        if (_entry.is_file()):
+                            _stat = _entry.stat()
+                            _snapshot[_entry.path] = (_stat.st_mtime_ns, _stat.st_size)
+            except (OSError, ) as e:
+                print (f"Cannot scan {repr(_directory)}: {type(e).__name__}: {str(e)}")
+
+        return _snapshot
+
+    def wait(
+        self,
+        timeout:float = None,
+    ) -> Set[str]:
+        _deadline = None if (timeout is None) else time.monotonic() + timeout
+
+        while True:
+            _snapshot = self.snapshot()
+            _changed = {
+                _path for _path in set(_snapshot) | set(self._snapshot) \
+                    if (_snapshot.get(_path) != self._snapshot.get(_path))
+            }
+            self._snapshot = _snapshot
+
+            if (_changed):
+                return _changed
+
+            if (_deadline is None):
+                time.sleep(self.interval)
+            elif ((_remaining := _deadline - time.monotonic()) > 0):
+                time.sleep(min(self.interval, _remaining))
+            else:
+                return set()
+
+class InotifyWatcher(ChangeWatcher):
+    """
+    `ChangeWatcher` using the Linux inotify API through `ctypes`.
+
+    Raises `OSError` on initialisation if inotify is not available.
+    """
+    IN_MODIFY       = 0x00000002
+    IN_ATTRIB       = 0x00000004
+    IN_CLOSE_WRITE  = 0x00000008
+    IN_MOVED_FROM   = 0x00000040
+    IN_MOVED_TO     = 0x00000080
+    IN_CREATE       = 0x00000100
+    IN_DELETE       = 0x00000200
+    IN_Q_OVERFLOW   = 0x00004000
+    IN_IGNORED      = 0x00008000
+    IN_ONLYDIR      = 0x01000000
+
+    IN_NONBLOCK     = os.O_NONBLOCK
+    IN_CLOEXEC      = os.O_CLOEXEC
+
+    MASK            = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+    EVENT_HEADER    = struct.Struct("iIII")  # wd, mask, cookie, len
+
+    def __init__(
+        self,
+        directories:Iterable[str],
+    ) -> None:
+        _libc_path = ctypes.util.find_library("c")
+
+        try:
+            self._libc = ctypes.CDLL(_libc_path, use_errno=True)
+            self._libc.inotify_init1
+        except (OSError, AttributeError, TypeError) as e:
+            raise OSError(f"inotify is not available on this system: {type(e).__name__}: {str(e)}")
+
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+
+        if (self._fd < 0):
+            _errno = ctypes.get_errno()
+            raise OSError(_errno, f"inotify_init1 failed: {os.strerror(_errno)}")
+
+        # Watch descriptors and the directories they belong to.
+        self._watches:Dict[int, str] = {}
+
+        super().__init__(directories)
+
+    def update(
+        self,
+        directories:Iterable[str],
+    ) -> None:
+        _directories = set(map(os.path.abspath, directories))
+
+        for _wd, _directory in list(self._watches.items()):
+            if (_directory not in _directories):
+                self._libc.inotify_rm_watch(self._fd, _wd)
+                del self._watches[_wd]
+
+        _watched = set(self._watches.values())
+
+        for _directory in _directories - _watched:
+            _wd = self._libc.inotify_add_watch(self._fd, os.fsencode(_directory), self.MASK)
+
+            if (_wd < 0):
+                print (f"Cannot watch {repr(_directory)}: {os.strerror(ctypes.get_errno())}")
+            else:
+                self._watches[_wd] = _directory
+
+        self.directories = set(self._watches.values())
+
+    def wait(
+        self,
+        timeout:float = None,
+    ) -> Set[str]:
+        _changed = set()
+
+        _readable, _, _ = select.select([self._fd, ], [], [], timeout)
+
+        if (not _readable):
+            return _changed
+
+        try:
+            _buffer = os.read(self._fd, 1 << 16)
+        except (BlockingIOError, ) as e:
+            return _changed
+
+        _offset = 0
+        while (_offset + self.EVENT_HEADER.size <= len(_buffer)):
+            _wd, _mask, _cookie, _length = self.EVENT_HEADER.unpack_from(_buffer, _offset)
+            _offset += self.EVENT_HEADER.size
+            _name = _buffer[_offset:_offset+_length].rstrip(b"\0")
+            _offset += _length
+
+            if (_mask & self.IN_Q_OVERFLOW):
+                self.overflowed = True
+            elif (_mask & self.IN_IGNORED):
+                # The directory had been deleted or unmounted.
+                self._watches.pop(_wd, None)
+            elif (_wd in self._watches):
+                _changed.add(
+                    os.path.join(self._watches[_wd], os.fsdecode(_name)) if (_name) else self._watches[_wd]
+                )
+
+        return _changed
+
+    def close(self) -> None:
+        if (self._fd >= 0):
+            os.close(self._fd)
+            self._fd = -1
+
+def create_watcher(
+    directories:Iterable[str],
+    *,
+    polling:bool = False,
+) -> ChangeWatcher:
+    """
+    Return an `InotifyWatcher` if inotify is available and `polling` is not requested, or a `PollingWatcher` otherwise.
+    """
+    directories = list(directories)
+
+    if (not polling):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, ) as e:
+            print (f"Falling back to polling: {str(e)}")
+
+    return PollingWatcher(directories)
+
+def watched_directories(
+    repository:"classes.RepositoryDirectory",
+) -> Set[str]:
+    """
+    Return all the directories containing sources of `repository`, or any file they depend on, plus the templates folder.
+    """
+    _directories = {
+        repository.git.path,
+        repository.repopath.abspath(settings.TEMPLATE_LOCATION),
+        repository.repopath.abspath(settings.FOOTER_LOCATION).rsplit("/", 1)[0],
+    }
+
+    for _source in repository.list_sources():
+        _directories.add(os.path.dirname(os.path.abspath(_source)))
+
+    for _source, _dependencies in repository.dependencies.edges.items():
+        _directories.add(os.path.dirname(_source))
+        _directories.update(map(os.path.dirname, _dependencies))
+
+    return set(filter(os.path.isdir, _directories))
+
+def is_relevant(
+    repository:"classes.RepositoryDirectory",
+    path:str,
+) -> bool:
+    """
+    Check if a change to `path` can affect any rendered output of `repository`.
+
+    Rendered outputs themselves are not relevant - otherwise every compile would trigger another one.
+    """
+    path = os.path.abspath(path)
+
+    if (repository.dependencies.dependents(path) or path in repository.dependencies):
+        return True
+    elif (path.startswith(repository.repopath.abspath(settings.TEMPLATE_LOCATION) + os.sep)):
+        return True
+    elif (bin.is_markdown(path)):
+        # New sources, which are not in the dependency graph yet.
+        try:
+            return repository.repopath.parse(path).source == path
+        except (ValueError, ) as e:
+            # Not a README, nor in a source or rendered folder, e.g. `notes.md`.
+            return False
+    else:
+        return False
+
+def watch(
+    repository:"classes.RepositoryDirectory",
+    *,
+    jobs:Union[int, str]    = None,
+    debounce:float          = None,
+    polling:bool            = False,
+) -> None:
+    """
+    Compile `repository`, then keep recompiling the sources affected by any changes until interrupted.
+    """
+    debounce = settings.WATCH_DEBOUNCE if (debounce is None) else debounce
+
+    repository.compile(jobs=jobs)
+
+    with create_watcher(watched_directories(repository), polling=polling) as _watcher:
+        logger.info(f"Watching {stdout.cyan(len(_watcher.directories))} directories with {stdout.white(type(_watcher).__name__)}; press Ctrl+C to stop.")
+
+        try:
+            while True:
+                _changed = _watcher.wait()
+
+                # Collect everything that changes within the debounce window.
+                while (_more := _watcher.wait(debounce)):
+                    _changed.update(_more)
+
+                if (_watcher.overflowed):
+                    # Some events were lost; let the build manifest work out what had changed.
+                    _watcher.overflowed = False
+                    _changed = None
+                else:
+                    _changed = { _path for _path in _changed if (is_relevant(repository, _path)) }
+
+                    if (not _changed):
+                        continue
+
+                    for _path in sorted(_changed):
+                        logger.info(f"Changed: {repository.colour_path(_path)}")
+
+                repository.invalidate(_changed)
+
+                try:
+                    repository.compile(jobs=jobs, changed=_changed)
+                except (Exception, ) as e:
+                    # A broken template or module should not stop the watch.
+                    logger.error(" - "+stdout.red("ERROR  : ")+f"Compile failed: {type(e).__name__}: {str(e)}")
+
+                _watcher.update(watched_directories(repository))
+
+        except (KeyboardInterrupt, ) as e:
+            logger.info("")
+            logger.info(stdout.blue("readme-compiler") + " stopped watching.")
@@ -0,0 +1,126 @@
+"""
+Thin client for the `readme_compiler` daemon.
+
+Only the standard library is imported, so that this starts in milliseconds;
+all the actual work happens in a daemon started with `python -m readme_compiler --daemon`.
+If no daemon is listening, the compile falls back to running `python -m readme_compiler` in a subprocess.
+
+Usage:
+```
+python -m readme_compiler_client [--jobs N|auto] [--force] [--socket PATH] [PATH ...]
+python -m readme_compiler_client --stop
+```
+If `PATH`s are given, only the sources depending on them are compiled.
+"""
+
+import argparse
+import json
+import os, sys
+import socket
+import subprocess
+import tempfile
+from typing import Any, Dict, List
+
+def socket_path()->str:
+    """
+    Return the path of the daemon socket; mirrors `readme_compiler.daemon.socket_path()` without importing it.
+    """
+    return \
+        os.environ.get("README_COMPILER_SOCKET", None) or \
+        os.path.join(
+            os.environ.get("XDG_RUNTIME_DIR", None) or os.path.join(tempfile.gettempdir(), f"readme-compiler-{os.getuid()}"),
+            "readme-compiler.sock",
+        )
+
+def jobs_argument(value:str)->str:
+    """
+    Validate the value of `--jobs`: either a positive integer, or `auto`; mirrors `readme_compiler.__main__.jobs_argument()` without importing it.
+    """
+    if (value.lower() == "auto"):
+        return "auto"
+
+    try:
+        _jobs = int(value)
+    except ValueError as e:
+        _jobs = 0
+
+    if (_jobs < 1):
+        raise argparse.ArgumentTypeError(f"expected a positive integer or 'auto'; {repr(value)} found.")
+
+    return _jobs
+
+def parser()->argparse.ArgumentParser:
+    """
+    Build the command line interface of `python -m readme_compiler_client`.
+    """
+    _parser = argparse.ArgumentParser(
+        prog        = "python -m readme_compiler_client",
+        description = "Ask the readme_compiler daemon to compile the git repository of the current directory.",
+    )
+
+    _parser.add_argument("paths", nargs="*", metavar="PATH", help="only compile the sources depending on these changed files.")
+    _parser.add_argument("--jobs", "-j", type=jobs_argument, default=1, metavar="N|auto", help="number of worker processes to render with. (default: 1)")
+    _parser.add_argument("--force", "-f", action="store_true", help="render all files, even if their inputs had not changed.")
+    _parser.add_argument("--socket", default=None, metavar="PATH", help="socket of the daemon. (default: $README_COMPILER_SOCKET, or a per-user socket in $XDG_RUNTIME_DIR or the temporary directory)")
+    _parser.add_argument("--stop", action="store_true", help="stop the daemon instead of compiling.")
+    _parser.add_argument("--no-fallback", action="store_true", help="fail instead of running python -m readme_compiler if no daemon is listening.")
+
+    return _parser
+
+def request(
+    payload:Dict[str, Any],
+    *,
+    path:str = None,
+)->bool:
+    """
+    Send `payload` to the daemon, print the log it streams back, and return whether it succeeded.
+
+    Raises `OSError` if the daemon cannot be reached.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as _socket:
+        _socket.connect(path or socket_path())
+        _socket.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+
+        with _socket.makefile("r", encoding="utf-8") as _stream:
+            for _line in _stream:
+                _response = json.loads(_line)
+
+                if ("log" in _response):
+                    print (_response["log"], flush=True)
+                elif ("error" in _response):
+                    print (f"readme-compiler daemon: {_response['error']}", file=sys.stderr)
+                    return False
+                elif ("success" in _response):
+                    return bool(_response["success"])
+
+    # The daemon hung up without concluding.
+    return False
+
+def main(argv:List[str]=None)->int:
+    _args = parser().parse_args(argv)
+
+    if (_args.stop):
+        _payload = { "command": "stop" }
+    else:
+        _payload = {
+            "command":  "compile",
+            "root":     os.getcwd(),
+            "changed":  [ os.path.abspath(_path) for _path in _args.paths ] if (_args.paths) else None,
+            "jobs":     _args.jobs,
+            "force":    _args.force,
+        }
+
+    try:
+        return 0 if (request(_payload, path=_args.socket)) else 1
+    except (OSError, ) as e:
+        if (_args.stop or _args.no_fallback):
+            print (f"readme-compiler daemon is not available at {_args.socket or socket_path()}: {str(e)}", file=sys.stderr)
+            return 2
+
+    # No daemon - do it the slow way.
+    return subprocess.call(
+        [sys.executable, "-m", "readme_compiler", "--jobs", str(_args.jobs), ] + (["--force", ] if (_args.force) else []) + ["--", *_args.paths],
+    )
+
+if (__name__ == "__main__"):
+    sys.exit(main())
@@ -0,0 +1,303 @@
+import concurrent.futures
+import contextlib
+import os
+import subprocess
+import tempfile
+import unittest
+import unittest.mock
+
+from readme_compiler import watch
+from readme_compiler.classes import RepositoryDirectory, gitreader, unique_results, walker
+from readme_compiler.classes.results import RenderResult
+from readme_compiler.daemon import CompileDaemon
+
+def git(path, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=path, check=True, capture_output=True, text=True,
+    ).stdout
+
+def write(root, files):
+    for _path, _content in files.items():
+        os.makedirs(os.path.dirname(os.path.join(root, _path)), exist_ok=True)
+
+        with open(os.path.join(root, _path), "w") as _f:
+            _f.write(_content)
+
+@contextlib.contextmanager
+def temporary_repository(files):
+    """
+    Create a git repository in a temporary directory containing `files`, a `dict` of their relative paths and contents.
+    """
+    with tempfile.TemporaryDirectory() as _directory:
+        git(_directory, "init", "-q")
+        write(_directory, files)
+
+        yield os.path.realpath(_directory)
+
+class TestThreads(unittest.TestCase):
+    """
+    `RepositoryDirectory.render()` can be called from multiple threads.
+    """
+
+    FILES = {
+        ".readme.source/.footer": "Shared footer.\n",
+        **{
+            f"part{_i}/.README.source.md": f"# Part {_i}\n{{% embed \"../.readme.source/.footer\" %}}\n" \
+                for _i in range(8)
+        },
+    }
+
+    def test_concurrent_renders(self):
+        with temporary_repository(self.FILES) as _root:
+            _repository = RepositoryDirectory(_root)
+            _sources = _repository.list_sources()
+
+            with unittest.mock.patch.object(RepositoryDirectory, "save", autospec=True, side_effect=RepositoryDirectory.save) as _save:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(_sources)) as _executor:
+                    _rendered = list(_executor.map(_repository.render, _sources))
+
+            self.assertTrue(all("Shared footer." in _text for _text in _rendered))
+
+            # The shared footer is only rendered once for each purpose, however many threads embed it at the same time.
+            _saved = [ (_call.args[1], _call.kwargs["dry_run"]) for _call in _save.call_args_list ]
+            self.assertEqual(len(_saved), len(set(_saved)))
+            self.assertIn((os.path.join(_root, ".readme.source", ".footer"), True), _saved)
+
+            # None of the `git add`s failed on the index lock.
+            _staged = set(git(_root, "diff", "--cached", "--name-only").split())
+            self.assertEqual(
+                _staged,
+                {
+                    ".readme.source/.footer",
+                    ".readme/.footer",
+                    *( f"part{_i}/{_name}" for _i in range(8) for _name in (".README.source.md", "README.md") ),
+                },
+            )
+
+class TestWatch(unittest.TestCase):
+    """
+    Only changes that can affect the rendered files trigger a compile.
+    """
+
+    def test_is_relevant(self):
+        with temporary_repository({ ".README.source.md": "# Root\n", "notes.md": "Notes.\n" }) as _root:
+            _repository = RepositoryDirectory(_root)
+
+            self.assertTrue(watch.is_relevant(_repository, os.path.join(_root, ".README.source.md")))
+            self.assertTrue(watch.is_relevant(_repository, os.path.join(_root, "new", ".README.source.md")))
+            self.assertFalse(watch.is_relevant(_repository, os.path.join(_root, "README.md")))
+            self.assertFalse(watch.is_relevant(_repository, os.path.join(_root, "notes.md")))
+
+    def test_wait_required(self):
+        class _Watcher(watch.ChangeWatcher):
+            pass
+
+        with self.assertRaises(TypeError):
+            _Watcher([])
+
+class TestGitReader(unittest.TestCase):
+    """
+    `gitreader.read_metadata()` must agree with `git` itself.
+    """
+
+    def assertSameAsGit(self, path):
+        _metadata = gitreader.read_metadata(path)
+
+        self.assertIsNotNone(_metadata)
+        self.assertEqual(_metadata.hook, git(path, "config", "--get", "remote.origin.url").strip())
+        self.assertEqual(_metadata.branch, git(path, "rev-parse", "--abbrev-ref", "HEAD").strip())
+        self.assertEqual(_metadata.path, git(path, "rev-parse", "--show-toplevel").strip())
+
+    def test_same_as_git(self):
+        with temporary_repository({ "sub/file.md": "# File\n" }) as _root:
+            git(_root, "remote", "add", "origin", "https://github.com/example/repo.git")
+            git(_root, "checkout", "-q", "-b", "feature/reader")
+            git(_root, "add", "-A")
+            git(_root, "commit", "-q", "-m", "First")
+
+            self.assertSameAsGit(_root)
+            self.assertSameAsGit(os.path.join(_root, "sub"))
+
+            # Detached HEAD
+            git(_root, "checkout", "-q", "--detach")
+            self.assertSameAsGit(_root)
+
+            # Linked worktree, where `.git` is a file.
+            git(_root, "worktree", "add", "-q", "-b", "other", os.path.join(_root, "linked"))
+            self.assertTrue(os.path.isfile(os.path.join(_root, "linked", ".git")))
+            self.assertSameAsGit(os.path.join(_root, "linked"))
+
+    def test_first_commit(self):
+        with temporary_repository({ "file.md": "# File\n" }) as _root:
+            git(_root, "checkout", "-q", "-b", "feature/unborn")
+
+            # No commits yet - `git rev-parse` fails, which is read as `main`.
+            self.assertEqual(gitreader.read_metadata(_root).branch, "main")
+
+            # Only the loose ref of the branch is created, not touching `HEAD`.
+            git(_root, "add", "-A")
+            git(_root, "commit", "-q", "-m", "First")
+
+            self.assertEqual(gitreader.read_metadata(_root).branch, "feature/unborn")
+
+class TestDaemon(unittest.TestCase):
+    """
+    The daemon notices when `HEAD` moves, including in linked worktrees.
+    """
+
+    def test_head_path(self):
+        with temporary_repository({ "file.md": "# File\n" }) as _root:
+            git(_root, "add", "-A")
+            git(_root, "commit", "-q", "-m", "First")
+            git(_root, "worktree", "add", "-q", "-b", "other", os.path.join(_root, "linked"))
+
+            for _path in (_root, os.path.join(_root, "linked")):
+                self.assertEqual(
+                    CompileDaemon.head_path(RepositoryDirectory(_path)),
+                    os.path.join(_path, git(_path, "rev-parse", "--git-path", "HEAD").strip()),
+                )
+
+class TestWalker(unittest.TestCase):
+    """
+    `walker.walk()` must skip exactly the files `git` ignores.
+    """
+
+    FILES = {
+        ".gitignore":               "*.log\n!keep.log\nbuild/\n/anchored.md\ndocs/**/draft.md\n",
+        ".git/info/exclude":        "excluded.md\n",
+        "README.md":                "",
+        "debug.log":                "",
+        "keep.log":                 "",
+        "anchored.md":              "",
+        "excluded.md":              "",
+        "build/output.md":          "",
+        "nested/anchored.md":       "",
+        "nested/build":             "",
+        "nested/.gitignore":        "*.md\n!README.md\n",
+        "nested/README.md":         "",
+        "nested/notes.md":          "",
+        "docs/a/b/draft.md":        "",
+        "docs/a/b/final.md":        "",
+    }
+
+    def test_same_as_git(self):
+        with temporary_repository(self.FILES) as _root:
+            _walked = { os.path.relpath(_path, _root) for _path in walker.walk(_root) }
+
+            _listed = set(filter(None, git(_root, "ls-files", "-z", "--others", "--exclude-standard").split("\0")))
+
+            # `.gitignore`s themselves are never yielded.
+            self.assertEqual(_walked, { _path for _path in _listed if (os.path.basename(_path) != ".gitignore") })
+
+class TestIncremental(unittest.TestCase):
+    """
+    Sources are rendered again exactly when any of their inputs change, including with multiple workers.
+    """
+
+    FILES = {
+        ".readme.source/.footer": "Footer of every README.\n",
+        ".readme.source/.shared": "Shared fragment.\n",
+        "first/.README.source.md": "# First\n{% embed \"../.readme.source/.shared\" %}\n",
+        "second/.README.source.md": "# Second\n{% embed \"../.readme.source/.shared\" %}\n",
+        "alone/.README.source.md": "# Alone\n",
+    }
+
+    def test_is_current(self):
+        with temporary_repository(self.FILES) as _root:
+            # The manifest is kept per branch, which does not exist until the first commit.
+            git(_root, "add", "-A")
+            git(_root, "commit", "-q", "-m", "Sources")
+
+            RepositoryDirectory(_root).compile()
+            git(_root, "commit", "-q", "-m", "Compiled")
+
+            write(_root, { ".readme.source/.shared": "Changed fragment.\n" })
+
+            _manifest = RepositoryDirectory(_root).build_manifest()
+
+            self.assertFalse(_manifest.is_current(os.path.join(_root, "first", ".README.source.md")))
+            self.assertFalse(_manifest.is_current(os.path.join(_root, "second", ".README.source.md")))
+            self.assertTrue(_manifest.is_current(os.path.join(_root, "alone", ".README.source.md")))
+
+    def test_parallel_staging(self):
+        with temporary_repository(self.FILES) as _root:
+            # The manifest is kept per branch, which does not exist until the first commit.
+            git(_root, "add", "-A")
+            git(_root, "commit", "-q", "-m", "Sources")
+
+            RepositoryDirectory(_root).compile()
+            git(_root, "commit", "-q", "-m", "Compiled")
+
+            write(_root, { ".readme.source/.footer": "Changed footer.\n" })
+
+            self.assertTrue(RepositoryDirectory(_root).compile(jobs=2))
+
+            # Every worker saved the footer, but only the first one found it changed.
+            self.assertEqual(
+                set(git(_root, "diff", "--cached", "--name-only").split()),
+                {
+                    ".readme.source/.footer",
+                    ".readme/.footer",
+                    "alone/README.md",
+                    "first/README.md",
+                    "second/README.md",
+                },
+            )
+
+    def test_recompile_same_instance(self):
+        with temporary_repository(self.FILES) as _root:
+            git(_root, "add", "-A")
+            git(_root, "commit", "-q", "-m", "Sources")
+
+            # As the daemon does: the same instance compiles again after a rendered file was deleted.
+            _repository = RepositoryDirectory(_root)
+            _repository.compile()
+
+            for _incremental in (True, False):
+                os.unlink(os.path.join(_root, "alone", "README.md"))
+
+                self.assertTrue(_repository.compile(incremental=_incremental))
+                self.assertTrue(os.path.exists(os.path.join(_root, "alone", "README.md")))
+
+    def test_conclude_merged(self):
+        with temporary_repository(self.FILES) as _root:
+            _repository = RepositoryDirectory(_root)
+            _source = os.path.join(_root, ".readme.source", ".footer")
+            _rendered = os.path.join(_root, ".readme", ".footer")
+
+            write(_root, { ".readme/.footer": "Footer of every README.\n" })
+
+            # The worker that got there second reported it unchanged, and came back first.
+            _repository.conclude(
+                RenderResult(path=_source, rendered_path=_rendered, changed=False),
+                RenderResult(path=_source, rendered_path=_rendered, changed=True),
+            )
+
+            self.assertEqual(
+                set(git(_root, "diff", "--cached", "--name-only").split()),
+                { ".readme.source/.footer", ".readme/.footer" },
+            )
+
+    def test_unique_results(self):
+        _first = RenderResult(path="/a", rendered_path="/b", changed=True, dependencies=["/x"])
+        _second = RenderResult(path="/a", rendered_path="/b", changed=False, dependencies=["/y"])
+        _failed = RenderResult(path="/c", rendered_path="/d", error="OSError occured")
+        _retried = RenderResult(path="/c", rendered_path="/d", changed=False)
+
+        _unique = unique_results([_second, _failed, _first, _retried])
+
+        self.assertEqual([ _result.key for _result in _unique ], [_second.key, _failed.key])
+
+        self.assertIs(_unique[0].changed, True)
+        self.assertTrue(_unique[0].stageable)
+        self.assertEqual(_unique[0].dependencies, ["/x", "/y"])
+
+        self.assertTrue(_unique[1].saved)
+        self.assertIs(_unique[1].changed, False)
+
+        # The results given are left alone.
+        self.assertIs(_second.changed, False)
+
+if __name__ == "__main__":
+    unittest.main()
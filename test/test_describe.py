@@ -0,0 +1,471 @@
+import contextlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from typing import Any, List, Optional
+
+import readme_compiler
+import readme_compiler.settings as settings
+from readme_compiler import dependencies
+from readme_compiler.describe import exceptions, metadatastore, ownership, registry, sourcemap, static
+from readme_compiler.describe import object as object_module
+
+TEST_REPO_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_repo", "src")
+
+@contextlib.contextmanager
+def temporary_modules(files, *, newline=None):
+    """
+    Write `files`, a `dict` of their paths relative to a temporary directory and their sources, and put the directory on `sys.path`;
+    any modules imported from it are unloaded afterwards.
+    """
+    with tempfile.TemporaryDirectory() as _directory:
+        for _path, _source in files.items():
+            os.makedirs(os.path.dirname(os.path.join(_directory, _path)), exist_ok=True)
+
+            with open(os.path.join(_directory, _path), "w", newline=newline) as _f:
+                _f.write(_source)
+
+        sys.path.insert(0, _directory)
+        importlib.invalidate_caches()
+
+        try:
+            yield _directory
+        finally:
+            sys.path.remove(_directory)
+
+            for _name, _module in list(sys.modules.items()):
+                if ((getattr(_module, "__file__", None) or "").startswith(_directory + os.sep)):
+                    del sys.modules[_name]
+
+@contextlib.contextmanager
+def temporary_module(name, source, *, newline=None):
+    """
+    Import `source` as the module `name` from a temporary directory, and unload it afterwards.
+    """
+    with temporary_modules({ f"{name}.py": source }, newline=newline):
+        yield importlib.import_module(name)
+
+def outline(description, *, depth=0):
+    """
+    The fields of a description, and of its children, as text.
+    """
+    _lines = []
+
+    for _field in ("qualname", "doc", "comments", "kind_description", "path", "source"):
+        _lines.append(f"{'  '*depth}{_field}={repr(getattr(description, _field))}")
+
+    for _key in ("modules_descriptions", "classes_descriptions", "functions_descriptions", "attributes_descriptions", "methods_descriptions"):
+        try:
+            _children = getattr(description, _key)
+        except (AttributeError, ) as e:
+            continue
+
+        for _child in sorted(_children, key=lambda child: child.name):
+            _lines.append(f"{'  '*depth}{_key}: {_child.name}")
+
+            if (_key in ("functions_descriptions", "methods_descriptions")):
+                for _field in ("signature_source_code", "raises", "kind_description", "doc", "comments"):
+                    _lines.append(f"{'  '*depth}  {_field}={repr(getattr(_child, _field))}")
+            elif (_key == "attributes_descriptions"):
+                for _field in ("annotation_markdown", "kind_description"):
+                    _lines.append(f"{'  '*depth}  {_field}={repr(getattr(_child, _field))}")
+            elif (depth < 2):
+                _lines += outline(_child, depth=depth+1)
+
+    return _lines
+
+class TestStaticDescribe(unittest.TestCase):
+    """
+    The static backend must describe a package the same as the import backend does, without importing it.
+    """
+
+    def setUp(self):
+        sys.path.insert(0, TEST_REPO_SOURCE)
+        static.LOADER.clear()
+
+    def tearDown(self):
+        sys.path.remove(TEST_REPO_SOURCE)
+        static.LOADER.clear()
+
+    def test_same_as_import(self):
+        # Defaults of `json` are computed at runtime, e.g. `WHITESPACE.match`, which the static backend shows as written.
+        for _name, _skipped in (("test_repo", None), ("json", "signature_source_code="), ("argparse", None)):
+            _imported = readme_compiler.describe(importlib.import_module(_name), metadata={})
+            _static = readme_compiler.describe(static.get_object(None, _name), metadata={})
+
+            self.assertIsInstance(_static, readme_compiler.describe.module)
+            self.assertEqual(
+                [ _line for _line in outline(_static) if (not _skipped or _skipped not in _line) ],
+                [ _line for _line in outline(_imported) if (not _skipped or _skipped not in _line) ],
+                msg=f"Static description of {_name} differs",
+            )
+
+    def test_not_imported(self):
+        with temporary_modules({
+            "explosive/__init__.py": textwrap.dedent('''
+                """Must not be imported."""
+                import abc
+                from typing import List
+
+                from .parts import Part
+
+                raise RuntimeError("imported")
+
+                # Assembles parts
+                class Machine(Part):
+                    parts: List[Part] = []
+
+                    @abc.abstractmethod
+                    def run(self, speed: int = 3, *, parts: "List[Part]" = None) -> Part:
+                        """Run it."""
+                        raise NotImplementedError()
+
+                    @property
+                    def weight(self) -> float:
+                        return 1.0
+            '''),
+            "explosive/parts.py": "import abc\n\nclass Part(abc.ABC):\n    def fit(self):\n        '''Fit it.'''\n",
+        }) as _directory:
+            _loader = static.StaticLoader(path=[_directory])
+            _module = _loader.load("explosive")
+
+            self.assertNotIn("explosive", sys.modules)
+
+            _description = readme_compiler.describe(_module.Machine, metadata={})
+            self.assertEqual(_description.qualname, "explosive.Machine")
+            self.assertEqual(_description.comments, "# Assembles parts\n")
+            self.assertEqual(_description.kind_description, "Abstract Base Class")
+
+            _methods = { _method.name:_method for _method in _description.methods_descriptions }
+            self.assertEqual(
+                _methods["run"].signature_source_code,
+                'def explosive.Machine(...).run(\n    speed: int = 3,\n    *,\n    parts: "List[Part]" = None\n) -> (\n    explosive.parts.Part\n)',
+            )
+            self.assertEqual(_methods["run"].raises, ["NotImplementedError"])
+            self.assertEqual(_methods["fit"].doc, "Fit it.")
+
+            _attributes = { _attribute.name:_attribute for _attribute in _description.attributes_descriptions }
+            self.assertEqual(_attributes["parts"].annotation_markdown, "`List`[ `explosive.parts.Part` ]")
+            self.assertEqual(_attributes["weight"].kind_description, "Read-only Property")
+
+            with self.assertRaises(exceptions.StaticObjectNotCallable):
+                _module.Machine.run(None)
+
+    def test_star_import(self):
+        with temporary_modules({
+            "starry/__init__.py":   "from .shapes import *\nfrom .colours import *\n",
+            "starry/shapes.py":     "__all__ = ['Circle']\n\nclass Circle():\n    pass\n\nclass Square():\n    pass\n",
+            "starry/colours.py":    "class Red():\n    pass\n\n_hidden = 1\n",
+        }) as _directory:
+            _module = static.StaticLoader(path=[_directory]).load("starry")
+
+            # `__all__` if there is one, all public names otherwise.
+            self.assertEqual(_module.Circle.__qualname__, "Circle")
+            self.assertEqual(_module.Red.__module__, "starry.colours")
+            self.assertFalse(hasattr(_module, "Square"))
+            self.assertFalse(hasattr(_module, "_hidden"))
+
+    def test_backend_setting(self):
+        self.assertIn(settings.DESCRIBE_BACKEND, ("import", "static"))
+
+        _repository = readme_compiler.RepositoryDirectory(os.path.dirname(TEST_REPO_SOURCE), describe_backend="static")
+
+        self.assertEqual(_repository.settings.describe_backend, "static")
+        self.assertIn("describe_backend='static'", repr(_repository))
+
+class TestMembers(unittest.TestCase):
+    """
+    Every member is retrieved once, however many views of the members are used.
+    """
+
+    def test_retrieved_once(self):
+        _retrieved = []
+
+        class Counted(type):
+            def __getattribute__(cls, name):
+                _retrieved.append(name)
+                return super().__getattribute__(name)
+
+        class Widget(metaclass=Counted):
+            size:int = 3
+            _hidden = 1
+
+            @property
+            def area(self) -> int:
+                return self.size ** 2
+
+            def grow(self):
+                pass
+
+        _description = readme_compiler.describe(Widget, metadata={})
+        _retrieved.clear()
+
+        _members = _description.members
+        self.assertEqual(_members["grow"].kind, "function")
+        self.assertEqual(_members["size"].kind, "attribute")
+        self.assertTrue(_members["area"].isproperty)
+        self.assertTrue(_members["_hidden"].sunder)
+        self.assertTrue(_members["__init__"].dunder)
+
+        # Views of the table do not retrieve anything again.
+        _retrieved.clear()
+        self.assertEqual([ _function.__name__ for _function in _description.functions ], ["grow"])
+        self.assertEqual(list(_description.classes), [])
+        self.assertEqual(list(_description.modules), [])
+        self.assertFalse(set(_retrieved) & {"grow", "size", "area", "_hidden"})
+
+        self.assertEqual(
+            sorted(_attribute.name for _attribute in _description.attributes_descriptions),
+            ["area", "size"],
+        )
+        self.assertNotIn("grow", _retrieved)
+
+class TestOwnership(unittest.TestCase):
+    """
+    `ownership.getmodule` must agree with `inspect.getmodule`, and pick up modules imported after the index was built.
+    """
+
+    def test_same_as_inspect(self):
+        import inspect
+        import json.decoder
+
+        for _obj in (json, json.loads, json.decoder.JSONDecoder, json.loads.__code__, json.decoder.WHITESPACE, len, 3, None):
+            self.assertIs(ownership.getmodule(_obj), inspect.getmodule(_obj), msg=repr(_obj))
+
+    def test_new_modules(self):
+        ownership.INDEX.refresh()
+
+        with temporary_module("owned_later", "def owned():\n    pass\n") as owned_later:
+            self.assertIs(ownership.getmodule(owned_later.owned.__code__), owned_later)
+
+class TestTypeHints(unittest.TestCase):
+    """
+    Type hints are resolved once, in the namespace of the module that defines them.
+    """
+
+    def test_resolved_in_module(self):
+        with temporary_module("hinted", textwrap.dedent('''
+            from typing import List
+
+            class Part():
+                pass
+
+            class Machine():
+                main: "Part | None"
+                parts: "List[Part]" = []
+                broken: "Missing | None" = None
+        ''')) as hinted:
+            _hints = object_module.get_type_hints(hinted.Machine)
+            self.assertEqual(
+                _hints,
+                {
+                    "main":     Optional[hinted.Part],
+                    "parts":    List[hinted.Part],
+                    "broken":   Any,
+                },
+            )
+            self.assertIs(object_module.get_type_hints(hinted.Machine), _hints)
+            self.assertEqual(hinted.Machine.__annotations__["broken"], "Missing | None")
+
+class TestSourceMap(unittest.TestCase):
+    """
+    `sourcemap` must answer the same as `inspect`, reading each file only once.
+    """
+
+    def test_same_as_inspect(self):
+        import inspect
+
+        with temporary_module("mapped", textwrap.dedent('''
+            #!/usr/bin/env python
+            # Module comments
+            import functools
+
+            # Class comments
+            class Mapped():
+                # Method comments
+                @functools.lru_cache()
+                def cached(self, value):
+                    if (value):
+                        raise ValueError("No value")
+                    # Indented trailing comments are included
+                # ...but these are not
+
+                class Inner():
+                    def method(self): raise KeyError(  "one-liner")
+
+            add = lambda a, b: a + b
+        ''').lstrip(), newline="\r\n") as mapped:
+            for _obj in (mapped, mapped.Mapped, mapped.Mapped.cached, mapped.Mapped.Inner, mapped.Mapped.Inner.method, mapped.add):
+                self.assertEqual(sourcemap.getsource(_obj), inspect.getsource(_obj), msg=repr(_obj))
+                self.assertEqual(sourcemap.getcomments(_obj), inspect.getcomments(_obj), msg=repr(_obj))
+
+            self.assertEqual(sourcemap.getraises(mapped.Mapped.cached), ["ValueError"])
+            self.assertEqual(sourcemap.getraises(mapped.Mapped.Inner.method), ["KeyError"])
+            self.assertIs(sourcemap.get(mapped.__file__), sourcemap.get(mapped.__file__))
+
+class TestRegistry(unittest.TestCase):
+    """
+    Each object is described once, unless it is given metadata of its own.
+    """
+
+    def setUp(self):
+        registry.clear()
+
+    def test_shared(self):
+        class Base():
+            def shared(self):
+                pass
+
+        class Derived(Base):
+            pass
+
+        _base = readme_compiler.describe(Base)
+        self.assertIs(readme_compiler.describe(Base), _base)
+        self.assertIsNot(readme_compiler.describe(Base, metadata={"doc": "Changed"}), _base)
+        self.assertIs(_base.type_description, readme_compiler.describe(Derived).type_description)
+
+        # Inherited methods are described once.
+        self.assertIs(
+            readme_compiler.describe(Derived).methods_descriptions[0],
+            _base.methods_descriptions[0],
+        )
+
+        # Other renders share them too, and depend on what they had recorded.
+        with dependencies.DependencyRecorder() as _recorder:
+            self.assertIs(readme_compiler.describe(Base), _base)
+
+        self.assertIn(os.path.abspath(__file__), _recorder.files)
+
+    def test_metadata_override(self):
+        class Described():
+            def method(self):
+                """Original."""
+
+        _method = readme_compiler.describe(Described).methods_descriptions[0]
+        self.assertEqual(_method.doc, "Original.")
+
+        _overridden = readme_compiler.describe(
+            Described,
+            metadata={"methods_descriptions": {"method": {"doc": "Overridden."}}},
+        )
+
+        self.assertEqual(_overridden.methods_descriptions[0].doc, "Overridden.")
+        self.assertEqual(_method.doc, "Original.")
+
+class TestSchema(unittest.TestCase):
+    """
+    The fields of each description class are found once, and can be exported selectively.
+    """
+
+    def test_fields(self):
+        _schema = readme_compiler.describe.type.schema
+
+        self.assertIn("methods_descriptions", _schema)
+        self.assertTrue(_schema["doc"].metadata_override)
+        self.assertFalse(_schema["source"].metadata_override)
+        self.assertNotIn("methods_descriptions", readme_compiler.describe.module.schema)
+        self.assertEqual(list(_schema), sorted(_schema))
+
+        _description = readme_compiler.describe(TestSchema, metadata={})
+        self.assertEqual(
+            _description.to_dict(["qualname", "doc"]),
+            {"qualname": _description.qualname, "doc": _description.doc},
+        )
+
+        self.assertNotIn("source", _description.to_dict(exclude=["source"]))
+        self.assertNotIn("source", vars(_description))
+
+        self.assertEqual(list(_description.to_export_dict(["doc", "source"])), ["doc"])
+
+        with self.assertRaises(exceptions.AttributeNotApplicable):
+            _description.to_dict(["missing"])
+
+class TestMetadataStore(unittest.TestCase):
+    """
+    Only the sidecars listed in their directories are opened; a consolidated file can stand in for them.
+    """
+
+    def setUp(self):
+        self._consolidated = settings.README_METADATA_CONSOLIDATED
+
+    def tearDown(self):
+        settings.README_METADATA_CONSOLIDATED = self._consolidated
+
+    def test_sidecars(self):
+        with tempfile.TemporaryDirectory() as _directory:
+            _sidecar = os.path.join(_directory, "cls.listed.Listed.metadata.json")
+
+            with open(_sidecar, "w") as _f:
+                json.dump({"doc": "Listed."}, _f)
+
+            _store = metadatastore.MetadataStore()
+            self.assertEqual(_store.load(_sidecar), {"doc": "Listed."})
+            self.assertIsNone(_store.load(os.path.join(_directory, "cls.listed.Missing.metadata.json")))
+            self.assertEqual((_store.opened, _store.skipped), (1, 1))
+
+            # Not listed when the directory was; picked up once cleared.
+            _added = os.path.join(_directory, "cls.listed.Added.metadata.json")
+            with open(_added, "w") as _f:
+                json.dump({"doc": "Added."}, _f)
+
+            self.assertIsNone(_store.load(_added))
+            _store.clear()
+            self.assertEqual(_store.load(_added), {"doc": "Added."})
+
+    def test_consolidated(self):
+        settings.README_METADATA_CONSOLIDATED = ".metadata.json"
+
+        with tempfile.TemporaryDirectory() as _directory:
+            for _name, _doc in (("Kept", "Kept."), ("Moved", "Moved.")):
+                with open(os.path.join(_directory, f"cls.listed.{_name}.metadata.json"), "w") as _f:
+                    json.dump({"doc": _doc}, _f)
+
+            _path = metadatastore.MetadataStore().consolidate(_directory)
+            self.assertEqual(_path, os.path.join(os.path.abspath(_directory), ".metadata.json"))
+
+            os.remove(os.path.join(_directory, "cls.listed.Moved.metadata.json"))
+            with open(os.path.join(_directory, "cls.listed.Kept.metadata.json"), "w") as _f:
+                json.dump({"doc": "Changed."}, _f)
+
+            _store = metadatastore.MetadataStore()
+            with dependencies.DependencyRecorder() as _recorder:
+                self.assertEqual(_store.load(os.path.join(_directory, "cls.listed.Moved.metadata.json")), {"doc": "Moved."})
+
+            self.assertIn(_path, _recorder.files)
+
+            # Sidecars take precedence.
+            self.assertEqual(_store.load(os.path.join(_directory, "cls.listed.Kept.metadata.json")), {"doc": "Changed."})
+
+class TestDependencies(unittest.TestCase):
+    """
+    Describing an object records the source files of everything it touches, including base classes in other modules.
+    """
+
+    def setUp(self):
+        registry.clear()
+
+    def test_base_classes(self):
+        with temporary_modules({
+            "depended_base.py":     "class Base():\n    def inherited(self):\n        pass\n",
+            "depended_derived.py":  "from depended_base import Base\n\nclass Derived(Base):\n    pass\n",
+        }) as _directory:
+            import depended_derived
+
+            with dependencies.DependencyRecorder() as _recorder:
+                readme_compiler.describe(depended_derived.Derived).methods_descriptions
+
+            self.assertIn(os.path.join(_directory, "depended_derived.py"), _recorder.files)
+            self.assertIn(os.path.join(_directory, "depended_base.py"), _recorder.files)
+
+            # A later render reusing the cached descriptions depends on exactly the same files.
+            with dependencies.DependencyRecorder() as _reused:
+                readme_compiler.describe(depended_derived.Derived).methods_descriptions
+
+            self.assertEqual(_reused.files, _recorder.files)
+
+if __name__ == "__main__":
+    unittest.main()
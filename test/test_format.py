@@ -1,6 +1,20 @@
+import collections
+import importlib
+import inspect
+import json
+import os
+import re
+import subprocess
+import tempfile
 import unittest
+import unittest.mock
+
+import black
 
 import readme_compiler.format as format
+import readme_compiler.settings as settings
+from readme_compiler.classes.formatcache import FormatCache
+from readme_compiler.describe import function
 
 class TestFormat(unittest.TestCase):
     
@@ -22,7 +36,231 @@ class TestFormat(unittest.TestCase):
             ),
             _tests,
         ))
-        
+
+
+class TestFormatSignature(unittest.TestCase):
+    """
+    `format_signature()` must return exactly what `format_source_code()` does for the same stub.
+    """
+
+    def setUp(self):
+        # Compare the formatters themselves, not what they had cached.
+        self._cache_size, settings.FORMAT_CACHE_SIZE = settings.FORMAT_CACHE_SIZE, 0
+        format.format_cache.cache_clear()
+        format.format_signature.cache_clear()
+
+    def tearDown(self):
+        settings.FORMAT_CACHE_SIZE = self._cache_size
+        format.format_cache.cache_clear()
+        format.format_signature.cache_clear()
+
+    CORPUS = (
+        json.dumps,
+        json.loads,
+        os.path.join,
+        os.walk,
+        re.sub,
+        subprocess.run,
+        subprocess.Popen.__init__,
+        collections.namedtuple,
+        inspect.signature,
+        unittest.TestCase.assertEqual,
+        format.format_source_code,
+        format.split_title,
+    )
+
+    STUBS = (
+        "def f(): __VOID_FUNCTION__()",
+        "def f(a, /, b: int = 1, *args, c: str = 'x', **kwargs) -> None: __VOID_FUNCTION__()",
+        "def f(a: typing.Dict[str, typing.List[typing.Tuple[int, ...]]] = {'key': [(1, 2, 3)]}) -> typing.Optional[str]: __VOID_FUNCTION__()",
+        "def f(a=<object object at 0x7f0000000000>): __VOID_FUNCTION__()",    # Not valid Python, left as is
+    )
+
+    def assertSameAsBlack(self, stub:str):
+        self.assertEqual(
+            format.format_signature(stub),
+            format.format_source_code(stub),
+            msg=f"Formatting differs for {repr(stub)}",
+        )
+
+    def test_stubs(self):
+        for _stub in self.STUBS:
+            self.assertSameAsBlack(_stub)
+
+    def test_corpus(self):
+        for _func in self.CORPUS:
+            self.assertSameAsBlack(
+                f"def {_func.__name__}{function.signature(_func, remove_self_cls=True)}: __VOID_FUNCTION__()"
+            )
+
+    def test_memoized(self):
+        _stub = "def memoized(a, b=2, *, c=3): __VOID_FUNCTION__()"
+        format.format_signature(_stub)
+        _hits = format.format_signature.cache_info().hits
+
+        self.assertEqual(format.format_signature(_stub), format.format_source_code(_stub))
+        self.assertEqual(format.format_signature.cache_info().hits, _hits + 1)
+
+
+class TestNativeSignature(unittest.TestCase):
+    """
+    `function.render_signature_stub()` must lay out signatures exactly as `black` does, or not at all.
+    """
+
+    MODULES = (
+        "argparse",
+        "asyncio",
+        "collections",
+        "email.message",
+        "inspect",
+        "json",
+        "logging",
+        "os",
+        "pathlib",
+        "subprocess",
+        "typing",
+    )
+
+    def setUp(self):
+        self._settings = (settings.FORMAT_CACHE_SIZE, settings.SIGNATURE_RENDERER)
+        settings.FORMAT_CACHE_SIZE = 0
+        format.format_cache.cache_clear()
+
+    def tearDown(self):
+        settings.FORMAT_CACHE_SIZE, settings.SIGNATURE_RENDERER = self._settings
+        format.format_cache.cache_clear()
+
+    @classmethod
+    def corpus(cls):
+        for _name in cls.MODULES:
+            _module = importlib.import_module(_name)
+
+            for _obj in list(vars(_module).values()):
+                for _callable in [_obj] + (list(vars(_obj).values()) if (isinstance(_obj, type)) else []):
+                    if (callable(_callable) and isinstance(getattr(_callable, "__name__", None), str)):
+                        try:
+                            yield _callable.__name__, function.signature(_callable, remove_self_cls=True)
+                        except (ValueError, TypeError) as e:
+                            pass
+
+    def test_corpus(self):
+        _native = _total = 0
+
+        for _name, _signature in self.corpus():
+            _total += 1
+
+            if ((_rendered := function.render_signature_stub(_name, _signature)) is not None):
+                _native += 1
+
+                self.assertEqual(
+                    _rendered,
+                    format.format_source_code(f"def {_name}{_signature}: __VOID_FUNCTION__()"),
+                    msg=f"Native layout differs for def {_name}{_signature}",
+                )
+
+        # Most signatures should not need black at all.
+        self.assertGreater(_native, _total * 0.8)
+
+    def test_not_native(self):
+        def resize(size=(640, 480)):
+            pass
+
+        def shift(offset=(1+2j)):
+            pass
+
+        for _obj in (resize, shift):
+            _signature = function.signature(_obj, remove_self_cls=True)
+            _expected = format.format_source_code(f"def {_obj.__name__}{_signature}: __VOID_FUNCTION__()")
+
+            # Neither fits on a line; a lone parameter with commas inside its brackets, and binary operators, are left to black.
+            self.assertIsNone(function.render_signature_stub(_obj.__name__, _signature))
+
+            settings.SIGNATURE_RENDERER = "native"
+            self.assertEqual(function.format_signature_stub(_obj), _expected)
+
+    def test_signature_source_code(self):
+        for _obj in (
+            subprocess.Popen.__init__,
+            json.JSONDecoder.decode,
+            os.makedirs,
+            format.format_source_code,
+        ):
+            settings.SIGNATURE_RENDERER = "black"
+            _expected = function.signature_source_code(_obj)
+
+            settings.SIGNATURE_RENDERER = "native"
+            self.assertEqual(function.signature_source_code(_obj), _expected)
+
+        # __init__ is shown as the class, without `-> None`.
+        _init = function.signature_source_code(subprocess.Popen.__init__)
+        self.assertTrue(_init.startswith("Popen(\n"))
+        self.assertNotIn("-> None", _init)
+
+
+class TestFormatCache(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._settings = (settings.FORMAT_CACHE_LOCATION, settings.FORMAT_CACHE_SIZE)
+
+        settings.FORMAT_CACHE_LOCATION = self._directory.name
+        settings.FORMAT_CACHE_SIZE = 1024 * 1024
+        format.format_cache.cache_clear()
+        format.format_signature.cache_clear()
+
+    def tearDown(self):
+        settings.FORMAT_CACHE_LOCATION, settings.FORMAT_CACHE_SIZE = self._settings
+        format.format_cache.cache_clear()
+        format.format_signature.cache_clear()
+        self._directory.cleanup()
+
+    def test_warm(self):
+        _source = "x = {  'a':37,'b':42,\n'c':927}"
+        _expected = format.format_source_code(_source)
+
+        with unittest.mock.patch.object(black, "reformat_code", side_effect=AssertionError("black called")):
+            self.assertEqual(format.format_source_code(_source), _expected)
+
+        _stub = "def warm(a, b=1, *, c=2): __VOID_FUNCTION__()"
+        _expected = format.format_signature(_stub)
+        format.format_signature.cache_clear()
+
+        with unittest.mock.patch.object(black, "format_str", side_effect=AssertionError("black called")):
+            self.assertEqual(format.format_signature(_stub), _expected)
+
+    def test_key(self):
+        _source = "def f(a,b): pass"
+
+        self.assertNotEqual(
+            format.format_cache_key(_source, write_back=black.WriteBack.YES, mode=black.FileMode(line_length=20)),
+            format.format_cache_key(_source, write_back=black.WriteBack.YES, mode=black.FileMode(line_length=88)),
+        )
+        self.assertNotEqual(
+            format.format_cache_key(_source, write_back=black.WriteBack.YES, mode=black.FileMode()),
+            format.format_cache_key(_source + " ", write_back=black.WriteBack.YES, mode=black.FileMode()),
+        )
+
+    def test_evict(self):
+        _cache = FormatCache(self._directory.name, maxsize=1000)
+
+        for _index in range(10):
+            _key = FormatCache.key(str(_index))
+            _cache.set(_key, "x" * 200)
+            os.utime(_cache.path(_key), (_index, _index))
+
+        self.assertEqual(_cache.evict(), 5)
+        self.assertLessEqual(_cache.size(), 1000)
+
+        # The least recently used had been evicted.
+        self.assertIsNone(_cache.get(FormatCache.key("0")))
+        self.assertEqual(_cache.get(FormatCache.key("9")), "x" * 200)
+
+    def test_clear(self):
+        format.format_source_code("y=1")
+        self.assertTrue(format.format_cache().entries())
+
+        format.clear_cache()
+        self.assertFalse(format.format_cache().entries())
 
 
 if __name__=="__main__":